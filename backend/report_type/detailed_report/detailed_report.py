@@ -1,8 +1,11 @@
 import asyncio
-from typing import List, Dict, Set, Optional, Any
+from typing import List, Dict, Set, Optional, Any, Awaitable
 from fastapi import WebSocket
 
 from gpt_researcher import GPTResearcher
+from gpt_researcher.config import Config
+from gpt_researcher.utils.checkpoint import digest, get_checkpoint_store
+from gpt_researcher.utils.enum import Tone
 
 
 class DetailedReport:
@@ -22,6 +25,7 @@ class DetailedReport:
         complement_source_urls: bool = False,
         mcp_configs=None,
         mcp_strategy=None,
+        run_id: Optional[str] = None,
     ):
         self.query = query
         self.report_type = report_type
@@ -57,18 +61,59 @@ class DetailedReport:
         if mcp_strategy is not None:
             gpt_researcher_params["mcp_strategy"] = mcp_strategy
             
-        self.gpt_researcher = GPTResearcher(**gpt_researcher_params)
+        self.gpt_researcher = GPTResearcher(**gpt_researcher_params, run_id=run_id)
+        # The detailed report is checkpointed under its main researcher's run id
+        self.run_id = self.gpt_researcher.run_id
+        self.checkpoint = self.gpt_researcher.checkpoint
+        self.checkpoint.register("detailed_report", {
+            "query": self.query,
+            "report_type": self.report_type,
+            "report_source": self.report_source,
+            "source_urls": self.source_urls,
+            "document_urls": self.document_urls,
+            "query_domains": self.query_domains,
+            "config_path": self.config_path,
+            "tone": self.tone.name if isinstance(self.tone, Tone) else self.tone,
+            "subtopics": self.subtopics,
+            "complement_source_urls": self.complement_source_urls,
+            "mcp_strategy": mcp_strategy,
+        }, replace=True)
         self.existing_headers: List[Dict] = []
         self.global_context: List[str] = []
         self.global_written_sections: List[str] = []
         self.global_urls: Set[str] = set(
             self.source_urls) if self.source_urls else set()
 
+    @classmethod
+    def resume(cls, run_id: str, config_path: str = None, **kwargs) -> "DetailedReport":
+        """
+        A detailed report for a checkpointed run, started with the run's original
+        arguments. ``run`` on it skips the research, subtopics and sections the
+        run already completed. Keyword arguments override the stored arguments.
+        """
+        store = get_checkpoint_store(Config(config_path).checkpoint_path)
+        run = store.get_run(run_id)
+        if run is None or run["kind"] != "detailed_report":
+            raise ValueError(f"No checkpointed detailed report with id '{run_id}'")
+        params = run["params"]
+        if params["tone"] in Tone.__members__:
+            params["tone"] = Tone[params["tone"]]
+        params.update(kwargs)
+        if config_path is not None:
+            params["config_path"] = config_path
+        return cls(run_id=run_id, **params)
+
     async def run(self) -> str:
         await self._initial_research()
         subtopics = await self._get_all_subtopics()
-        report_introduction = await self.gpt_researcher.write_introduction()
-        _, report_body = await self._generate_subtopic_reports(subtopics)
+        # The introduction only needs the initial research, so it is written while subtopics are
+        # researched; it streams to completion before any subtopic report starts streaming
+        introduction = asyncio.create_task(self.gpt_researcher.write_introduction())
+        try:
+            _, report_body = await self._generate_subtopic_reports(subtopics, before_writing=introduction)
+        finally:
+            introduction.cancel()
+        report_introduction = introduction.result()
         self.gpt_researcher.visited_urls.update(self.global_urls)
         report = await self._construct_detailed_report(report_introduction, report_body)
         return report
@@ -79,6 +124,9 @@ class DetailedReport:
         self.global_urls = self.gpt_researcher.visited_urls
 
     async def _get_all_subtopics(self) -> List[Dict]:
+        if (all_subtopics := self.checkpoint.get("subtopics")) is not None:
+            return all_subtopics
+
         subtopics_data = await self.gpt_researcher.get_subtopics()
 
         all_subtopics = []
@@ -88,22 +136,51 @@ class DetailedReport:
         else:
             print(f"Unexpected subtopics data format: {subtopics_data}")
 
+        self.checkpoint.put("subtopics", all_subtopics)
         return all_subtopics
 
-    async def _generate_subtopic_reports(self, subtopics: List[Dict]) -> tuple:
+    async def _generate_subtopic_reports(
+        self, subtopics: List[Dict], before_writing: Optional[Awaitable[Any]] = None
+    ) -> tuple:
+        """
+        Researches up to ``SUBTOPIC_CONCURRENCY`` subtopics at a time while
+        writing their reports one by one in subtopic order, so each report still
+        sees the headers and sections written before it. No report is written
+        before ``before_writing`` completes, so streamed reports never interleave.
+        """
         subtopic_reports = []
         subtopics_report_body = ""
 
-        for subtopic in subtopics:
-            result = await self._get_subtopic_report(subtopic)
-            if result["report"]:
-                subtopic_reports.append(result)
-                subtopics_report_body += f"\n\n\n{result['report']}"
+        semaphore = asyncio.Semaphore(max(1, self.gpt_researcher.cfg.subtopic_concurrency))
+
+        async def research(subtopic: Dict) -> Optional[Dict[str, Any]]:
+            async with semaphore:
+                return await self._research_subtopic(subtopic)
+
+        research_tasks = [asyncio.create_task(research(subtopic)) for subtopic in subtopics]
+        try:
+            if before_writing is not None:
+                await before_writing
+            for subtopic, research_task in zip(subtopics, research_tasks):
+                result = await self._get_subtopic_report(subtopic, research_task)
+                if result["report"]:
+                    subtopic_reports.append(result)
+                    subtopics_report_body += f"\n\n\n{result['report']}"
+        finally:
+            for research_task in research_tasks:
+                research_task.cancel()
 
         return subtopic_reports, subtopics_report_body
 
-    async def _get_subtopic_report(self, subtopic: Dict) -> Dict[str, str]:
+    async def _research_subtopic(self, subtopic: Dict) -> Optional[Dict[str, Any]]:
+        """
+        Conducts the research of a subtopic and drafts its section titles.
+        Returns None if the subtopic's report is already checkpointed.
+        """
         current_subtopic_task = subtopic.get("task")
+        if self.checkpoint.get(f"subtopic:{digest(current_subtopic_task)}") is not None:
+            return None
+
         subtopic_assistant = GPTResearcher(
             query=current_subtopic_task,
             query_domains=self.query_domains,
@@ -113,12 +190,14 @@ class DetailedReport:
             headers=self.headers,
             parent_query=self.query,
             subtopics=self.subtopics,
-            visited_urls=self.global_urls,
+            # A copy: subtopics researching concurrently must not clear each other's visited URLs
+            visited_urls=set(self.global_urls),
             agent=self.gpt_researcher.agent,
             role=self.gpt_researcher.role,
             tone=self.tone,
             complement_source_urls=self.complement_source_urls,
-            source_urls=self.source_urls
+            source_urls=self.source_urls,
+            run_id=self.checkpoint.child(f"subtopic-{digest(current_subtopic_task)}"),
         )
 
         subtopic_assistant.context = list(set(self.global_context))
@@ -133,23 +212,49 @@ class DetailedReport:
         parse_draft_section_titles_text = [header.get(
             "text", "") for header in parse_draft_section_titles]
 
+        return {"assistant": subtopic_assistant, "draft_section_titles": parse_draft_section_titles_text}
+
+    async def _get_subtopic_report(
+        self, subtopic: Dict, research: Optional[Awaitable[Optional[Dict[str, Any]]]] = None
+    ) -> Dict[str, str]:
+        current_subtopic_task = subtopic.get("task")
+        stage = f"subtopic:{digest(current_subtopic_task)}"
+        if (written := self.checkpoint.get(stage)) is not None:
+            self._apply_subtopic_report(current_subtopic_task, written)
+            return {"topic": subtopic, "report": written["report"]}
+
+        researched = await (research if research is not None else self._research_subtopic(subtopic))
+        subtopic_assistant = researched["assistant"]
+
         relevant_contents = await subtopic_assistant.get_similar_written_contents_by_draft_section_titles(
-            current_subtopic_task, parse_draft_section_titles_text, self.global_written_sections
+            current_subtopic_task, researched["draft_section_titles"], self.global_written_sections
         )
 
         subtopic_report = await subtopic_assistant.write_report(self.existing_headers, relevant_contents)
 
-        self.global_written_sections.extend(self.gpt_researcher.extract_sections(subtopic_report))
-        self.global_context = list(set(subtopic_assistant.context))
-        self.global_urls.update(subtopic_assistant.visited_urls)
-
-        self.existing_headers.append({
-            "subtopic task": current_subtopic_task,
+        written = {
+            "report": subtopic_report,
+            "sections": self.gpt_researcher.extract_sections(subtopic_report),
             "headers": self.gpt_researcher.extract_headers(subtopic_report),
-        })
+            "context": list(set(subtopic_assistant.context)),
+            "visited_urls": list(subtopic_assistant.visited_urls),
+        }
+        self.checkpoint.put(stage, written)
+        self._apply_subtopic_report(current_subtopic_task, written)
 
         return {"topic": subtopic, "report": subtopic_report}
 
+    def _apply_subtopic_report(self, subtopic_task: str, written: Dict[str, Any]) -> None:
+        """Adds a written subtopic report to the sections, context and sources shared by later subtopics."""
+        self.global_written_sections.extend(written["sections"])
+        self.global_context = written["context"]
+        self.global_urls.update(written["visited_urls"])
+
+        self.existing_headers.append({
+            "subtopic task": subtopic_task,
+            "headers": written["headers"],
+        })
+
     async def _construct_detailed_report(self, introduction: str, report_body: str) -> str:
         toc = self.gpt_researcher.table_of_contents(report_body)
         conclusion = await self.gpt_researcher.write_report_conclusion(report_body)
@@ -7,6 +7,7 @@ from fastapi import WebSocket
 from backend.report_type import BasicReport, DetailedReport
 from backend.chat import ChatAgentWithMemory
 
+from gpt_researcher import ResearchSession
 from gpt_researcher.utils.enum import ReportType, Tone
 from multi_agents.main import run_research_task
 from gpt_researcher.actions import stream_output  # Import stream_output
@@ -121,50 +122,52 @@ async def run_agent(task, report_type, report_source, source_urls, document_urls
             "output": f"🔧 MCP enabled with strategy '{mcp_strategy}' and {len(mcp_configs)} server(s)"
         })
 
-    # Initialize researcher based on report type
-    if report_type == "multi_agents":
-        report = await run_research_task(
-            query=task, 
-            websocket=logs_handler,  # Use logs_handler instead of raw websocket
-            stream_output=stream_output, 
-            tone=tone, 
-            headers=headers
-        )
-        report = report.get("report", "")
-
-    elif report_type == ReportType.DetailedReport.value:
-        researcher = DetailedReport(
-            query=task,
-            query_domains=query_domains,
-            report_type=report_type,
-            report_source=report_source,
-            source_urls=source_urls,
-            document_urls=document_urls,
-            tone=tone,
-            config_path=config_path,
-            websocket=logs_handler,  # Use logs_handler instead of raw websocket
-            headers=headers,
-            mcp_configs=mcp_configs if mcp_enabled else None,
-            mcp_strategy=mcp_strategy if mcp_enabled else None,
-        )
-        report = await researcher.run()
+    # Researchers of this request (subtopics, deep research, agents) share one session's pools and clients
+    async with ResearchSession(config_path or None):
+        # Initialize researcher based on report type
+        if report_type == "multi_agents":
+            report = await run_research_task(
+                query=task, 
+                websocket=logs_handler,  # Use logs_handler instead of raw websocket
+                stream_output=stream_output, 
+                tone=tone, 
+                headers=headers
+            )
+            report = report.get("report", "")
+
+        elif report_type == ReportType.DetailedReport.value:
+            researcher = DetailedReport(
+                query=task,
+                query_domains=query_domains,
+                report_type=report_type,
+                report_source=report_source,
+                source_urls=source_urls,
+                document_urls=document_urls,
+                tone=tone,
+                config_path=config_path,
+                websocket=logs_handler,  # Use logs_handler instead of raw websocket
+                headers=headers,
+                mcp_configs=mcp_configs if mcp_enabled else None,
+                mcp_strategy=mcp_strategy if mcp_enabled else None,
+            )
+            report = await researcher.run()
         
-    else:
-        researcher = BasicReport(
-            query=task,
-            query_domains=query_domains,
-            report_type=report_type,
-            report_source=report_source,
-            source_urls=source_urls,
-            document_urls=document_urls,
-            tone=tone,
-            config_path=config_path,
-            websocket=logs_handler,  # Use logs_handler instead of raw websocket
-            headers=headers,
-            mcp_configs=mcp_configs if mcp_enabled else None,
-            mcp_strategy=mcp_strategy if mcp_enabled else None,
-        )
-        report = await researcher.run()
+        else:
+            researcher = BasicReport(
+                query=task,
+                query_domains=query_domains,
+                report_type=report_type,
+                report_source=report_source,
+                source_urls=source_urls,
+                document_urls=document_urls,
+                tone=tone,
+                config_path=config_path,
+                websocket=logs_handler,  # Use logs_handler instead of raw websocket
+                headers=headers,
+                mcp_configs=mcp_configs if mcp_enabled else None,
+                mcp_strategy=mcp_strategy if mcp_enabled else None,
+            )
+            report = await researcher.run()
 
     if report_type != "multi_agents" and return_researcher:
         return report, researcher.gpt_researcher
@@ -7,6 +7,13 @@ Usage:
 python cli.py "<query>" --report_type <report_type> --tone <tone> --query_domains <foo.com,bar.com>
 ```
 
+Checkpoint a run under an id and resume it after an interruption:
+
+```shell
+python cli.py "<query>" --report_type <report_type> --run_id <run_id>
+python cli.py --resume <run_id>
+```
+
 """
 import asyncio
 import argparse
@@ -17,6 +24,8 @@ import os
 from dotenv import load_dotenv
 
 from gpt_researcher import GPTResearcher
+from gpt_researcher.config import Config
+from gpt_researcher.utils.checkpoint import get_checkpoint_store
 from gpt_researcher.utils.enum import ReportType, Tone
 from backend.report_type import DetailedReport
 
@@ -37,7 +46,8 @@ cli.add_argument(
     # Position 0 argument
     "query",
     type=str,
-    help="The query to conduct research on.")
+    nargs="?",
+    help="The query to conduct research on. Not needed with --resume.")
 
 # =====================================
 # Arg: Report Type
@@ -62,8 +72,7 @@ cli.add_argument(
         f"  {choice}: {report_type_descriptions[choice]}" for choice in choices
     ),
     # Deserialize ReportType as a List of strings:
-    choices=choices,
-    required=True)
+    choices=choices)
 
 # =====================================
 # Arg: Tone
@@ -101,10 +110,40 @@ cli.add_argument(
     default=""
 )
 
+# =====================================
+# Arg: Checkpointing
+# =====================================
+
+cli.add_argument(
+    "--run_id",
+    type=str,
+    help="Checkpoint the run under this id so it can be resumed with --resume (optional).",
+    default=None
+)
+
+cli.add_argument(
+    "--resume",
+    type=str,
+    metavar="RUN_ID",
+    help="Resume a checkpointed run from its last completed stage.",
+    default=None
+)
+
 # =============================================================================
 # Main
 # =============================================================================
 
+async def resume(run_id: str) -> str:
+    """Finish a checkpointed run, skipping the stages it already completed."""
+    run = get_checkpoint_store(Config().checkpoint_path).get_run(run_id)
+    if run is not None and run["kind"] == "detailed_report":
+        return await DetailedReport.resume(run_id).run()
+
+    researcher = GPTResearcher.resume(run_id)
+    await researcher.conduct_research()
+    return await researcher.write_report()
+
+
 async def main(args):
     """
     Conduct research on the given query, generate the report, and write
@@ -112,12 +151,15 @@ async def main(args):
     """
     query_domains = args.query_domains.split(",") if args.query_domains else []
 
-    if args.report_type == 'detailed_report':
+    if args.resume:
+        report = await resume(args.resume)
+    elif args.report_type == 'detailed_report':
         detailed_report = DetailedReport(
             query=args.query,
             query_domains=query_domains,
             report_type="research_report",
             report_source="web_search",
+            run_id=args.run_id,
         )
 
         report = await detailed_report.run()
@@ -146,7 +188,8 @@ async def main(args):
             query_domains=query_domains,
             report_type=args.report_type,
             tone=tone_map[args.tone],
-            encoding=args.encoding
+            encoding=args.encoding,
+            run_id=args.run_id
         )
 
         await researcher.conduct_research()
@@ -164,4 +207,6 @@ async def main(args):
 if __name__ == "__main__":
     load_dotenv()
     args = cli.parse_args()
+    if not args.resume and not (args.query and args.report_type):
+        cli.error("the query and --report_type are required unless resuming a run with --resume")
     asyncio.run(main(args))
@@ -2,8 +2,16 @@ from .retriever import get_retriever, get_retrievers
 from .query_processing import plan_research_outline, get_search_results
 from .agent_creator import extract_json_with_regex, choose_agent
 from .web_scraping import scrape_urls
-from .report_generation import write_conclusion, summarize_url, generate_draft_section_titles, generate_report, write_report_introduction
-from .markdown_processing import extract_headers, extract_sections, table_of_contents, add_references
+from .report_generation import write_conclusion, summarize_url, generate_draft_section_titles, generate_report, write_report_introduction, write_report_section
+from .map_reduce import needs_reduction, pack_context, reduce_context, report_context_token_limit
+from .markdown_processing import (
+    MarkdownIndex,
+    markdown_index,
+    extract_headers,
+    extract_sections,
+    table_of_contents,
+    add_references,
+)
 from .utils import stream_output
 
 __all__ = [
@@ -18,6 +26,13 @@ __all__ = [
     "generate_draft_section_titles",
     "generate_report",
     "write_report_introduction",
+    "write_report_section",
+    "needs_reduction",
+    "pack_context",
+    "reduce_context",
+    "report_context_token_limit",
+    "MarkdownIndex",
+    "markdown_index",
     "extract_headers",
     "extract_sections",
     "table_of_contents",
@@ -2,8 +2,15 @@ import json
 import re
 import json_repair
 from ..utils.llm import create_chat_completion
+from ..utils.cascade import CascadeStats, cascade_chat_completion, score_json_object
 from ..prompts import PromptFamily
 
+# Agent used when none can be chosen
+DEFAULT_AGENT = "Default Agent", (
+    "You are an AI critical thinker research assistant. Your sole purpose is to write well written, "
+    "critically acclaimed, objective and structured reports on given text."
+)
+
 async def choose_agent(
     query,
     cfg,
@@ -11,6 +18,7 @@ async def choose_agent(
     cost_callback: callable = None,
     headers=None,
     prompt_family: type[PromptFamily] | PromptFamily = PromptFamily,
+    cascade_stats: CascadeStats | None = None,
     **kwargs
 ):
     """
@@ -22,6 +30,7 @@ async def choose_agent(
         cfg: Config
         cost_callback: callback for calculating llm costs
         prompt_family: Family of prompts
+        cascade_stats: Collector for cascade escalation statistics
 
     Returns:
         agent: Agent name
@@ -29,14 +38,30 @@ async def choose_agent(
     """
     query = f"{parent_query} - {query}" if parent_query else f"{query}"
     response = None  # Initialize response to ensure it's defined
+    messages = [
+        {"role": "system", "content": f"{prompt_family.auto_agent_instructions()}"},
+        {"role": "user", "content": f"task: {query}"},
+    ]
+
+    if cfg.llm_cascade:
+        response = await cascade_chat_completion(
+            messages=messages,
+            cfg=cfg,
+            stage="choose_agent",
+            score=score_json_object("server", "agent_role_prompt"),
+            stats=cascade_stats,
+            cost_callback=cost_callback,
+            temperature=0.15,
+            **kwargs
+        )
+        if response is not None:
+            agent_dict = json_repair.loads(response)
+            return agent_dict["server"], agent_dict["agent_role_prompt"]
 
     try:
         response = await create_chat_completion(
             model=cfg.smart_llm_model,
-            messages=[
-                {"role": "system", "content": f"{prompt_family.auto_agent_instructions()}"},
-                {"role": "user", "content": f"task: {query}"},
-            ],
+            messages=messages,
             temperature=0.15,
             llm_provider=cfg.smart_llm_provider,
             llm_kwargs=cfg.llm_kwargs,
@@ -69,13 +94,12 @@ async def handle_json_error(response):
             print(f"Error decoding JSON: {e}")
 
     print("No JSON found in the string. Falling back to Default Agent.")
-    return "Default Agent", (
-        "You are an AI critical thinker research assistant. Your sole purpose is to write well written, "
-        "critically acclaimed, objective and structured reports on given text."
-    )
+    return DEFAULT_AGENT
 
 
 def extract_json_with_regex(response):
+    if not response:
+        return None
     json_match = re.search(r"{.*?}", response, re.DOTALL)
     if json_match:
         return json_match.group(0)
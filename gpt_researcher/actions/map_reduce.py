@@ -0,0 +1,163 @@
+import asyncio
+from typing import Any, List
+
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from ..config.config import Config
+from ..prompts import PromptFamily
+from ..utils.costs import CHARS_PER_TOKEN, count_tokens, get_context_window
+from ..utils.llm import create_chat_completion
+from ..utils.logger import get_formatted_logger
+from .utils import stream_output
+
+logger = get_formatted_logger()
+
+# Response of the summarizing model for a chunk with nothing relevant
+NO_NOTES = "NONE"
+# Context tokens of a report-writing call when the smart model's context window is unknown
+DEFAULT_REPORT_CONTEXT_TOKENS = 40000
+# Share of the smart model's input window given to the context; the rest holds the instructions
+REPORT_CONTEXT_WINDOW_SHARE = 0.8
+
+
+def pack_context(context: Any) -> str:
+    """The research context as the single string sent to the report-writing call."""
+    if isinstance(context, str):
+        return context
+    if isinstance(context, (list, tuple)):
+        return "\n".join(str(item) for item in context)
+    return str(context)
+
+
+def report_context_token_limit(cfg: Config) -> int:
+    """
+    Context tokens one report-writing call is given: ``REPORT_CONTEXT_TOKEN_LIMIT``
+    when set, otherwise most of the smart model's context window that its
+    ``SMART_TOKEN_LIMIT`` output tokens leave free.
+    """
+    if limit := getattr(cfg, "report_context_token_limit", 0):
+        return int(limit)
+    window = get_context_window(cfg.smart_llm_model)
+    if window is None:
+        return DEFAULT_REPORT_CONTEXT_TOKENS
+    return int((window - cfg.smart_token_limit) * REPORT_CONTEXT_WINDOW_SHARE)
+
+
+def needs_reduction(context: Any, cfg: Config) -> bool:
+    """Whether the packed context exceeds the token budget of one report-writing call."""
+    if not getattr(cfg, "map_reduce_reports", False):
+        return False
+    return count_tokens(pack_context(context)) > report_context_token_limit(cfg)
+
+
+def _group_notes(notes: List[str], max_tokens: int) -> List[List[str]]:
+    """Consecutive notes grouped into merges of at most ``max_tokens``, at least two per merge."""
+    groups: List[List[str]] = []
+    group: List[str] = []
+    group_tokens = 0
+    for note in notes:
+        tokens = count_tokens(note)
+        if len(group) >= 2 and group_tokens + tokens > max_tokens:
+            groups.append(group)
+            group, group_tokens = [], 0
+        group.append(note)
+        group_tokens += tokens
+    if len(group) == 1 and groups:
+        groups[-1].extend(group)
+    elif group:
+        groups.append(group)
+    return groups
+
+
+async def reduce_context(
+    query: str,
+    context: Any,
+    cfg: Config,
+    websocket=None,
+    cost_callback: callable = None,
+    prompt_family: type[PromptFamily] | PromptFamily = PromptFamily,
+) -> str:
+    """
+    Reduce a context too large for one report-writing call to query-focused notes.
+
+    The context is split into chunks of ``MAP_REDUCE_CHUNK_TOKENS`` that the
+    fast LLM summarizes into notes in parallel (map). Groups of notes are then
+    merged, again in parallel, until all notes fit in the context budget of
+    ``report_context_token_limit`` (reduce). Notes keep the source URL of every
+    fact, so the report written from them can still cite its sources.
+
+    Args:
+        query (str): The research query the notes focus on.
+        context: Research context, a string or a list of strings.
+        cfg (Config): Configuration object.
+        websocket: WebSocket connection for streaming progress logs.
+        cost_callback (callable, optional): Callback for calculating LLM costs.
+        prompt_family: Family of prompts
+
+    Returns:
+        str: The notes, within the context budget when the merges succeed.
+    """
+    packed = pack_context(context)
+    limit = report_context_token_limit(cfg)
+    semaphore = asyncio.Semaphore(max(1, cfg.map_reduce_concurrency))
+
+    async def complete(prompt: str) -> str:
+        async with semaphore:
+            return await create_chat_completion(
+                model=cfg.fast_llm_model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.0,
+                llm_provider=cfg.fast_llm_provider,
+                max_tokens=cfg.fast_token_limit,
+                llm_kwargs=cfg.llm_kwargs,
+                cost_callback=cost_callback,
+            )
+
+    async def summarize(chunk: str) -> str:
+        try:
+            notes = (await complete(prompt_family.summarize_context_chunk(query, chunk))).strip()
+        except Exception as e:
+            # The chunk is kept as it is rather than losing its evidence; later merges condense it
+            logger.warning(f"Error summarizing a context chunk, keeping it unsummarized: {e}")
+            return chunk
+        return "" if notes.upper().rstrip(".") == NO_NOTES else notes
+
+    async def merge(group: List[str]) -> str:
+        if len(group) == 1:
+            return group[0]
+        try:
+            return (await complete(prompt_family.merge_context_notes(query, "\n\n".join(group)))).strip()
+        except Exception as e:
+            logger.warning(f"Error merging context notes, keeping them unmerged: {e}")
+            return "\n\n".join(group)
+
+    splitter = RecursiveCharacterTextSplitter(
+        chunk_size=cfg.map_reduce_chunk_tokens * CHARS_PER_TOKEN, chunk_overlap=0
+    )
+    chunks = splitter.split_text(packed)
+    await stream_output(
+        "logs",
+        "map_reduce",
+        f"🗜️ Context of ~{count_tokens(packed)} tokens exceeds the report budget of "
+        f"{limit}, condensing {len(chunks)} chunks into notes...",
+        websocket,
+    )
+    notes = [note for note in await asyncio.gather(*[summarize(chunk) for chunk in chunks]) if note]
+
+    rounds = 0
+    tokens = sum(count_tokens(note) for note in notes)
+    while len(notes) > 1 and tokens > limit:
+        groups = _group_notes(notes, cfg.map_reduce_chunk_tokens)
+        notes = [note for note in await asyncio.gather(*[merge(group) for group in groups]) if note]
+        rounds += 1
+        reduced_tokens = sum(count_tokens(note) for note in notes)
+        if reduced_tokens >= tokens:
+            logger.warning(f"Merging context notes stopped reducing them at ~{reduced_tokens} tokens")
+            break
+        tokens = reduced_tokens
+
+    logger.info(
+        f"Map-reduce condensed ~{count_tokens(packed)} context tokens in {len(chunks)} chunks "
+        f"to ~{tokens} tokens of notes after {rounds} merge rounds"
+    )
+    return "\n\n".join(notes)
@@ -1,6 +1,163 @@
+import copy
+import hashlib
 import re
-import markdown
-from typing import List, Dict
+import threading
+from collections import OrderedDict
+from typing import Any, List, Dict
+
+import mistune
+
+# Parses markdown into mistune's AST: a list of block nodes with inline children
+_parse = mistune.create_markdown(renderer=None, plugins=["strikethrough", "table"])
+
+_INLINE_TYPES = {
+    "text", "emphasis", "strong", "strikethrough", "codespan", "link", "image",
+    "softbreak", "linebreak", "inline_html",
+}
+_BREAKS = {"softbreak": " ", "linebreak": "\n"}
+_TAG = re.compile(r"<[^>]*>")
+_FENCE = re.compile(r"^ {0,3}(?:```|~~~)", re.MULTILINE)
+
+# Number of documents whose index is kept by ``markdown_index``
+INDEX_CACHE_SIZE = 32
+
+
+def _text(node: Dict[str, Any]) -> str:
+    """Plain text of an AST node, with inline markup and HTML tags removed."""
+    if node["type"] in _BREAKS:
+        return _BREAKS[node["type"]]
+    if "raw" in node:
+        raw = node["raw"]
+        return _TAG.sub("", raw) if node["type"] in ("inline_html", "block_html") else raw
+    children = node.get("children") or []
+    if all(child["type"] in _INLINE_TYPES for child in children):
+        return "".join(_text(child) for child in children)
+    return "\n".join(text for child in children if (text := _text(child).strip()))
+
+
+class MarkdownIndex:
+    """
+    Structure of a markdown document from one pass over its parsed blocks: the
+    header tree, the title and text of every section and the table of contents.
+
+    ``append`` parses only the appended text and links it into the existing
+    structure, so a report assembled section by section is indexed in linear
+    time instead of being re-rendered after every section.
+    """
+
+    def __init__(self, markdown_text: str = ""):
+        self.text = ""
+        # Header tree: {"level", "text", "children"?} as returned by ``extract_headers``
+        self.headers: List[Dict] = []
+        # Text blocks before the first header
+        self.preamble: List[str] = []
+        # {"level", "section_title", "blocks"} in document order
+        self._sections: List[Dict[str, Any]] = []
+        self._toc_lines: List[str] = []
+        # Most recent header and its ancestors, i.e. the rightmost path of the tree
+        self._stack: List[Dict] = []
+        self._fences = 0
+        if markdown_text:
+            self.append(markdown_text)
+
+    @property
+    def in_code_block(self) -> bool:
+        """Whether the document ends inside an unclosed code fence."""
+        return self._fences % 2 == 1
+
+    def append(self, markdown_text: str) -> "MarkdownIndex":
+        """
+        Indexes text appended to the document. The text should start a new block,
+        as report sections separated by a blank line do; otherwise use a new index.
+        """
+        for block in _parse(markdown_text):
+            if block["type"] == "heading":
+                self._add_header(block["attrs"]["level"], _text(block).strip())
+            elif text := _text(block).strip():
+                (self._sections[-1]["blocks"] if self._sections else self.preamble).append(text)
+        self.text += markdown_text
+        self._fences += len(_FENCE.findall(markdown_text))
+        return self
+
+    def _add_header(self, level: int, title: str) -> None:
+        while self._stack and self._stack[-1]["level"] >= level:
+            self._stack.pop()
+        header = {"level": level, "text": title}
+        if self._stack:
+            self._stack[-1].setdefault("children", []).append(header)
+        else:
+            self.headers.append(header)
+        self._toc_lines.append(" " * (len(self._stack) * 4) + "- " + title + "\n")
+        self._stack.append(header)
+        self._sections.append({"level": level, "section_title": title, "blocks": []})
+
+    def sections(self) -> List[Dict[str, Any]]:
+        """Every section in document order with its level, title and text (which may be empty)."""
+        return [
+            {"level": section["level"], "section_title": section["section_title"],
+             "written_content": "\n".join(section["blocks"])}
+            for section in self._sections
+        ]
+
+    def table_of_contents(self) -> str:
+        return "## Table of Contents\n\n" + "".join(self._toc_lines)
+
+    def continues(self, markdown_text: str) -> bool:
+        """Whether ``markdown_text`` is this document followed by new blocks after a blank line."""
+        if not self.text or self.in_code_block or not markdown_text.startswith(self.text):
+            return False
+        tail = markdown_text[len(self.text):]
+        body = tail.lstrip(" \t\n")
+        junction = self.text[len(self.text.rstrip(" \t\n")):] + tail[:len(tail) - len(body)]
+        # A blank line separates the blocks, and the first new block is not indented into the last one
+        return not body or (junction.count("\n") >= 2 and junction.endswith("\n"))
+
+    def copy(self) -> "MarkdownIndex":
+        """An independent index of the same document, cheaper than parsing it again."""
+        index = MarkdownIndex()
+        index.text = self.text
+        index.headers = copy.deepcopy(self.headers)
+        index.preamble = list(self.preamble)
+        index._sections = [dict(section, blocks=list(section["blocks"])) for section in self._sections]
+        index._toc_lines = list(self._toc_lines)
+        index._fences = self._fences
+        node = index.headers[-1] if index.headers else None
+        while node is not None:
+            index._stack.append(node)
+            node = node["children"][-1] if node.get("children") else None
+        return index
+
+
+_index_cache: "OrderedDict[str, MarkdownIndex]" = OrderedDict()
+_index_cache_lock = threading.Lock()
+
+
+def markdown_index(markdown_text: str) -> MarkdownIndex:
+    """
+    The index of a document, cached by the document's hash. A document that
+    extends a cached one with new blocks is indexed by appending only the new
+    text to a copy of the cached index. The returned index must not be modified.
+    """
+    key = hashlib.sha256(markdown_text.encode("utf-8")).hexdigest()
+    with _index_cache_lock:
+        if (index := _index_cache.get(key)) is not None:
+            _index_cache.move_to_end(key)
+            return index
+        base = max(
+            (cached for cached in _index_cache.values() if cached.continues(markdown_text)),
+            key=lambda cached: len(cached.text),
+            default=None,
+        )
+    if base is not None:
+        index = base.copy().append(markdown_text[len(base.text):])
+    else:
+        index = MarkdownIndex(markdown_text)
+    with _index_cache_lock:
+        _index_cache[key] = index
+        while len(_index_cache) > INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+    return index
+
 
 def extract_headers(markdown_text: str) -> List[Dict]:
     """
@@ -12,31 +169,7 @@ def extract_headers(markdown_text: str) -> List[Dict]:
     Returns:
         List[Dict]: A list of dictionaries representing the header structure.
     """
-    headers = []
-    parsed_md = markdown.markdown(markdown_text)
-    lines = parsed_md.split("\n")
-
-    stack = []
-    for line in lines:
-        if line.startswith("<h") and len(line) > 2 and line[2].isdigit():
-            level = int(line[2])
-            header_text = line[line.index(">") + 1 : line.rindex("<")]
-
-            while stack and stack[-1]["level"] >= level:
-                stack.pop()
-
-            header = {
-                "level": level,
-                "text": header_text,
-            }
-            if stack:
-                stack[-1].setdefault("children", []).append(header)
-            else:
-                headers.append(header)
-
-            stack.append(header)
-
-    return headers
+    return copy.deepcopy(markdown_index(markdown_text).headers)
 
 def extract_sections(markdown_text: str) -> List[Dict[str, str]]:
     """
@@ -49,21 +182,11 @@ def extract_sections(markdown_text: str) -> List[Dict[str, str]]:
         List[Dict[str, str]]: List of sections, each section is a dictionary containing
         'section_title' and 'written_content'.
     """
-    sections = []
-    parsed_md = markdown.markdown(markdown_text)
-    
-    pattern = r'<h\d>(.*?)</h\d>(.*?)(?=<h\d>|$)'
-    matches = re.findall(pattern, parsed_md, re.DOTALL)
-    
-    for title, content in matches:
-        clean_content = re.sub(r'<.*?>', '', content).strip()
-        if clean_content:
-            sections.append({
-                "section_title": title.strip(),
-                "written_content": clean_content
-            })
-    
-    return sections
+    return [
+        {"section_title": section["section_title"], "written_content": section["written_content"]}
+        for section in markdown_index(markdown_text).sections()
+        if section["written_content"]
+    ]
 
 def table_of_contents(markdown_text: str) -> str:
     """
@@ -75,18 +198,8 @@ def table_of_contents(markdown_text: str) -> str:
     Returns:
         str: The generated table of contents.
     """
-    def generate_table_of_contents(headers, indent_level=0):
-        toc = ""
-        for header in headers:
-            toc += " " * (indent_level * 4) + "- " + header["text"] + "\n"
-            if "children" in header:
-                toc += generate_table_of_contents(header["children"], indent_level + 1)
-        return toc
-
     try:
-        headers = extract_headers(markdown_text)
-        toc = "## Table of Contents\n\n" + generate_table_of_contents(headers)
-        return toc
+        return markdown_index(markdown_text).table_of_contents()
     except Exception as e:
         print("table_of_contents Exception : ", e)
         return markdown_text
@@ -109,4 +222,4 @@ def add_references(report_markdown: str, visited_urls: set) -> str:
         return updated_markdown_report
     except Exception as e:
         print(f"Encountered exception in adding source urls : {e}")
-        return report_markdown
\ No newline at end of file
+        return report_markdown
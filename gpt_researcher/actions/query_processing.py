@@ -2,6 +2,8 @@ import json_repair
 
 from gpt_researcher.llm_provider.generic.base import ReasoningEfforts
 from ..utils.llm import create_chat_completion
+from ..retrievers.base import run_search
+from ..utils.cascade import CascadeStats, cascade_chat_completion, score_sub_queries
 from ..prompts import PromptFamily
 from typing import Any, List, Dict
 from ..config import Config
@@ -13,6 +15,10 @@ async def get_search_results(query: str, retriever: Any, query_domains: List[str
     """
     Get web search results for a given query.
 
+    Retrievers with a native ``asearch`` are awaited directly; blocking
+    ``search`` calls run in a worker thread, so the event loop stays free for
+    concurrent start-up work (agent selection, speculative scraping).
+
     Args:
         query: The search query
         retriever: The retriever instance
@@ -31,8 +37,8 @@ async def get_search_results(query: str, retriever: Any, query_domains: List[str
         )
     else:
         search_retriever = retriever(query, query_domains=query_domains)
-    
-    return search_retriever.search()
+
+    return await run_search(search_retriever, cache=researcher.search_cache if researcher is not None else None)
 
 async def generate_sub_queries(
     query: str,
@@ -42,6 +48,7 @@ async def generate_sub_queries(
     cfg: Config,
     cost_callback: callable = None,
     prompt_family: type[PromptFamily] | PromptFamily = PromptFamily,
+    cascade_stats: CascadeStats | None = None,
     **kwargs
 ) -> List[str]:
     """
@@ -56,6 +63,7 @@ async def generate_sub_queries(
         cfg: Configuration object
         cost_callback: Callback for cost calculation
         prompt_family: Family of prompts
+        cascade_stats: Collector for cascade escalation statistics
 
     Returns:
         A list of sub-queries
@@ -68,6 +76,20 @@ async def generate_sub_queries(
         context=context,
     )
 
+    if cfg.llm_cascade:
+        response = await cascade_chat_completion(
+            messages=[{"role": "user", "content": gen_queries_prompt}],
+            cfg=cfg,
+            stage="sub_queries",
+            score=score_sub_queries(query),
+            stats=cascade_stats,
+            cost_callback=cost_callback,
+            max_tokens=cfg.fast_token_limit,
+            **kwargs
+        )
+        if response is not None:
+            return json_repair.loads(response)
+
     try:
         response = await create_chat_completion(
             model=cfg.strategic_llm_model,
@@ -118,6 +140,7 @@ async def plan_research_outline(
     report_type: str,
     cost_callback: callable = None,
     retriever_names: List[str] = None,
+    cascade_stats: CascadeStats | None = None,
     **kwargs
 ) -> List[str]:
     """
@@ -132,6 +155,7 @@ async def plan_research_outline(
         report_type: Report type
         cost_callback: Callback for cost calculation
         retriever_names: Names of the retrievers being used
+        cascade_stats: Collector for cascade escalation statistics
 
     Returns:
         A list of sub-queries
@@ -163,6 +187,7 @@ async def plan_research_outline(
         search_results,
         cfg,
         cost_callback,
+        cascade_stats=cascade_stats,
         **kwargs
     )
 
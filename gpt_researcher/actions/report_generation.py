@@ -1,14 +1,27 @@
 import asyncio
 from typing import List, Dict, Any
 from ..config.config import Config
-from ..utils.llm import create_chat_completion
+from ..utils.llm import cacheable_user_message, create_chat_completion
 from ..utils.logger import get_formatted_logger
 from ..prompts import PromptFamily, get_prompt_by_report_type
 from ..utils.enum import Tone
+from .map_reduce import needs_reduction, reduce_context
 
 logger = get_formatted_logger()
 
 
+def _user_message(
+    prompt: str,
+    context,
+    prompt_family: type[PromptFamily] | PromptFamily,
+    config: Config,
+) -> dict[str, Any]:
+    """User message for a report-writing call, with the shared context block marked cacheable."""
+    if not config.prompt_caching:
+        return {"role": "user", "content": prompt}
+    return cacheable_user_message(prompt, prompt_family.research_context_block(context))
+
+
 async def write_report_introduction(
     query: str,
     context: str,
@@ -34,16 +47,17 @@ async def write_report_introduction(
     Returns:
         str: The generated introduction.
     """
+    prompt = prompt_family.generate_report_introduction(
+        question=query,
+        research_summary=context,
+        language=config.language
+    )
     try:
         introduction = await create_chat_completion(
             model=config.smart_llm_model,
             messages=[
                 {"role": "system", "content": f"{agent_role_prompt}"},
-                {"role": "user", "content": prompt_family.generate_report_introduction(
-                    question=query,
-                    research_summary=context,
-                    language=config.language
-                )},
+                _user_message(prompt, context, prompt_family, config),
             ],
             temperature=0.25,
             llm_provider=config.smart_llm_provider,
@@ -85,17 +99,16 @@ async def write_conclusion(
     Returns:
         str: The generated conclusion.
     """
+    prompt = prompt_family.generate_report_conclusion(query=query,
+                                                      report_content=context,
+                                                      language=config.language)
     try:
         conclusion = await create_chat_completion(
             model=config.smart_llm_model,
             messages=[
                 {"role": "system", "content": f"{agent_role_prompt}"},
-                {
-                    "role": "user",
-                    "content": prompt_family.generate_report_conclusion(query=query,
-                                                                        report_content=context,
-                                                                        language=config.language),
-                },
+                # The report differs from the research context, so nothing here is a shared prefix
+                {"role": "user", "content": prompt},
             ],
             temperature=0.25,
             llm_provider=config.smart_llm_provider,
@@ -183,13 +196,13 @@ async def generate_draft_section_titles(
     Returns:
         List[str]: A list of generated section titles.
     """
+    prompt = prompt_family.generate_draft_titles_prompt(current_subtopic, query, context)
     try:
         section_titles = await create_chat_completion(
             model=config.smart_llm_model,
             messages=[
                 {"role": "system", "content": f"{role}"},
-                {"role": "user", "content": prompt_family.generate_draft_titles_prompt(
-                    current_subtopic, query, context)},
+                _user_message(prompt, context, prompt_family, config),
             ],
             temperature=0.25,
             llm_provider=config.smart_llm_provider,
@@ -206,6 +219,64 @@ async def generate_draft_section_titles(
     return []
 
 
+async def write_report_section(
+    query: str,
+    section_title: str,
+    other_titles: List[str],
+    context,
+    agent_role_prompt: str,
+    tone: Tone,
+    cfg: Config,
+    total_words: int,
+    cost_callback: callable = None,
+    prompt_family: type[PromptFamily] | PromptFamily = PromptFamily,
+    **kwargs
+) -> str:
+    """
+    Write one section of a sectioned report. The section is not streamed, as
+    sections are written concurrently and streamed in order by the caller.
+
+    Args:
+        query (str): The research query.
+        section_title (str): Title of the section to write.
+        other_titles (List[str]): Titles of the report's other sections, which the section must not cover.
+        context: The part of the research context relevant to the section.
+        agent_role_prompt (str): The role of the agent.
+        tone (Tone): Tone of the report.
+        cfg (Config): Configuration object.
+        total_words (int): Target length of the section.
+        cost_callback (callable, optional): Callback for calculating LLM costs.
+        prompt_family: Family of prompts
+
+    Returns:
+        str: The section in markdown, starting with its heading.
+    """
+    if needs_reduction(context, cfg):
+        context = await reduce_context(query, context, cfg, cost_callback=cost_callback, prompt_family=prompt_family)
+    prompt = prompt_family.generate_report_section_prompt(
+        query, section_title, other_titles, context,
+        report_format=cfg.report_format, tone=tone, total_words=total_words, language=cfg.language,
+    )
+    try:
+        return await create_chat_completion(
+            model=cfg.smart_llm_model,
+            messages=[
+                {"role": "system", "content": f"{agent_role_prompt}"},
+                _user_message(prompt, context, prompt_family, cfg),
+            ],
+            temperature=0.35,
+            llm_provider=cfg.smart_llm_provider,
+            stream=False,
+            max_tokens=cfg.smart_token_limit,
+            llm_kwargs=cfg.llm_kwargs,
+            cost_callback=cost_callback,
+            **kwargs
+        )
+    except Exception as e:
+        logger.error(f"Error in writing report section '{section_title}': {e}")
+    return ""
+
+
 async def generate_report(
     query: str,
     context,
@@ -247,6 +318,12 @@ async def generate_report(
     generate_prompt = get_prompt_by_report_type(report_type, prompt_family)
     report = ""
 
+    # Contexts too large for one call are condensed into notes rather than trimmed or failing the call
+    if needs_reduction(context, cfg):
+        context = await reduce_context(
+            query, context, cfg, websocket=websocket, cost_callback=cost_callback, prompt_family=prompt_family
+        )
+
     if report_type == "subtopic_report":
         content = f"{generate_prompt(query, existing_headers, relevant_written_contents, main_topic, context, report_format=cfg.report_format, tone=tone, total_words=cfg.total_words, language=cfg.language)}"
     elif custom_prompt:
@@ -258,7 +335,7 @@ async def generate_report(
             model=cfg.smart_llm_model,
             messages=[
                 {"role": "system", "content": f"{agent_role_prompt}"},
-                {"role": "user", "content": content},
+                _user_message(content, context, prompt_family, cfg),
             ],
             temperature=0.35,
             llm_provider=cfg.smart_llm_provider,
@@ -1,6 +1,10 @@
-from typing import Any, Optional
+from functools import partial
+from typing import Any, Callable, Optional
+from uuid import uuid4
 import json
+import logging
 import os
+import sqlite3
 
 from .config import Config
 from .memory import Memory
@@ -8,6 +12,14 @@ from .utils.enum import ReportSource, ReportType, Tone
 from .llm_provider import GenericLLMProvider
 from .prompts import get_prompt_family
 from .vector_store import VectorStoreWrapper
+from .utils.cascade import CascadeStats
+from .utils.costs import UsageTracker, estimate_embedding_cost
+from .utils.budget import RunController
+from .utils.checkpoint import RunCheckpoint, digest, get_checkpoint_store
+from .memory.embeddings import OPENAI_EMBEDDING_MODEL
+from .utils.research_cache import get_research_cache, research_fingerprint
+from .retrievers.cache import get_search_cache, normalize_query
+from .session import ResearchSession, current_session
 
 # Research skills
 from .skills.researcher import ResearchConductor
@@ -18,6 +30,7 @@ from .skills.curator import SourceCurator
 from .skills.deep_research import DeepResearchSkill
 
 from .actions import (
+    stream_output,
     add_references,
     extract_headers,
     extract_sections,
@@ -59,6 +72,10 @@ class GPTResearcher:
         mcp_configs: list[dict] | None = None,
         mcp_max_iterations: int | None = None,
         mcp_strategy: str | None = None,
+        time_budget_s: float | None = None,
+        cost_budget_usd: float | None = None,
+        run_id: str | None = None,
+        session: ResearchSession | None = None,
         **kwargs
     ):
         """
@@ -113,11 +130,26 @@ class GPTResearcher:
                 - "fast" (default): Run MCP once with original query for best performance
                 - "deep": Run MCP for all sub-queries for maximum thoroughness  
                 - "disabled": Skip MCP entirely, use only web retrievers
+            time_budget_s (float, optional): Wall-clock budget of the run in seconds,
+                counted from the start of research. Defaults to TIME_BUDGET_S.
+            cost_budget_usd (float, optional): LLM and embedding cost budget of the run
+                in USD. Defaults to COST_BUDGET_USD.
+            run_id (str, optional): Id under which the run's completed stages are
+                checkpointed, so it can be resumed with ``GPTResearcher.resume``.
+                Generated when CHECKPOINT_RUNS is set; without either the run
+                is not checkpointed.
+            session (ResearchSession, optional): Session whose configuration
+                snapshot, scraping executor and HTTP, LLM and embedding clients
+                the researcher borrows. Defaults to the session of the enclosing
+                ``async with ResearchSession(...)`` block, if any.
         """
         self.kwargs = kwargs
         self.query = query
         self.report_type = report_type
-        self.cfg = Config(config_path)
+        self.session = session or current_session()
+        # The session's configuration snapshot saves re-reading the environment and config file
+        serves_config = self.session is not None and self.session.serves(config_path)
+        self.cfg = self.session.config() if serves_config else Config(config_path)
         self.cfg.set_verbose(verbose)
         self.report_source = report_source if report_source else getattr(self.cfg, 'report_source', None)
         self.report_format = report_format
@@ -142,6 +174,14 @@ class GPTResearcher:
         self.context = context or []
         self.headers = headers or {}
         self.research_costs = 0.0
+        self.usage_tracker = UsageTracker()
+        self.cascade_stats = CascadeStats()
+        self.run_controller = RunController(
+            self,
+            time_budget_s=time_budget_s if time_budget_s is not None else self.cfg.time_budget_s,
+            cost_budget_usd=cost_budget_usd if cost_budget_usd is not None else self.cfg.cost_budget_usd,
+            writing_reserve=self.cfg.budget_writing_reserve,
+        )
         self.log_handler = log_handler
         self.prompt_family = get_prompt_family(prompt_family or self.cfg.prompt_family, self.cfg)
         
@@ -151,7 +191,10 @@ class GPTResearcher:
             self._process_mcp_configs(mcp_configs)
         
         self.retrievers = get_retrievers(self.headers, self.cfg)
-        self.memory = Memory(
+        self.search_cache = self.session.search_cache if serves_config else get_search_cache(self.cfg)
+        self.research_cache = get_research_cache(self.cfg)
+        memory_factory = self.session.memory if self.session is not None else Memory
+        self.memory = memory_factory(
             self.cfg.embedding_provider, self.cfg.embedding_model, **self.cfg.embedding_kwargs
         )
         
@@ -171,6 +214,53 @@ class GPTResearcher:
         # Handle MCP strategy configuration with backwards compatibility
         self.mcp_strategy = self._resolve_mcp_strategy(mcp_strategy, mcp_max_iterations)
 
+        self.run_id = run_id or (uuid4().hex if self.cfg.checkpoint_runs else None)
+        self.checkpoint = (
+            RunCheckpoint(get_checkpoint_store(self.cfg.checkpoint_path), self.run_id)
+            if self.run_id else RunCheckpoint()
+        )
+        self.checkpoint.register("gpt_researcher", self._checkpoint_params(config_path))
+
+    def _checkpoint_params(self, config_path) -> dict[str, Any]:
+        """The constructor arguments needed to start this run again on resume."""
+        return {
+            "query": self.query,
+            "report_type": self.report_type,
+            "report_format": self.report_format,
+            "report_source": self.report_source,
+            "tone": self.tone.name,
+            "source_urls": self.source_urls,
+            "document_urls": self.document_urls,
+            "complement_source_urls": self.complement_source_urls,
+            "query_domains": self.query_domains,
+            "config_path": config_path,
+            "parent_query": self.parent_query,
+            "max_subtopics": self.max_subtopics,
+            "mcp_strategy": self.mcp_strategy,
+            "time_budget_s": self.run_controller.time_budget_s,
+            "cost_budget_usd": self.run_controller.cost_budget_usd,
+        }
+
+    @classmethod
+    def resume(cls, run_id: str, config_path=None, **kwargs) -> "GPTResearcher":
+        """
+        A researcher for a checkpointed run, started with the run's original arguments.
+
+        Calling ``conduct_research`` and the write methods on it skips every stage
+        the run already completed. Keyword arguments override the stored arguments
+        and supply what is not checkpointed, such as ``websocket`` or ``mcp_configs``.
+        """
+        store = get_checkpoint_store(Config(config_path).checkpoint_path)
+        run = store.get_run(run_id)
+        if run is None or run["kind"] != "gpt_researcher":
+            raise ValueError(f"No checkpointed research run with id '{run_id}'")
+        params = run["params"]
+        params["tone"] = Tone[params["tone"]]
+        params.update(kwargs)
+        if config_path is not None:
+            params["config_path"] = config_path
+        return cls(run_id=run_id, **params)
+
     def _resolve_mcp_strategy(self, mcp_strategy: str | None, mcp_max_iterations: int | None) -> str:
         """
         Resolve MCP strategy from various sources with backwards compatibility.
@@ -286,7 +376,129 @@ class GPTResearcher:
                 import logging
                 logging.getLogger('research').error(f"Error in _log_event: {e}", exc_info=True)
 
-    async def conduct_research(self, on_progress=None):
+    async def conduct_research(self, on_progress=None, bypass_cache: bool = False):
+        """
+        Conducts the research and returns its context.
+
+        Args:
+            on_progress: Callback receiving deep research progress.
+            bypass_cache (bool): Research from scratch even when the research cache
+                holds fresh research for the same or a similar query.
+        """
+        if (research := self.checkpoint.get("research")) is not None:
+            return await self._restore_research(research)
+        self.run_controller.start()
+        cache_key = None if bypass_cache else await self._research_cache_key()
+        cached = self._lookup_cached_research(cache_key)
+        with self.run_controller.research_phase():
+            if cached is not None:
+                context = await self._serve_cached_research(cached)
+            else:
+                context = await self._conduct_research(on_progress)
+        if cache_key is not None and cached is None and self._research_complete():
+            try:
+                fingerprint, embedding = cache_key
+                self.research_cache.store(fingerprint, self.query, embedding, self._research_outcome())
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                logging.getLogger(__name__).warning(f"Research could not be cached: {e}")
+        self.checkpoint.put("research", {**self._research_outcome(), "costs": self.research_costs})
+        return context
+
+    def _research_outcome(self) -> dict[str, Any]:
+        return {
+            "context": self.context,
+            "visited_urls": list(self.visited_urls),
+            "agent": self.agent,
+            "role": self.role,
+            "research_sources": self.research_sources,
+            "research_images": self.research_images,
+        }
+
+    def _research_complete(self) -> bool:
+        """Whether research produced context without being cut short by its budget or saturation stopping."""
+        if not self.context or self.run_controller.exhaustion_reason() or any(self.run_controller.dropped.values()):
+            return False
+        saturation = self.research_conductor.saturation
+        return saturation is None or saturation.reason is None
+
+    async def _research_cache_key(self) -> tuple[str, list[float]] | None:
+        """The fingerprint and query embedding the research is cached under, or None if it is not cached."""
+        if self.research_cache is None or (fingerprint := research_fingerprint(self)) is None:
+            return None
+        try:
+            embedding = await self.memory.get_embeddings().aembed_query(self.query)
+        except Exception as e:
+            logging.getLogger(__name__).warning(f"Query could not be embedded for the research cache: {e}")
+            return None
+        self.stage_cost_callback("planning")(
+            estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=[self.query])
+        )
+        return fingerprint, embedding
+
+    def _lookup_cached_research(self, cache_key: tuple[str, list[float]] | None) -> dict[str, Any] | None:
+        if cache_key is None:
+            return None
+        try:
+            return self.research_cache.lookup(*cache_key, threshold=self.cfg.research_cache_similarity)
+        except sqlite3.Error as e:
+            logging.getLogger(__name__).warning(f"Research cache lookup failed: {e}")
+            return None
+
+    async def _serve_cached_research(self, cached: dict[str, Any]) -> Any:
+        """
+        Takes the outcome of cached research for the same or a similar query.
+        With RESEARCH_CACHE_TOP_UP, research for a different query is topped up
+        with one search for this query, scraping only URLs the cached research
+        did not visit.
+        """
+        research = cached["research"]
+        self.context = research["context"]
+        self.visited_urls = set(research["visited_urls"])
+        # An agent and role given by the caller are part of the fingerprint and are kept
+        self.agent, self.role = self.agent or research["agent"], self.role or research["role"]
+        self.research_sources = research["research_sources"]
+        self.research_images = research["research_images"]
+        await self._log_event("research", step="research_cache_hit", details={
+            "cached_query": cached["query"],
+            "similarity": round(cached["similarity"], 3),
+            "age_s": round(cached["age_s"]),
+        })
+        if self.verbose:
+            await stream_output(
+                "logs",
+                "research_cache_hit",
+                f"♻️ Reusing research for '{cached['query']}' "
+                f"({cached['similarity']:.2f} similar, {cached['age_s'] / 60:.0f} min old)",
+                self.websocket,
+            )
+
+        if self.cfg.research_cache_top_up and normalize_query(cached["query"]) != normalize_query(self.query):
+            new_context = await self.research_conductor._process_sub_query(self.query, [], self.query_domains)
+            if new_context and isinstance(self.context, list):
+                self.context = self.context + [new_context]
+            elif new_context:
+                self.context = f"{self.context}\n\n{new_context}" if self.context else new_context
+            await self._log_event("research", step="research_cache_top_up", details={
+                "context_length": len(str(new_context or ""))
+            })
+        return self.context
+
+    async def _restore_research(self, research: dict) -> Any:
+        """Restores the outcome of research completed before the run was interrupted."""
+        self.context = research["context"]
+        self.visited_urls = set(research["visited_urls"])
+        self.agent, self.role = research["agent"], research["role"]
+        self.research_sources = research["research_sources"]
+        self.research_images = research["research_images"]
+        # Spend before the interruption still counts towards the cost budget
+        self.research_costs = max(self.research_costs, research["costs"])
+        await self._log_event("research", step="research_restored", details={
+            "run_id": self.run_id,
+            "context_length": len(self.context)
+        })
+        return self.context
+
+    async def _conduct_research(self, on_progress=None):
         await self._log_event("research", step="start", details={
             "query": self.query,
             "report_type": self.report_type,
@@ -298,26 +510,9 @@ class GPTResearcher:
         if self.report_type == ReportType.DeepResearch.value and self.deep_researcher:
             return await self._handle_deep_research(on_progress)
 
-        if not (self.agent and self.role):
-            await self._log_event("action", action="choose_agent")
-            self.agent, self.role = await choose_agent(
-                query=self.query,
-                cfg=self.cfg,
-                parent_query=self.parent_query,
-                cost_callback=self.add_costs,
-                headers=self.headers,
-                prompt_family=self.prompt_family,
-                **self.kwargs
-            )
-            await self._log_event("action", action="agent_selected", details={
-                "agent": self.agent,
-                "role": self.role
-            })
-
-        await self._log_event("research", step="conducting_research", details={
-            "agent": self.agent,
-            "role": self.role
-        })
+        # Agent selection happens inside the research conductor, where it
+        # overlaps with the initial planning search; the conductor logs the
+        # "conducting_research" step once the agent and role are known
         self.context = await self.research_conductor.conduct_research()
 
         await self._log_event("research", step="research_completed", details={
@@ -372,12 +567,19 @@ class GPTResearcher:
             "context_source": "external" if ext_context else "internal"
         })
 
-        report = await self.report_generator.write_report(
-            existing_headers=existing_headers,
-            relevant_written_contents=relevant_written_contents,
-            ext_context=ext_context or self.context,
-            custom_prompt=custom_prompt
-        )
+        stage = "report:" + digest(json.dumps(
+            [existing_headers, relevant_written_contents, str(ext_context or ""), custom_prompt], default=str
+        ))
+        report = self.checkpoint.get(stage)
+        if report is None:
+            with self.run_controller.writing_phase():
+                report = await self.report_generator.write_report(
+                    existing_headers=existing_headers,
+                    relevant_written_contents=relevant_written_contents,
+                    ext_context=ext_context or self.context,
+                    custom_prompt=custom_prompt
+                )
+            self.checkpoint.put(stage, report)
 
         await self._log_event("research", step="report_completed", details={
             "report_length": len(report)
@@ -386,18 +588,27 @@ class GPTResearcher:
 
     async def write_report_conclusion(self, report_body: str) -> str:
         await self._log_event("research", step="writing_conclusion")
-        conclusion = await self.report_generator.write_report_conclusion(report_body)
+        stage = f"conclusion:{digest(report_body)}"
+        conclusion = self.checkpoint.get(stage)
+        if conclusion is None:
+            with self.run_controller.writing_phase():
+                conclusion = await self.report_generator.write_report_conclusion(report_body)
+            self.checkpoint.put(stage, conclusion)
         await self._log_event("research", step="conclusion_completed")
         return conclusion
 
     async def write_introduction(self):
         await self._log_event("research", step="writing_introduction")
-        intro = await self.report_generator.write_introduction()
+        intro = self.checkpoint.get("introduction")
+        if intro is None:
+            with self.run_controller.writing_phase():
+                intro = await self.report_generator.write_introduction()
+            self.checkpoint.put("introduction", intro)
         await self._log_event("research", step="introduction_completed")
         return intro
 
     async def quick_search(self, query: str, query_domains: list[str] = None) -> list[Any]:
-        return await get_search_results(query, self.retrievers[0], query_domains=query_domains)
+        return await get_search_results(query, self.retrievers[0], query_domains=query_domains, researcher=self)
 
     async def get_subtopics(self):
         return await self.report_generator.get_subtopics()
@@ -450,16 +661,48 @@ class GPTResearcher:
     def get_research_context(self) -> list:
         return self.context
 
-    def get_costs(self) -> float:
+    def get_costs(self, breakdown: bool = False) -> float | dict[str, dict[str, float]]:
+        """Total research costs, or per-stage costs and token counts when ``breakdown`` is set."""
+        if breakdown:
+            return self.usage_tracker.summary()
         return self.research_costs
 
+    def get_pipeline_stats(self) -> dict[str, dict[str, Any]]:
+        """Per-stage utilization of the last research pipeline run."""
+        return self.research_conductor.pipeline_stats
+
+    def get_retriever_stats(self) -> dict[str, dict[str, Any]]:
+        """Per-retriever search latency histograms and ok/error/timeout counts."""
+        return self.research_conductor.retriever_stats.summary()
+
+    def get_search_cache_stats(self) -> dict[str, dict[str, Any]]:
+        """Per-retriever search cache hits, misses, expired entries and hit rate."""
+        return self.search_cache.stats.summary() if self.search_cache is not None else {}
+
+    def get_research_cache_stats(self) -> dict[str, dict[str, Any]]:
+        """Research cache hits, misses, expired entries and hit rate."""
+        return self.research_cache.stats.summary() if self.research_cache is not None else {}
+
+    def get_budget_status(self) -> dict[str, Any]:
+        """Time and cost budgets of the run, what was used, and the work dropped to stay within them."""
+        return self.run_controller.summary()
+
+    def get_cascade_stats(self) -> dict[str, dict[str, Any]]:
+        """Per-stage escalation statistics of the fast/strategic model cascade."""
+        return self.cascade_stats.summary()
+
+    def stage_cost_callback(self, stage: str) -> Callable[..., None]:
+        """Cost callback that attributes costs and token usage to a research stage."""
+        return partial(self.add_costs, stage=stage)
+
     def set_verbose(self, verbose: bool):
         self.verbose = verbose
 
-    def add_costs(self, cost: float) -> None:
+    def add_costs(self, cost: float, stage: str | None = None, usage: dict[str, int] | None = None) -> None:
         if not isinstance(cost, (float, int)):
             raise ValueError("Cost must be an integer or float")
         self.research_costs += cost
+        self.usage_tracker.record(stage or "other", cost, usage)
         if self.log_handler:
             self._log_event("research", step="cost_update", details={
                 "cost": cost,
@@ -21,12 +21,57 @@ class BaseConfig(TypedDict):
     TOTAL_WORDS: int
     REPORT_FORMAT: str
     CURATE_SOURCES: bool
+    CURATION_BATCH_SIZE: int
+    PREFETCH_PLANNING_SOURCES: bool
+    LLM_CASCADE: bool
+    LLM_CASCADE_THRESHOLD: float
+    LLM_CASCADE_SAMPLES: int
+    PROMPT_CACHING: bool
+    MAP_REDUCE_REPORTS: bool
+    REPORT_CONTEXT_TOKEN_LIMIT: int
+    MAP_REDUCE_CHUNK_TOKENS: int
+    MAP_REDUCE_CONCURRENCY: int
+    SECTIONED_REPORTS: bool
+    SECTIONED_REPORT_MIN_WORDS: int
+    SECTION_CONCURRENCY: int
+    RESEARCH_PIPELINE: bool
+    PIPELINE_QUEUE_SIZE: int
+    PIPELINE_SEARCH_WORKERS: int
+    PIPELINE_EMBED_WORKERS: int
+    RETRIEVER_TIMEOUT: float
+    RETRIEVER_TIMEOUTS: dict
+    SCRAPE_BUDGET: int
+    MAX_URLS_PER_DOMAIN: int
+    SNIPPET_FIRST: bool
+    SNIPPET_SCRAPE_LIMIT: int
+    SNIPPET_MIN_CHARS: int
+    SHARED_PAGE_POOL: bool
+    SATURATION_STOPPING: bool
+    SATURATION_NOVELTY_THRESHOLD: float
+    SATURATION_MIN_FRACTION: float
+    TIME_BUDGET_S: float
+    COST_BUDGET_USD: float
+    BUDGET_WRITING_RESERVE: float
+    CHECKPOINT_RUNS: bool
+    CHECKPOINT_PATH: str
+    SEARCH_CACHE: bool
+    SEARCH_CACHE_PATH: str
+    SEARCH_CACHE_TTL_S: float
+    SEARCH_CACHE_TTLS: dict
+    SEARCH_CACHE_MAX_ENTRIES: int
+    RESEARCH_CACHE: bool
+    RESEARCH_CACHE_PATH: str
+    RESEARCH_CACHE_TTL_S: float
+    RESEARCH_CACHE_SIMILARITY: float
+    RESEARCH_CACHE_TOP_UP: bool
+    RESEARCH_CACHE_MAX_ENTRIES: int
     MAX_ITERATIONS: int
     LANGUAGE: str
     AGENT_ROLE: Union[str, None]
     SCRAPER: str
     MAX_SCRAPER_WORKERS: int
     MAX_SUBTOPICS: int
+    SUBTOPIC_CONCURRENCY: int
     REPORT_SOURCE: Union[str, None]
     DOC_PATH: str
     PROMPT_FAMILY: str
@@ -35,6 +80,9 @@ class BaseConfig(TypedDict):
     DEEP_RESEARCH_CONCURRENCY: int
     DEEP_RESEARCH_DEPTH: int
     DEEP_RESEARCH_BREADTH: int
+    DEEP_RESEARCH_NOVELTY_FILTER: bool
+    DEEP_RESEARCH_SIMILARITY_THRESHOLD: float
+    DEEP_RESEARCH_MIN_NEW_LEARNINGS: int
     MCP_SERVERS: List[Dict[str, Any]]
     MCP_AUTO_TOOL_SELECTION: bool
     MCP_USE_LLM_ARGS: bool
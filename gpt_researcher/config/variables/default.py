@@ -12,6 +12,50 @@ DEFAULT_CONFIG: BaseConfig = {
     "STRATEGIC_TOKEN_LIMIT": 4000,
     "BROWSE_CHUNK_MAX_LENGTH": 8192,
     "CURATE_SOURCES": False,
+    "CURATION_BATCH_SIZE": 5,  # Borderline sources judged per curation LLM call
+    "PREFETCH_PLANNING_SOURCES": True,  # Scrape initial search results while the research outline is planned
+    "LLM_CASCADE": False,  # Try FAST_LLM first for auxiliary calls and escalate only on low confidence
+    "LLM_CASCADE_THRESHOLD": 0.7,
+    "LLM_CASCADE_SAMPLES": 1,  # Set to 2 to also require agreement between two fast samples
+    "PROMPT_CACHING": True,  # Mark the shared research context as a cacheable prompt prefix
+    "MAP_REDUCE_REPORTS": True,  # Condense contexts over REPORT_CONTEXT_TOKEN_LIMIT into notes before writing
+    "REPORT_CONTEXT_TOKEN_LIMIT": 0,  # Context tokens a single report-writing call is given; 0 derives it from the smart model
+    "MAP_REDUCE_CHUNK_TOKENS": 8000,  # Context tokens the fast LLM condenses per call
+    "MAP_REDUCE_CONCURRENCY": 8,  # Fast LLM calls condensing the context at the same time
+    "SECTIONED_REPORTS": True,  # Write long research reports as concurrently written sections
+    "SECTIONED_REPORT_MIN_WORDS": 2000,  # TOTAL_WORDS from which research reports are written section by section
+    "SECTION_CONCURRENCY": 4,  # Report sections written at the same time
+    "RESEARCH_PIPELINE": False,  # Stream pages through bounded search/fetch/parse/embed/rank stages
+    "PIPELINE_QUEUE_SIZE": 32,
+    "PIPELINE_SEARCH_WORKERS": 4,
+    "PIPELINE_EMBED_WORKERS": 2,
+    "RETRIEVER_TIMEOUT": 60.0,  # Seconds each retriever gets per search before its results are dropped
+    "RETRIEVER_TIMEOUTS": {"tavily": 100},  # Per-retriever overrides; Tavily keeps its previous 100s request timeout
+    "SCRAPE_BUDGET": 10,  # URLs scraped per sub-query after fusing all retrievers' results (0 = no limit)
+    "MAX_URLS_PER_DOMAIN": 2,  # Diversity cap on the URLs scraped per domain and sub-query (0 = no limit)
+    "SNIPPET_FIRST": False,  # Rank retriever snippets as pages and scrape only relevant truncated ones
+    "SNIPPET_SCRAPE_LIMIT": 3,  # Truncated snippets scraped in full per sub-query in snippet-first mode
+    "SNIPPET_MIN_CHARS": 800,  # Snippets shorter than this (or ending in an ellipsis) count as truncated
+    "SHARED_PAGE_POOL": True,  # Rank every sub-query against all pages scraped in the run, not only its own
+    "SATURATION_STOPPING": True,  # Stop researching sub-queries once their context stops adding new information
+    "SATURATION_NOVELTY_THRESHOLD": 0.2,  # Share of new context chunks below which research is saturated
+    "SATURATION_MIN_FRACTION": 0.5,  # Share of planned sub-queries researched before saturation can stop research
+    "TIME_BUDGET_S": 0,  # Wall-clock budget of a run in seconds (0 = no limit)
+    "COST_BUDGET_USD": 0,  # LLM and embedding cost budget of a run in USD (0 = no limit)
+    "BUDGET_WRITING_RESERVE": 0.25,  # Share of both budgets held back for report writing
+    "CHECKPOINT_RUNS": False,  # Checkpoint every run so it can be resumed, not only runs given a run_id
+    "CHECKPOINT_PATH": "outputs/checkpoints.db",  # SQLite file holding run checkpoints
+    "SEARCH_CACHE": False,  # Serve repeated searches from an on-disk cache of search results
+    "SEARCH_CACHE_PATH": "outputs/search_cache.db",  # SQLite file holding cached search results
+    "SEARCH_CACHE_TTL_S": 21600,  # Seconds cached search results stay fresh
+    "SEARCH_CACHE_TTLS": {"news": 900, "arxiv": 604800, "semantic_scholar": 604800, "pubmed_central": 604800},  # Per-retriever (or news topic) overrides
+    "SEARCH_CACHE_MAX_ENTRIES": 10000,  # Least recently used results are evicted beyond this many
+    "RESEARCH_CACHE": False,  # Serve research for the same or a paraphrased query from an on-disk cache
+    "RESEARCH_CACHE_PATH": "outputs/research_cache.db",  # SQLite file holding cached research
+    "RESEARCH_CACHE_TTL_S": 21600,  # Seconds cached research stays fresh
+    "RESEARCH_CACHE_SIMILARITY": 0.95,  # Query embedding similarity from which cached research is served
+    "RESEARCH_CACHE_TOP_UP": False,  # Top up research cached for a paraphrased query with one new search
+    "RESEARCH_CACHE_MAX_ENTRIES": 1000,  # Least recently used research is evicted beyond this many
     "SUMMARY_TOKEN_LIMIT": 700,
     "TEMPERATURE": 0.4,
     "USER_AGENT": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36 Edg/119.0.0.0",
@@ -24,6 +68,7 @@ DEFAULT_CONFIG: BaseConfig = {
     "SCRAPER": "bs",
     "MAX_SCRAPER_WORKERS": 15,
     "MAX_SUBTOPICS": 3,
+    "SUBTOPIC_CONCURRENCY": 3,  # Subtopics of a detailed report researched at the same time
     "LANGUAGE": "english",
     "REPORT_SOURCE": "web",
     "DOC_PATH": "./my-docs",
@@ -35,6 +80,9 @@ DEFAULT_CONFIG: BaseConfig = {
     "DEEP_RESEARCH_BREADTH": 3,
     "DEEP_RESEARCH_DEPTH": 2,
     "DEEP_RESEARCH_CONCURRENCY": 4,
+    "DEEP_RESEARCH_NOVELTY_FILTER": True,  # Drop follow-up queries and learnings similar to ones already explored
+    "DEEP_RESEARCH_SIMILARITY_THRESHOLD": 0.9,  # Cosine similarity above which a query or learning is a repeat
+    "DEEP_RESEARCH_MIN_NEW_LEARNINGS": 1,  # A branch yielding fewer new learnings goes no deeper
     
     # MCP retriever specific settings
     "MCP_SERVERS": [],  # List of predefined MCP server configurations
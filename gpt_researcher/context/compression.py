@@ -54,8 +54,13 @@ class ContextCompressor:
         self.similarity_threshold = os.environ.get("SIMILARITY_THRESHOLD", 0.35)
         self.prompt_family = prompt_family
 
+    @staticmethod
+    def text_splitter() -> RecursiveCharacterTextSplitter:
+        """The splitter pages are chunked with before their chunks are ranked."""
+        return RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
+
     def __get_contextual_retriever(self):
-        splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
+        splitter = self.text_splitter()
         relevance_filter = EmbeddingsFilter(embeddings=self.embeddings,
                                             similarity_threshold=self.similarity_threshold)
         pipeline_compressor = DocumentCompressorPipeline(
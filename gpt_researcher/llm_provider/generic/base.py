@@ -7,6 +7,7 @@ import sys
 import traceback
 from typing import Any
 from colorama import Fore, Style, init
+from langchain_core.messages.ai import add_usage
 import os
 from enum import Enum
 
@@ -85,14 +86,30 @@ class ChatLogger:
                     "stacktrace": traceback.format_exc()
                 }) + "\n")
 
+# Providers whose chat models accept explicit ``cache_control`` content blocks.
+# Other providers get the blocks flattened back into plain strings; OpenAI and
+# vLLM (with prefix caching enabled on the server) reuse identical prompt
+# prefixes automatically.
+CACHE_CONTROL_PROVIDERS = {"anthropic"}
+
+# OpenAI-compatible providers that report token usage on streamed responses
+# when asked to.
+STREAM_USAGE_PROVIDERS = {"openai", "azure_openai", "vllm_openai"}
+
+
 class GenericLLMProvider:
 
-    def __init__(self, llm, chat_log: str | None = None,  verbose: bool = True):
+    def __init__(self, llm, chat_log: str | None = None,  verbose: bool = True, provider: str | None = None):
         self.llm = llm
         self.chat_logger = ChatLogger(chat_log) if chat_log else None
         self.verbose = verbose
+        self.provider = provider
+        self.last_usage: dict[str, Any] | None = None
     @classmethod
     def from_provider(cls, provider: str, chat_log: str | None = None, verbose: bool=True, **kwargs: Any):
+        if provider in STREAM_USAGE_PROVIDERS:
+            kwargs.setdefault("stream_usage", True)
+
         if provider == "openai":
             _check_pkg("langchain_openai")
             from langchain_openai import ChatOpenAI
@@ -240,13 +257,29 @@ class GenericLLMProvider:
             raise ValueError(
                 f"Unsupported {provider}.\n\nSupported model providers are: {supported}"
             )
-        return cls(llm, chat_log, verbose=verbose)
-
+        return cls(llm, chat_log, verbose=verbose, provider=provider)
+
+    def _prepare_messages(self, messages):
+        """Keep ``cache_control`` blocks for providers that support them, flatten them otherwise."""
+        if self.provider in CACHE_CONTROL_PROVIDERS:
+            return messages
+        prepared = []
+        for message in messages:
+            content = message.get("content") if isinstance(message, dict) else None
+            if isinstance(content, list) and all(
+                isinstance(block, dict) and block.get("type") == "text" for block in content
+            ):
+                message = {**message, "content": "".join(block["text"] for block in content)}
+            prepared.append(message)
+        return prepared
 
     async def get_chat_response(self, messages, stream, websocket=None, **kwargs):
+        messages = self._prepare_messages(messages)
+        self.last_usage = None
         if not stream:
             # Getting output from the model chain using ainvoke for asynchronous invoking
             output = await self.llm.ainvoke(messages, **kwargs)
+            self.last_usage = getattr(output, "usage_metadata", None)
 
             res = output.content
 
@@ -264,6 +297,8 @@ class GenericLLMProvider:
 
         # Streaming the response using the chain astream method from langchain
         async for chunk in self.llm.astream(messages, **kwargs):
+            if usage := getattr(chunk, "usage_metadata", None):
+                self.last_usage = add_usage(self.last_usage, usage)
             content = chunk.content
             if content is not None:
                 response += content
@@ -153,7 +153,7 @@ class MCPToolSelector:
                 temperature=0.0,  # Low temperature for consistent tool selection
                 llm_provider=self.cfg.strategic_llm_provider,
                 llm_kwargs=self.cfg.llm_kwargs,
-                cost_callback=self.researcher.add_costs if self.researcher and hasattr(self.researcher, 'add_costs') else None,
+                cost_callback=self.researcher.stage_cost_callback("planning") if self.researcher and hasattr(self.researcher, 'stage_cost_callback') else None,
             )
             return result
         except Exception as e:
@@ -163,7 +163,18 @@ The response should contain ONLY the list.
 """
 
     @staticmethod
+    def research_context_block(context) -> str:
+        """Leading block shared by the report-writing prompts.
+
+        The research context goes first and is rendered identically in every
+        prompt so that providers can serve it from their prompt-prefix cache
+        across the introduction, report, section and conclusion calls.
+        """
+        return f'Information: "{context}"\n---\n'
+
+    @classmethod
     def generate_report_prompt(
+        cls,
         question: str,
         context,
         report_source: str,
@@ -194,10 +205,7 @@ You MUST write all used source document names at the end of the report as refere
 
         tone_prompt = f"Write the report in a {tone.value} tone." if tone else ""
 
-        return f"""
-Information: "{context}"
----
-Using the above information, answer the following query or task: "{question}" in a detailed report --
+        return cls.research_context_block(context) + f"""Using the above information, answer the following query or task: "{question}" in a detailed report --
 The report should focus on the answer to the query, should be well structured, informative,
 in-depth, and comprehensive, with facts and numbers if available and at least {total_words} words.
 You should strive to write the report as long as you can using all relevant and necessary information provided.
@@ -251,6 +259,51 @@ SOURCES LIST TO EVALUATE:
 
 You MUST return your response in the EXACT sources JSON list format as the original sources.
 The response MUST not contain any markdown format or additional text (like ```json), just the JSON list!
+"""
+
+    @staticmethod
+    def judge_sources(query, sources):
+        return f"""Judge how useful each of the following scraped sources is as context for a research report on: "{query}"
+
+Score each source from 0 to 10:
+- Relevance: how directly it addresses the research task. Partially relevant sources can still score 5 or more.
+- Credibility: favor authoritative sources, but do not penalize others unless clearly untrustworthy.
+- Currency: prefer recent information unless older data is essential.
+- Quantitative value: sources with statistics, numbers or concrete data score higher.
+Score below 5 only sources that are irrelevant, severely outdated or unusable.
+
+SOURCES (a JSON list of objects with "id", "url" and "content"):
+{sources}
+
+Respond with a JSON list with one object per source, in the form [{{"id": 0, "score": 7}}, ...].
+The response MUST not contain any markdown format or additional text (like ```json), just the JSON list!
+"""
+
+    @staticmethod
+    def summarize_context_chunk(query, chunk):
+        return f"""The following is one part of the research context gathered for a report on: "{query}"
+
+CONTEXT:
+{chunk}
+
+Write concise notes of everything in this context that is relevant to the report:
+- Keep every relevant fact, figure, date, name and finding; drop only what is irrelevant to the query.
+- End each note with the URL of the source it came from, as [Source: <url>]. Keep the URLs exactly as given.
+- Write the notes as a markdown bullet list, without introduction or conclusion.
+If nothing in the context is relevant, respond with NONE.
+"""
+
+    @staticmethod
+    def merge_context_notes(query, notes):
+        return f"""The following are notes taken from different parts of the research context for a report on: "{query}"
+
+NOTES:
+{notes}
+
+Merge them into one concise markdown bullet list:
+- Combine notes stating the same fact into one, keeping the [Source: <url>] citations of all of them.
+- Keep every other fact, figure and finding with its [Source: <url>] citation exactly as given.
+- Group related notes together, without introduction or conclusion.
 """
 
     @staticmethod
@@ -473,8 +526,9 @@ and research data:
 {format_instructions}
 """
 
-    @staticmethod
+    @classmethod
     def generate_subtopic_report_prompt(
+        cls,
         current_subtopic,
         existing_headers: list,
         relevant_written_contents: list,
@@ -486,11 +540,7 @@ and research data:
         tone: Tone = Tone.Objective,
         language: str = "english",
     ) -> str:
-        return f"""
-Context:
-"{context}"
-
-Main Topic and Subtopic:
+        return cls.research_context_block(context) + f"""Main Topic and Subtopic:
 Using the latest information available, construct a detailed report on the subtopic: {current_subtopic} under the main topic: {main_topic}.
 You must limit the number of subsections to a maximum of {max_subsections}.
 
@@ -550,18 +600,46 @@ Assume the current date is {datetime.now(timezone.utc).strftime('%B %d, %Y')} if
 Do NOT add a conclusion section.
 """
 
-    @staticmethod
+    @classmethod
+    def generate_report_section_prompt(
+        cls,
+        question: str,
+        section_title: str,
+        other_titles: List[str],
+        context,
+        report_format: str = "apa",
+        tone: Tone = Tone.Objective,
+        total_words: int = 400,
+        language: str = "english",
+    ) -> str:
+        other_sections = "\n".join(f"- {title}" for title in other_titles) or "- (none)"
+        tone_prompt = f"Write the section in a {tone.value} tone." if tone else ""
+        return cls.research_context_block(context) + f"""Using the above latest information, write the section "{section_title}" of a research report on: "{question}".
+
+The report has these other sections, written separately. Do NOT cover their topics:
+{other_sections}
+
+Please follow all of the following guidelines:
+- Start with the heading "## {section_title}", and use ### for any subsections.
+- Write only this section: no introduction, conclusion, table of contents or reference list.
+- The section should be informative and in-depth, with facts and numbers if available, and about {total_words} words.
+- Use markdown syntax and {report_format.upper()} format, with markdown tables for structured data or comparisons.
+- Use in-text citation references in {report_format.upper()} format and make it with markdown hyperlink placed at the end of the sentence or paragraph that references them like this: ([in-text citation](url)).
+- {tone_prompt}
+
+You MUST write the section in the following language: {language}.
+Assume that the current date is {date.today()}.
+"""
+
+    @classmethod
     def generate_draft_titles_prompt(
+        cls,
         current_subtopic: str,
         main_topic: str,
         context: str,
         max_subsections: int = 5
     ) -> str:
-        return f"""
-"Context":
-"{context}"
-
-"Main Topic and Subtopic":
+        return cls.research_context_block(context) + f""""Main Topic and Subtopic":
 Using the latest information available, construct a draft section title headers for a detailed report on the subtopic: {current_subtopic} under the main topic: {main_topic}.
 
 "Task":
@@ -584,10 +662,9 @@ Provide the draft headers in a list format using markdown syntax, for example:
 - Focus solely on creating headers, not content.
 """
 
-    @staticmethod
-    def generate_report_introduction(question: str, research_summary: str = "", language: str = "english", report_format: str = "apa") -> str:
-        return f"""{research_summary}\n
-Using the above latest information, Prepare a detailed report introduction on the topic -- {question}.
+    @classmethod
+    def generate_report_introduction(cls, question: str, research_summary: str = "", language: str = "english", report_format: str = "apa") -> str:
+        return cls.research_context_block(research_summary) + f"""Using the above latest information, Prepare a detailed report introduction on the topic -- {question}.
 - The introduction should be succinct, well-structured, informative with markdown syntax.
 - As this introduction will be part of a larger report, do NOT include any other sections, which are generally present in a report.
 - The introduction should be preceded by an H1 heading with a suitable topic for the entire report.
@@ -597,8 +674,8 @@ Assume that the current date is {datetime.now(timezone.utc).strftime('%B %d, %Y'
 """
 
 
-    @staticmethod
-    def generate_report_conclusion(query: str, report_content: str, language: str = "english", report_format: str = "apa") -> str:
+    @classmethod
+    def generate_report_conclusion(cls, query: str, report_content: str, language: str = "english", report_format: str = "apa") -> str:
         """
         Generate a concise conclusion summarizing the main findings and implications of a research report.
 
@@ -610,13 +687,11 @@ Assume that the current date is {datetime.now(timezone.utc).strftime('%B %d, %Y'
         Returns:
             str: A concise conclusion summarizing the report's main findings and implications.
         """
-        prompt = f"""
-    Based on the research report below and research task, please write a concise conclusion that summarizes the main findings and their implications:
+        prompt = cls.research_context_block(report_content) + f"""
+    Based on the research report above and research task, please write a concise conclusion that summarizes the main findings and their implications:
 
     Research task: {query}
 
-    Research Report: {report_content}
-
     Your conclusion should:
     1. Recap the main points of the research
     2. Highlight the most important findings
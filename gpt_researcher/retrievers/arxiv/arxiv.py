@@ -10,7 +10,9 @@ class ArxivSearch:
         self.query = query
         assert sort in ['Relevance', 'SubmittedDate'], "Invalid sort criterion"
         self.sort = arxiv.SortCriterion.SubmittedDate if sort == 'SubmittedDate' else arxiv.SortCriterion.Relevance
-        
+
+    def cache_params(self):
+        return {"sort": self.sort.value}
 
     def search(self, max_results=5):
         """
@@ -0,0 +1,143 @@
+import asyncio
+import inspect
+import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+from ..utils.http import close_http_client, get_http_client
+from .cache import SearchCache, cached_search
+
+logger = logging.getLogger(__name__)
+
+
+def _run_blocking(coro_factory):
+    """
+    Runs a coroutine to completion from synchronous code.
+
+    The coroutine gets its own event loop (in a worker thread when the caller
+    is already inside one) and that loop's HTTP client is closed afterwards.
+    """
+    async def runner():
+        try:
+            return await coro_factory()
+        finally:
+            await close_http_client()
+
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(runner())
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, runner()).result()
+
+
+class BaseRetriever:
+    """
+    Base class of the HTTP search retrievers.
+
+    Subclasses implement the async ``asearch``, which issues its requests
+    through the shared client of ``http_client``. ``search`` remains as a
+    blocking shim for existing synchronous callers.
+    """
+
+    @property
+    def http_client(self):
+        return get_http_client()
+
+    async def asearch(self, max_results: int = 10) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def cache_params(self) -> Dict[str, Any]:
+        """
+        Settings of this retriever, besides the query and query domains, that
+        change what a search returns (region, sort order, endpoint, ...). They
+        are part of its search cache key, so differently configured retrievers
+        never share cached results.
+        """
+        return {}
+
+    def search(self, *args, **kwargs) -> List[Dict[str, Any]]:
+        return _run_blocking(lambda: self.asearch(*args, **kwargs))
+
+    # Whether ``search_many`` sends all queries in one request
+    native_search_many = False
+
+    @classmethod
+    async def search_many(
+        cls, queries: List[str], max_results: int | None = None, query_domains: List[str] | None = None, **options
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Searches several queries, returning one result list per query in order.
+
+        This default searches each query concurrently; retrievers whose API
+        accepts several queries in one request override it and set
+        ``native_search_many``.
+        """
+        kwargs = {} if max_results is None else {"max_results": max_results}
+        return await asyncio.gather(*[
+            cls(query, query_domains=query_domains, **options).asearch(**kwargs) for query in queries
+        ])
+
+
+@cached_search
+async def run_search(retriever: Any, max_results: int | None = None) -> List[Dict[str, Any]]:
+    """
+    Searches with a retriever instance, natively when it supports ``asearch``.
+
+    Retrievers that only implement the blocking ``search`` run in a worker
+    thread so the event loop stays free. Without ``max_results`` the
+    retriever's own default applies. Given a ``cache``, results are served
+    from and stored in that search cache.
+    """
+    kwargs = {} if max_results is None else {"max_results": max_results}
+    if inspect.iscoroutinefunction(getattr(retriever, "asearch", None)):
+        return await retriever.asearch(**kwargs)
+    return await asyncio.to_thread(retriever.search, **kwargs)
+
+
+async def run_search_many(
+    retriever_class: Any,
+    queries: List[str],
+    max_results: int | None = None,
+    query_domains: List[str] | None = None,
+    cache: SearchCache | None = None,
+    **options,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Searches several queries with one ``search_many`` call of a retriever class.
+
+    Given a ``cache``, queries with cached results are left out of the call and
+    the new results are cached; a cache that cannot be read or written is
+    treated as a miss. Returns each query's results by query.
+    """
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    keys: Dict[str, tuple] = {}
+    for query in dict.fromkeys(queries):
+        if cache is not None:
+            retriever = retriever_class(query, query_domains=query_domains, **options)
+            key = cache.key_for(retriever, max_results)
+            if key is not None:
+                keys[query] = (key, retriever)
+                try:
+                    cached = cache.get(key, cache.retriever_name(retriever))
+                except sqlite3.Error as e:
+                    logger.warning(f"Search cache lookup failed: {e}")
+                    cached = None
+                if cached is not None:
+                    results[query] = cached
+    missing = [query for query in dict.fromkeys(queries) if query not in results]
+    if not missing:
+        return results
+
+    fetched = await retriever_class.search_many(missing, max_results, query_domains=query_domains, **options)
+    for query, query_results in zip(missing, fetched):
+        results[query] = query_results or []
+        if query_results and query in keys:
+            key, retriever = keys[query]
+            name = cache.retriever_name(retriever)
+            try:
+                cache.put(key, name, query_results, cache.ttl_for(retriever))
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                logger.warning(f"Search results of {name} could not be cached: {e}")
+    return results
@@ -2,12 +2,12 @@
 
 # libraries
 import os
-import requests
-import json
 import logging
 
+from ..base import BaseRetriever
 
-class BingSearch():
+
+class BingSearch(BaseRetriever):
     """
     Bing Search Retriever
     """
@@ -36,7 +36,7 @@ class BingSearch():
                 "Bing API key not found. Please set the BING_API_KEY environment variable.")
         return api_key
 
-    def search(self, max_results=7) -> list[dict[str]]:
+    async def asearch(self, max_results=7) -> list[dict[str]]:
         """
         Searches the query
         Returns:
@@ -58,18 +58,15 @@ class BingSearch():
             "q": self.query,
             "count": max_results,
             "setLang": "en-GB",
-            "textDecorations": False,
+            "textDecorations": "false",
             "textFormat": "HTML",
             "safeSearch": "Strict"
         }
 
-        resp = requests.get(url, headers=headers, params=params)
-
         # Preprocess the results
-        if resp is None:
-            return []
         try:
-            search_results = json.loads(resp.text)
+            resp = await self.http_client.get(url, headers=headers, params=params)
+            search_results = resp.json()
             results = search_results["webPages"]["value"]
         except Exception as e:
             self.logger.error(
@@ -0,0 +1,199 @@
+"""
+Cache of search results shared by all retrievers.
+
+Results are keyed by retriever, normalized query and the search parameters
+(query domains, max results and the retriever's own ``cache_params``), stored in a local SQLite file with a
+per-retriever time to live, and evicted least recently used first once the
+cache holds more than its maximum number of entries.
+"""
+import asyncio
+import functools
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from ..utils.metrics import CacheStats
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    cache_key TEXT PRIMARY KEY,
+    retriever TEXT NOT NULL,
+    results TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_last_used ON results (last_used);
+"""
+
+_caches: dict[str, "SearchCache"] = {}
+_caches_lock = threading.Lock()
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(query.lower().split())
+
+
+def get_search_cache(cfg) -> "SearchCache | None":
+    """The search cache configured by ``cfg``, shared by every run using its file; None when disabled."""
+    if not cfg.search_cache:
+        return None
+    path = os.path.abspath(cfg.search_cache_path)
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = SearchCache(path, max_entries=cfg.search_cache_max_entries)
+        cache = _caches[path]
+    cache.default_ttl = float(cfg.search_cache_ttl_s)
+    cache.ttls = dict(cfg.search_cache_ttls or {})
+    return cache
+
+
+class SearchCache:
+    """On-disk, TTL-bounded LRU cache of search results."""
+
+    def __init__(
+        self,
+        path: str,
+        default_ttl: float = 21600,
+        ttls: Dict[str, float] | None = None,
+        max_entries: int = 10000,
+    ):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.default_ttl = default_ttl
+        # Retriever name (e.g. "arxiv") or "news" -> seconds results stay fresh
+        self.ttls = ttls or {}
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        # (event loop, cache key) -> search in flight, so identical concurrent searches run once
+        self._inflight: dict[tuple[asyncio.AbstractEventLoop, str], asyncio.Future] = {}
+
+    @staticmethod
+    def retriever_name(retriever: Any) -> str:
+        return type(retriever).__name__
+
+    def key_for(self, retriever: Any, max_results: int | None) -> str | None:
+        """Cache key of a search, or None if the retriever's searches are not cacheable."""
+        name = self.retriever_name(retriever)
+        query = getattr(retriever, "query", None)
+        if not isinstance(query, str) or "mcpretriever" in name.lower():
+            return None
+        domains = sorted(domain.lower() for domain in (getattr(retriever, "query_domains", None) or []))
+        params = retriever.cache_params() if hasattr(retriever, "cache_params") else {}
+        raw = json.dumps([name, normalize_query(query), domains, max_results, params], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def ttl_for(self, retriever: Any) -> float:
+        """Seconds the retriever's results stay fresh: its TTLS entry ("news" for news topics), else the default."""
+        if getattr(retriever, "topic", None) == "news" and "news" in self.ttls:
+            return float(self.ttls["news"])
+        name = self.retriever_name(retriever).lower()
+        for key, ttl in self.ttls.items():
+            if name.startswith(key.lower().replace("_", "")):
+                return float(ttl)
+        return float(self.default_ttl)
+
+    def get(self, key: str, retriever_name: str) -> List[Dict[str, Any]] | None:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT results, expires_at FROM results WHERE cache_key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                outcome, results = "miss", None
+            elif row[1] <= now:
+                self._conn.execute("DELETE FROM results WHERE cache_key = ?", (key,))
+                self._conn.commit()
+                outcome, results = "expired", None
+            else:
+                self._conn.execute("UPDATE results SET last_used = ? WHERE cache_key = ?", (now, key))
+                self._conn.commit()
+                outcome, results = "hit", json.loads(row[0])
+        self.stats.record(retriever_name, outcome)
+        return results
+
+    def put(self, key: str, retriever_name: str, results: List[Dict[str, Any]], ttl: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (cache_key, retriever, results, expires_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, retriever_name, json.dumps(results, default=str), now + ttl, now),
+            )
+            # Evict the least recently used entries beyond the maximum size
+            self._conn.execute(
+                "DELETE FROM results WHERE cache_key IN ("
+                "SELECT cache_key FROM results ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def cached_search(search: Callable[..., Awaitable[List[Dict[str, Any]]]]):
+    """
+    Caches a ``search(retriever, max_results)`` coroutine function in the
+    ``SearchCache`` passed as ``cache``; without one every search runs.
+
+    Identical searches already in flight are awaited instead of repeated.
+    Empty results and failures are not cached.
+    """
+
+    @functools.wraps(search)
+    async def wrapper(retriever: Any, max_results: int | None = None, cache: SearchCache | None = None):
+        key = cache.key_for(retriever, max_results) if cache is not None else None
+        if key is None:
+            return await search(retriever, max_results)
+
+        name = cache.retriever_name(retriever)
+        loop = asyncio.get_running_loop()
+        if (loop, key) in cache._inflight:
+            # None when the search in flight failed; then this caller searches itself
+            results = await asyncio.shield(cache._inflight[(loop, key)])
+            if results is not None:
+                cache.stats.record(name, "hit")
+                return results
+            return await search(retriever, max_results)
+        try:
+            results = cache.get(key, name)
+        except sqlite3.Error as e:
+            logger.warning(f"Search cache lookup failed: {e}")
+            return await search(retriever, max_results)
+        if results is not None:
+            return results
+
+        future = loop.create_future()
+        cache._inflight[(loop, key)] = future
+        results = None
+        try:
+            results = await search(retriever, max_results)
+        finally:
+            cache._inflight.pop((loop, key), None)
+            future.set_result(results)
+
+        if results:
+            try:
+                cache.put(key, name, results, cache.ttl_for(retriever))
+            except (sqlite3.Error, TypeError, ValueError) as e:
+                logger.warning(f"Search results of {name} could not be cached: {e}")
+        return results
+
+    return wrapper
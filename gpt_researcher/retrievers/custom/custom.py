@@ -1,9 +1,12 @@
 from typing import Any, Dict, List, Optional
-import requests
 import os
 
+import httpx
 
-class CustomRetriever:
+from ..base import BaseRetriever
+
+
+class CustomRetriever(BaseRetriever):
     """
     Custom API Retriever
     """
@@ -16,6 +19,9 @@ class CustomRetriever:
         self.params = self._populate_params()
         self.query = query
 
+    def cache_params(self) -> Dict[str, Any]:
+        return {"endpoint": self.endpoint, "params": self.params}
+
     def _populate_params(self) -> Dict[str, Any]:
         """
         Populates parameters from environment variables prefixed with 'RETRIEVER_ARG_'
@@ -26,7 +32,7 @@ class CustomRetriever:
             if key.startswith('RETRIEVER_ARG_')
         }
 
-    def search(self, max_results: int = 5) -> Optional[List[Dict[str, Any]]]:
+    async def asearch(self, max_results: int = 5) -> Optional[List[Dict[str, Any]]]:
         """
         Performs the search using the custom retriever endpoint.
 
@@ -44,9 +50,9 @@ class CustomRetriever:
             ]
         """
         try:
-            response = requests.get(self.endpoint, params={**self.params, 'query': self.query})
+            response = await self.http_client.get(self.endpoint, params={**self.params, 'query': self.query})
             response.raise_for_status()
             return response.json()
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"Failed to retrieve search results: {e}")
             return None
\ No newline at end of file
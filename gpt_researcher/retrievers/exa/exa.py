@@ -1,3 +1,4 @@
+import asyncio
 import os
 from ..utils import check_pkg
 
@@ -65,6 +66,20 @@ class ExaSearch:
         ]
         return search_response
 
+    async def asearch(
+        self, max_results=10, use_autoprompt=False, search_type="neural", **filters
+    ):
+        """
+        Async variant of ``search``; the Exa SDK is blocking, so it runs in a worker thread.
+        """
+        return await asyncio.to_thread(
+            self.search,
+            max_results=max_results,
+            use_autoprompt=use_autoprompt,
+            search_type=search_type,
+            **filters
+        )
+
     def find_similar(self, url, exclude_source_domain=False, **filters):
         """
         Finds similar documents to the provided URL using the Exa API.
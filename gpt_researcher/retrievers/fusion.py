@@ -0,0 +1,136 @@
+"""
+Fusion of the ranked result lists of several retrievers.
+
+Results are grouped by canonical URL so that near-duplicates (tracking
+parameters, fragments, ``www.``/``m.`` hosts, AMP variants, http vs https)
+count as one source, ranked with reciprocal rank fusion, and trimmed to a
+scrape budget with a per-domain diversity cap.
+"""
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Rank smoothing constant of reciprocal rank fusion (Cormack et al., 2009)
+RRF_K = 60
+
+TRACKING_PARAMS = {
+    "gclid", "dclid", "fbclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "_ga", "_gl", "ref_src", "spm", "cmpid", "ocid", "amp",
+}
+TRACKING_PREFIXES = ("utm_", "pk_", "mtm_")
+HOST_PREFIXES = ("www.", "m.", "amp.")
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
+
+
+def strip_tracking(url: str) -> str:
+    """The URL without its fragment and tracking query parameters."""
+    parts = urlsplit(url)
+    params = parse_qsl(parts.query, keep_blank_values=True)
+    query = [(key, value) for key, value in params if not _is_tracking_param(key)]
+    # Leave the query string untouched unless something was removed from it
+    query_string = urlencode(query) if len(query) < len(params) else parts.query
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, query_string, ""))
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    A comparison key for a URL; not meant to be fetched.
+
+    Drops the scheme, fragment, tracking parameters, default ports, host
+    prefixes such as ``www.``, AMP path variants and trailing slashes, and
+    sorts the remaining query parameters.
+    """
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    if parts.port not in (None, 80, 443):
+        host += f":{parts.port}"
+
+    segments = [segment for segment in parts.path.split("/") if segment]
+    if segments and segments[0].lower() == "amp":
+        segments = segments[1:]
+    if segments and segments[-1].lower() in ("amp", "amp.html"):
+        segments = segments[:-1]
+    if segments:
+        last = segments[-1]
+        for suffix in (".amp.html", ".amp"):
+            if last.lower().endswith(suffix):
+                segments[-1] = last[: -len(suffix)] + (".html" if suffix == ".amp.html" else "")
+                break
+    path = "/" + "/".join(segments)
+
+    query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                   if not _is_tracking_param(key))
+    return host + path + (f"?{urlencode(query)}" if query else "")
+
+
+def reciprocal_rank_fusion(ranked_lists: Iterable[List[Dict[str, Any]]], k: int = RRF_K) -> List[Dict[str, Any]]:
+    """
+    Merges ranked search result lists into one list ordered by RRF score.
+
+    Each fused result keeps the cleaned ``href`` of its best-ranked
+    occurrence, the longest ``body``, first ``title`` and any full-text
+    ``raw_content`` seen, its ``canonical`` URL, ``score`` and the number of
+    lists (``votes``) it appeared in.
+    """
+    fused: Dict[str, Dict[str, Any]] = {}
+    best_rank: Dict[str, int] = defaultdict(lambda: 1 << 30)
+    for ranked in ranked_lists:
+        seen = set()
+        for rank, result in enumerate(ranked or [], start=1):
+            href = result.get("href")
+            if not href:
+                continue
+            canonical = canonicalize_url(href)
+            if canonical in seen:
+                continue
+            seen.add(canonical)
+
+            entry = fused.setdefault(canonical, {
+                "href": strip_tracking(href), "title": result.get("title", ""), "body": "",
+                "canonical": canonical, "score": 0.0, "votes": 0,
+            })
+            entry["score"] += 1.0 / (k + rank)
+            entry["votes"] += 1
+            if rank < best_rank[canonical]:
+                best_rank[canonical] = rank
+                entry["href"] = strip_tracking(href)
+            body = result.get("body") or ""
+            if len(body) > len(entry["body"]):
+                entry["body"] = body
+            entry["title"] = entry["title"] or result.get("title", "")
+            if result.get("raw_content") and not entry.get("raw_content"):
+                entry["raw_content"] = result["raw_content"]
+
+    # Ties keep first-seen order, i.e. the primary retriever's order
+    return sorted(fused.values(), key=lambda entry: entry["score"], reverse=True)
+
+
+def select_within_budget(
+    fused: List[Dict[str, Any]],
+    budget: int,
+    max_per_domain: int | None = None,
+) -> List[Dict[str, Any]]:
+    """
+    Takes fused results in rank order, at most ``max_per_domain`` per domain,
+    until ``budget`` results are selected. A budget or cap of 0 (or None)
+    means no limit.
+    """
+    selected = []
+    per_domain: Dict[str, int] = defaultdict(int)
+    for entry in fused:
+        if budget and len(selected) >= budget:
+            break
+        domain = entry["canonical"].split("/", 1)[0]
+        if max_per_domain and per_domain[domain] >= max_per_domain:
+            continue
+        per_domain[domain] += 1
+        selected.append(entry)
+    return selected
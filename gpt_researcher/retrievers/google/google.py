@@ -2,11 +2,11 @@
 
 # libraries
 import os
-import requests
-import json
 
+from ..base import BaseRetriever
 
-class GoogleSearch:
+
+class GoogleSearch(BaseRetriever):
     """
     Google API Retriever
     """
@@ -22,6 +22,10 @@ class GoogleSearch:
         self.api_key = self.headers.get("google_api_key") or self.get_api_key()  # Use the passed api_key or fallback to environment variable
         self.cx_key = self.headers.get("google_cx_key") or self.get_cx_key()  # Use the passed cx_key or fallback to environment variable
 
+    def cache_params(self):
+        # The custom search engine searched
+        return {"cx": self.cx_key}
+
     def get_api_key(self):
         """
         Gets the Google API key
@@ -50,7 +54,7 @@ class GoogleSearch:
                             "You can get a key at https://developers.google.com/custom-search/v1/overview")
         return api_key
 
-    def search(self, max_results=7):
+    async def asearch(self, max_results=7):
         """
         Searches the query using Google Custom Search API, optionally restricting to specific domains
         Returns:
@@ -64,16 +68,18 @@ class GoogleSearch:
 
         print("Searching with query {0}...".format(search_query))
 
-        url = f"https://www.googleapis.com/customsearch/v1?key={self.api_key}&cx={self.cx_key}&q={search_query}&start=1"
-        resp = requests.get(url)
+        url = "https://www.googleapis.com/customsearch/v1"
+        params = {"key": self.api_key, "cx": self.cx_key, "q": search_query, "start": 1}
+        try:
+            resp = await self.http_client.get(url, params=params)
+        except Exception:
+            return
 
         if resp.status_code < 200 or resp.status_code >= 300:
             print("Google search: unexpected response status: ", resp.status_code)
 
-        if resp is None:
-            return
         try:
-            search_results = json.loads(resp.text)
+            search_results = resp.json()
         except Exception:
             return
         if search_results is None:
@@ -20,6 +20,7 @@ from ...mcp.client import MCPClientManager
 from ...mcp.tool_selector import MCPToolSelector
 from ...mcp.research import MCPResearchSkill
 from ...mcp.streaming import MCPStreamer
+from ...utils.budget import bounded_timeout
 
 logger = logging.getLogger(__name__)
 
@@ -280,10 +281,15 @@ class MCPRetriever:
                             except Exception:
                                 pass  # Ignore close errors
                 
-                # Run in a thread pool to avoid blocking the main event loop
-                with concurrent.futures.ThreadPoolExecutor() as executor:
+                # Run in a thread pool to avoid blocking the main event loop.
+                # 5 minute timeout, or less when the research deadline is closer;
+                # a timed-out search is left to finish in the background
+                executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+                try:
                     future = executor.submit(run_in_thread)
-                    results = future.result(timeout=300)  # 5 minute timeout
+                    results = future.result(timeout=bounded_timeout(300))
+                finally:
+                    executor.shutdown(wait=False)
                     
             except RuntimeError:
                 # No event loop is running, we can run directly
@@ -1,10 +1,11 @@
+import asyncio
 import os
 import xml.etree.ElementTree as ET
 
-import requests
+from ..base import BaseRetriever
 
 
-class PubMedCentralSearch:
+class PubMedCentralSearch(BaseRetriever):
     """
     PubMed Central API Retriever
     """
@@ -35,9 +36,11 @@ class PubMedCentralSearch:
             )
         return api_key
 
-    def search(self, max_results=10):
+    async def asearch(self, max_results=10):
         """
         Searches the query using the PubMed Central API.
+
+        The full texts of the matching articles are fetched concurrently.
         Args:
             max_results: The maximum number of results to return.
         Returns:
@@ -53,7 +56,7 @@ class PubMedCentralSearch:
             "retmode": "json",
             "sort": "relevance"
         }
-        response = requests.get(base_url, params=params)
+        response = await self.http_client.get(base_url, params=params)
 
         if response.status_code != 200:
             raise Exception(
@@ -62,10 +65,10 @@ class PubMedCentralSearch:
 
         results = response.json()
         ids = results["esearchresult"]["idlist"]
+        xml_contents = await asyncio.gather(*[self.fetch([article_id]) for article_id in ids])
 
         search_response = []
-        for article_id in ids:
-            xml_content = self.fetch([article_id])
+        for article_id, xml_content in zip(ids, xml_contents):
             if self.has_body_content(xml_content):
                 article_data = self.parse_xml(xml_content)
                 if article_data:
@@ -81,7 +84,7 @@ class PubMedCentralSearch:
 
         return search_response
 
-    def fetch(self, ids):
+    async def fetch(self, ids):
         """
         Fetches the full text content for given article IDs.
         Args:
@@ -96,7 +99,7 @@ class PubMedCentralSearch:
             "retmode": "xml",
             "api_key": self.api_key,
         }
-        response = requests.get(base_url, params=params)
+        response = await self.http_client.get(base_url, params=params)
 
         if response.status_code != 200:
             raise Exception(
@@ -2,11 +2,11 @@
 
 # libraries
 import os
-import requests
-import urllib.parse
 
+from ..base import BaseRetriever
 
-class SearchApiSearch():
+
+class SearchApiSearch(BaseRetriever):
     """
     SearchApi Retriever
     """
@@ -32,7 +32,7 @@ class SearchApiSearch():
                             "You can get a key at https://www.searchapi.io/")
         return api_key
 
-    def search(self, max_results=7):
+    async def asearch(self, max_results=7):
         """
         Searches the query
         Returns:
@@ -54,11 +54,10 @@ class SearchApiSearch():
             'X-SearchApi-Source': 'gpt-researcher'
         }
 
-        encoded_url = url + "?" + urllib.parse.urlencode(params)
         search_response = []
 
         try:
-            response = requests.get(encoded_url, headers=headers, timeout=20)
+            response = await self.http_client.get(url, params=params, headers=headers, timeout=20)
             if response.status_code == 200:
                 search_results = response.json()
                 if search_results:
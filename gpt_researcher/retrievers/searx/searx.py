@@ -1,11 +1,14 @@
 import os
 import json
-import requests
 from typing import List, Dict
 from urllib.parse import urljoin
 
+import httpx
 
-class SearxSearch():
+from ..base import BaseRetriever
+
+
+class SearxSearch(BaseRetriever):
     """
     SearxNG API Retriever
     """
@@ -19,6 +22,9 @@ class SearxSearch():
         self.query_domains = query_domains or None
         self.base_url = self.get_searxng_url()
 
+    def cache_params(self) -> Dict[str, str]:
+        return {"base_url": self.base_url}
+
     def get_searxng_url(self) -> str:
         """
         Gets the SearxNG instance URL from environment variables
@@ -36,7 +42,7 @@ class SearxSearch():
                 "You can find public instances at https://searx.space/"
             )
 
-    def search(self, max_results: int = 10) -> List[Dict[str, str]]:
+    async def asearch(self, max_results: int = 10) -> List[Dict[str, str]]:
         """
         Searches the query using SearxNG API
         Args:
@@ -54,7 +60,7 @@ class SearxSearch():
         }
 
         try:
-            response = requests.get(
+            response = await self.http_client.get(
                 search_url,
                 params=params,
                 headers={'Accept': 'application/json'}
@@ -72,7 +78,7 @@ class SearxSearch():
 
             return search_response
 
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             raise Exception(f"Error querying SearxNG: {str(e)}")
         except json.JSONDecodeError:
             raise Exception("Error parsing SearxNG response")
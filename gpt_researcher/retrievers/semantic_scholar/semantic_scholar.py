@@ -1,9 +1,11 @@
 from typing import Dict, List
 
-import requests
+import httpx
 
+from ..base import BaseRetriever
 
-class SemanticScholarSearch:
+
+class SemanticScholarSearch(BaseRetriever):
     """
     Semantic Scholar API Retriever
     """
@@ -22,7 +24,10 @@ class SemanticScholarSearch:
         assert sort in self.VALID_SORT_CRITERIA, "Invalid sort criterion"
         self.sort = sort.lower()
 
-    def search(self, max_results: int = 20) -> List[Dict[str, str]]:
+    def cache_params(self) -> Dict[str, str]:
+        return {"sort": self.sort}
+
+    async def asearch(self, max_results: int = 20) -> List[Dict[str, str]]:
         """
         Perform the search on Semantic Scholar and return results.
 
@@ -37,9 +42,9 @@ class SemanticScholarSearch:
         }
 
         try:
-            response = requests.get(self.BASE_URL, params=params)
+            response = await self.http_client.get(self.BASE_URL, params=params)
             response.raise_for_status()
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
             print(f"An error occurred while accessing Semantic Scholar API: {e}")
             return []
 
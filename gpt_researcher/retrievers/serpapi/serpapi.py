@@ -2,11 +2,11 @@
 
 # libraries
 import os
-import requests
-import urllib.parse
 
+from ..base import BaseRetriever
 
-class SerpApiSearch():
+
+class SerpApiSearch(BaseRetriever):
     """
     SerpApi Retriever
     """
@@ -33,7 +33,7 @@ class SerpApiSearch():
                             "You can get a key at https://serpapi.com/")
         return api_key
 
-    def search(self, max_results=7):
+    async def asearch(self, max_results=7):
         """
         Searches the query
         Returns:
@@ -53,10 +53,9 @@ class SerpApiSearch():
             "q": search_query,
             "api_key": self.api_key
         }
-        encoded_url = url + "?" + urllib.parse.urlencode(params)
         search_response = []
         try:
-            response = requests.get(encoded_url, timeout=10)
+            response = await self.http_client.get(url, params=params, timeout=10)
             if response.status_code == 200:
                 search_results = response.json()
                 if search_results:
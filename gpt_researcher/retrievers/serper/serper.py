@@ -2,14 +2,20 @@
 
 # libraries
 import os
-import requests
-import json
 
+from ..base import BaseRetriever
 
-class SerperSearch():
+SERPER_URL = "https://google.serper.dev/search"
+# Maximum number of searches Serper accepts in one request
+SERPER_BATCH_SIZE = 100
+
+
+class SerperSearch(BaseRetriever):
     """
     Google Serper Retriever with support for country, language, and date filtering
     """
+    native_search_many = True
+
     def __init__(self, query, query_domains=None, country=None, language=None, time_range=None, exclude_sites=None):
         """
         Initializes the SerperSearch object
@@ -29,6 +35,14 @@ class SerperSearch():
         self.exclude_sites = exclude_sites or self._get_exclude_sites_from_env()
         self.api_key = self.get_api_key()
 
+    def cache_params(self):
+        return {
+            "country": self.country,
+            "language": self.language,
+            "time_range": self.time_range,
+            "exclude_sites": sorted(self.exclude_sites),
+        }
+
     def _get_exclude_sites_from_env(self):
         """
         Gets the list of sites to exclude from environment variables
@@ -54,23 +68,11 @@ class SerperSearch():
                             "You can get a key at https://serper.dev/")
         return api_key
 
-    def search(self, max_results=7):
+    def _search_params(self, max_results):
         """
-        Searches the query with optional country, language, and time filtering
-        Returns:
-            list: List of search results with title, href, and body
+        Builds the Serper request body of the query, with its site exclusions,
+        domain filter, country, language and time range.
         """
-        print("Searching with query {0}...".format(self.query))
-        """Useful for general internet search queries using the Serper API."""
-
-        # Search the query (see https://serper.dev/playground for the format)
-        url = "https://google.serper.dev/search"
-
-        headers = {
-            'X-API-KEY': self.api_key,
-            'Content-Type': 'application/json'
-        }
-
         # Build search parameters
         query_with_filters = self.query
 
@@ -100,31 +102,76 @@ class SerperSearch():
         if self.time_range:
             search_params["tbs"] = self.time_range  # Time-based search
 
-        data = json.dumps(search_params)
+        return search_params
 
-        resp = requests.request("POST", url, timeout=10, headers=headers, data=data)
+    def _headers(self):
+        return {
+            'X-API-KEY': self.api_key,
+            'Content-Type': 'application/json'
+        }
 
-        # Preprocess the results
-        if resp is None:
-            return
+    @staticmethod
+    def _normalize_results(search_results):
+        """Normalizes a Serper response to the format of the other search APIs."""
+        if not search_results:
+            return []
+        # Excluded sites should already be filtered out by the query parameters
+        return [
+            {
+                "title": result["title"],
+                "href": result["link"],
+                "body": result["snippet"],
+            }
+            for result in search_results.get("organic", [])
+        ]
+
+    async def asearch(self, max_results=7):
+        """
+        Searches the query with optional country, language, and time filtering
+        Returns:
+            list: List of search results with title, href, and body
+        """
+        print("Searching with query {0}...".format(self.query))
+        """Useful for general internet search queries using the Serper API."""
+
+        # Search the query (see https://serper.dev/playground for the format)
         try:
-            search_results = json.loads(resp.text)
+            resp = await self.http_client.post(
+                SERPER_URL, timeout=10, headers=self._headers(), json=self._search_params(max_results)
+            )
+            search_results = resp.json()
         except Exception:
             return
         if search_results is None:
             return
 
-        results = search_results.get("organic", [])
-        search_results = []
+        return self._normalize_results(search_results)
 
-        # Normalize the results to match the format of the other search APIs
-        # Excluded sites should already be filtered out by the query parameters
-        for result in results:
-            search_result = {
-                "title": result["title"],
-                "href": result["link"],
-                "body": result["snippet"],
-            }
-            search_results.append(search_result)
-
-        return search_results
+    @classmethod
+    async def search_many(cls, queries, max_results=7, query_domains=None, **options):
+        """
+        Searches several queries with one request, as Serper accepts an array
+        of searches in one POST (up to ``SERPER_BATCH_SIZE`` per request).
+        Returns:
+            list: One list of search results per query, in order; a query whose
+            batch failed gets an empty list
+        """
+        searches = [cls(query, query_domains=query_domains, **options) for query in queries]
+        print("Searching with {0} queries in one batch...".format(len(searches)))
+        results = []
+        for start in range(0, len(searches), SERPER_BATCH_SIZE):
+            batch = searches[start:start + SERPER_BATCH_SIZE]
+            try:
+                resp = await batch[0].http_client.post(
+                    SERPER_URL,
+                    timeout=10,
+                    headers=batch[0]._headers(),
+                    json=[search._search_params(max_results) for search in batch],
+                )
+                responses = resp.json()
+            except Exception:
+                responses = None
+            if not isinstance(responses, list) or len(responses) != len(batch):
+                responses = [None] * len(batch)
+            results.extend(cls._normalize_results(response) for response in responses)
+        return results
@@ -3,16 +3,16 @@
 # libraries
 import os
 from typing import Literal, Sequence, Optional
-import requests
-import json
 
+from ..base import BaseRetriever
 
-class TavilySearch:
+
+class TavilySearch(BaseRetriever):
     """
     Tavily API Retriever
     """
 
-    def __init__(self, query, headers=None, topic="general", query_domains=None):
+    def __init__(self, query, headers=None, topic="general", query_domains=None, include_raw_content=False):
         """
         Initializes the TavilySearch object.
 
@@ -21,6 +21,8 @@ class TavilySearch:
             headers (dict, optional): Additional headers to include in the request. Defaults to None.
             topic (str, optional): The topic for the search. Defaults to "general".
             query_domains (list, optional): List of domains to include in the search. Defaults to None.
+            include_raw_content (bool, optional): Also return the full page text of each result
+                as ``raw_content``. Defaults to False.
         """
         self.query = query
         self.headers = headers or {}
@@ -31,6 +33,10 @@ class TavilySearch:
             "Content-Type": "application/json",
         }
         self.query_domains = query_domains or None
+        self.include_raw_content = include_raw_content
+
+    def cache_params(self):
+        return {"topic": self.topic, "include_raw_content": self.include_raw_content}
 
     def get_api_key(self):
         """
@@ -50,7 +56,7 @@ class TavilySearch:
         return api_key
 
 
-    def _search(
+    async def _search(
         self,
         query: str,
         search_depth: Literal["basic", "advanced"] = "basic",
@@ -83,17 +89,14 @@ class TavilySearch:
             "use_cache": use_cache,
         }
 
-        response = requests.post(
-            self.base_url, data=json.dumps(data), headers=self.headers, timeout=100
+        response = await self.http_client.post(
+            self.base_url, json=data, headers=self.headers, timeout=100
         )
+        # Raises a HTTPStatusError if the HTTP request returned an unsuccessful status code
+        response.raise_for_status()
+        return response.json()
 
-        if response.status_code == 200:
-            return response.json()
-        else:
-            # Raises a HTTPError if the HTTP request returned an unsuccessful status code
-            response.raise_for_status()
-
-    def search(self, max_results=10):
+    async def asearch(self, max_results=10):
         """
         Searches the query
         Returns:
@@ -101,12 +104,13 @@ class TavilySearch:
         """
         try:
             # Search the query
-            results = self._search(
+            results = await self._search(
                 self.query,
                 search_depth="basic",
                 max_results=max_results,
                 topic=self.topic,
                 include_domains=self.query_domains,
+                include_raw_content=self.include_raw_content,
             )
             sources = results.get("results", [])
             if not sources:
@@ -115,6 +119,10 @@ class TavilySearch:
             search_response = [
                 {"href": obj["url"], "body": obj["content"]} for obj in sources
             ]
+            if self.include_raw_content:
+                for result, obj in zip(search_response, sources):
+                    if obj.get("raw_content"):
+                        result["raw_content"] = obj["raw_content"]
         except Exception as e:
             print(f"Error: {e}. Failed fetching sources. Resulting in empty response.")
             search_response = []
@@ -0,0 +1,136 @@
+"""
+Resources shared by every researcher of one request.
+
+A ``ResearchSession`` owns a snapshot of the configuration, one scraping
+executor, one HTTP client, the embedding and LLM clients and the search
+cache. Researchers created inside ``async with ResearchSession(...)`` (and
+the sub-researchers they create for deep research, subtopics or report
+sections) borrow them instead of building their own, so a request holds one
+thread pool and one set of clients however many researchers it runs.
+"""
+import copy
+import json
+from contextvars import ContextVar
+from typing import Any
+
+import httpx
+
+from .config import Config
+from .memory import Memory
+from .retrievers.cache import get_search_cache
+from .utils.workers import WorkerPool
+
+# The session researchers borrow from when not given one explicitly
+_current_session: ContextVar["ResearchSession | None"] = ContextVar("research_session", default=None)
+
+
+def current_session() -> "ResearchSession | None":
+    """The open session of the current context, if any."""
+    session = _current_session.get()
+    return session if session is not None and not session.closed else None
+
+
+def _key(*parts: Any) -> str:
+    return json.dumps(parts, sort_keys=True, default=str)
+
+
+class ResearchSession:
+    """
+    Pooled resources for many ``GPTResearcher`` instances, with an explicit lifecycle.
+
+    Usage::
+
+        async with ResearchSession(config_path) as session:
+            researcher = GPTResearcher(query, config_path=config_path)
+            await researcher.conduct_research()
+
+    Researchers use the session of the enclosing ``async with`` block, or the
+    one passed as ``session=``. Leaving the block shuts down the executor and
+    closes the HTTP client; researchers created from it can still report
+    their results but no longer scrape or search.
+    """
+
+    def __init__(self, config_path: str | None = None):
+        self.config_path = config_path or None
+        self._config = Config(self.config_path)
+        self.worker_pool = WorkerPool(self._config.max_scraper_workers)
+        self.search_cache = get_search_cache(self._config)
+        self.closed = False
+        self._http_client: httpx.AsyncClient | None = None
+        # (provider, model, kwargs) -> embedding client
+        self._memories: dict[str, Memory] = {}
+        # (provider, kwargs) -> LangChain chat model
+        self._llms: dict[str, Any] = {}
+        self._token = None
+
+    async def __aenter__(self) -> "ResearchSession":
+        self._check_open()
+        self._token = _current_session.set(self)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        if self._token is not None:
+            _current_session.reset(self._token)
+            self._token = None
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Shuts down the executor and closes the HTTP client; the session cannot be used again."""
+        if self.closed:
+            return
+        self.closed = True
+        self.worker_pool.executor.shutdown(wait=False, cancel_futures=True)
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        self._memories.clear()
+        self._llms.clear()
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise RuntimeError("ResearchSession is closed")
+
+    def serves(self, config_path: str | None) -> bool:
+        """Whether a researcher with ``config_path`` can use this session's configuration."""
+        return (config_path or None) == self.config_path
+
+    def config(self) -> Config:
+        """A copy of the configuration snapshot, which the borrowing researcher may modify."""
+        self._check_open()
+        return copy.deepcopy(self._config)
+
+    def memory(self, embedding_provider: str, model: str, **embedding_kwargs: Any) -> Memory:
+        """The session's embedding client for the provider and model, created on first use."""
+        self._check_open()
+        key = _key(embedding_provider, model, embedding_kwargs)
+        if key not in self._memories:
+            self._memories[key] = Memory(embedding_provider, model, **embedding_kwargs)
+        return self._memories[key]
+
+    def llm(self, llm_provider: str, **kwargs: Any):
+        """
+        An LLM provider whose chat model (and its connection pool) is shared by
+        every call with the same arguments. The provider wrapper is new on each
+        call, so concurrent calls keep their own token usage.
+        """
+        from .llm_provider import GenericLLMProvider
+
+        self._check_open()
+        key = _key(llm_provider, kwargs)
+        if key not in self._llms:
+            provider = GenericLLMProvider.from_provider(llm_provider, **kwargs)
+            self._llms[key] = provider.llm
+            return provider
+        return GenericLLMProvider(
+            self._llms[key],
+            chat_log=kwargs.get("chat_log"),
+            verbose=kwargs.get("verbose", True),
+            provider=llm_provider,
+        )
+
+    def http_client(self, factory) -> httpx.AsyncClient:
+        """The session's HTTP client, created with ``factory`` on first use."""
+        self._check_open()
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = factory()
+        return self._http_client
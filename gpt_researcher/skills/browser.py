@@ -1,8 +1,13 @@
+import asyncio
+from functools import partial
+
 from gpt_researcher.utils.workers import WorkerPool
 
 from ..actions.utils import stream_output
 from ..actions.web_scraping import scrape_urls
 from ..scraper.utils import get_image_hash
+from ..utils.budget import time_left
+from .page_pool import PagePool
 
 
 class BrowserManager:
@@ -10,7 +15,96 @@ class BrowserManager:
 
     def __init__(self, researcher):
         self.researcher = researcher
-        self.worker_pool = WorkerPool(researcher.cfg.max_scraper_workers)
+        session = getattr(researcher, "session", None)
+        # Researchers of one session share its executor instead of starting a thread pool each
+        self.worker_pool = session.worker_pool if session is not None else WorkerPool(researcher.cfg.max_scraper_workers)
+        # Per-URL scrapes and pages shared by every sub-query of the run
+        self.page_pool = PagePool(researcher)
+
+    def _start_scrapes(self, urls: list[str]) -> None:
+        """
+        Starts a scrape of its own for each URL without a scrape in flight or done,
+        so each page is available as soon as it is scraped.
+
+        Pages the run checkpointed before an interruption are restored instead
+        of scraped again, and newly scraped pages are checkpointed.
+        """
+        checkpoint = self.researcher.checkpoint
+
+        async def pages_of(url):
+            if not (pages := checkpoint.get_pages(url)):
+                content, _ = await scrape_urls([url], self.researcher.cfg, self.worker_pool)
+                pages = [page for page in content if page.get("url") == url]
+                if pages:
+                    checkpoint.put_pages(url, pages)
+            return pages, [image for page in pages for image in page.get("image_urls", [])]
+
+        for url in dict.fromkeys(urls):
+            if url and url not in self.page_pool:
+                self.page_pool.scrape(url, partial(pages_of, url))
+
+    def prefetch_urls(self, urls: list[str]) -> None:
+        """
+        Start scraping URLs in the background before they are requested.
+
+        Results are held until ``browse_urls`` claims them, so prefetched pages
+        are only added to the research sources once they are actually used.
+
+        Args:
+            urls (list[str]): list of URLs to scrape speculatively.
+        """
+        self._start_scrapes(urls)
+
+    async def _scrape(self, urls: list[str], index: bool = True) -> tuple[list[dict], list[dict]]:
+        """
+        Scrape URLs, reusing any scrapes of the same URLs already in flight or done.
+
+        With SHARED_PAGE_POOL the pages are also indexed into the run's page pool
+        unless ``index`` is False.
+        """
+        urls = [url for url in urls if url]
+        self._start_scrapes(urls)
+        scrapes = {url: self.page_pool.get(url) for url in urls}
+        if scrapes and (timeout := time_left()) is not None:
+            # Pages still loading at the run's research deadline are left out;
+            # their scrapes keep running in the pool
+            done, pending = await asyncio.wait(set(scrapes.values()), timeout=timeout)
+            if pending:
+                self.researcher.run_controller.record_drop("scrapes", len(pending))
+            urls = [url for url in urls if scrapes[url] in done]
+        results = await asyncio.gather(*[scrapes[url] for url in urls], return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        # Scrapes cancelled once research saturated are left out
+        results = [result for result in results if not isinstance(result, asyncio.CancelledError)]
+        if index and self.researcher.cfg.shared_page_pool:
+            await self.page_pool.index(urls)
+
+        scraped_content, images = [], []
+        for content, content_images in results:
+            scraped_content.extend(content)
+            images.extend(content_images)
+        return scraped_content, images
+
+    def cancel_pending(self) -> int:
+        """Cancels every scrape still in flight, prefetched or claimed, and returns how many URLs it left unscraped."""
+        return self.page_pool.cancel_pending()
+
+    async def scrape_url(self, url: str) -> tuple[list[dict], list[dict]]:
+        """
+        Scrape a single URL without recording sources or images.
+
+        Used by the research pipeline, which records and ranks pages itself as
+        they pass its parse and rank stages.
+
+        Args:
+            url (str): URL to scrape.
+
+        Returns:
+            tuple[list[dict], list[dict]]: scraped content and candidate images.
+        """
+        return await self._scrape([url], index=False)
 
     async def browse_urls(self, urls: list[str]) -> list[dict]:
         """
@@ -30,9 +124,7 @@ class BrowserManager:
                 self.researcher.websocket,
             )
 
-        scraped_content, images = await scrape_urls(
-            urls, self.researcher.cfg, self.worker_pool
-        )
+        scraped_content, images = await self._scrape(urls)
         self.researcher.add_research_sources(scraped_content)
         new_images = self.select_top_images(images, k=4)  # Select top 4 images
         self.researcher.add_research_images(new_images)
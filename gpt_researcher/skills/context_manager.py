@@ -27,9 +27,22 @@ class ContextManager:
             **self.researcher.kwargs
         )
         return await context_compressor.async_get_context(
-            query=query, max_results=10, cost_callback=self.researcher.add_costs
+            query=query, max_results=10, cost_callback=self.researcher.stage_cost_callback("compression")
         )
 
+    async def get_similar_content_from_page_pool(self, query, max_results: int = 10):
+        """Ranks every page scraped so far in the run, not only the caller's, against the query."""
+        if self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "fetching_query_content",
+                f"📚 Getting relevant content based on query: {query}...",
+                self.researcher.websocket,
+            )
+
+        docs = await self.researcher.scraper_manager.page_pool.rank(query, max_results=max_results)
+        return self.researcher.prompt_family.pretty_print_docs(docs, max_results)
+
     async def get_similar_content_by_query_with_vectorstore(self, query, filter):
         if self.researcher.verbose:
             await stream_output(
@@ -83,5 +96,5 @@ class ContextManager:
             **self.researcher.kwargs
         )
         return await written_content_compressor.async_get_context(
-            query=query, max_results=max_results, cost_callback=self.researcher.add_costs
+            query=query, max_results=max_results, cost_callback=self.researcher.stage_cost_callback("compression")
         )
@@ -1,9 +1,112 @@
-from typing import Dict, Optional, List
+from datetime import date
+from typing import Any, Dict, Optional, List
+from urllib.parse import urlparse
+import asyncio
+import functools
 import json
-from ..config.config import Config
+import re
+
+import json_repair
+import numpy as np
+
+from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
+from ..utils.costs import estimate_embedding_cost
 from ..utils.llm import create_chat_completion
+from ..utils.cascade import cascade_chat_completion, score_json_list
 from ..actions import stream_output
 
+# Reputation (0-1) of well-known domains and domain suffixes; unknown domains score 0.5
+DOMAIN_REPUTATION = {
+    ".gov": 1.0,
+    ".edu": 1.0,
+    ".int": 0.9,
+    "who.int": 1.0,
+    "nature.com": 1.0,
+    "science.org": 1.0,
+    "nih.gov": 1.0,
+    "arxiv.org": 0.9,
+    "acm.org": 0.9,
+    "ieee.org": 0.9,
+    "springer.com": 0.9,
+    "sciencedirect.com": 0.9,
+    "reuters.com": 0.9,
+    "apnews.com": 0.9,
+    "bbc.co.uk": 0.8,
+    "bbc.com": 0.8,
+    "nytimes.com": 0.8,
+    "ft.com": 0.8,
+    "economist.com": 0.8,
+    "wikipedia.org": 0.7,
+    "github.com": 0.7,
+    "medium.com": 0.4,
+    "reddit.com": 0.3,
+    "quora.com": 0.2,
+    "pinterest.com": 0.1,
+}
+
+# Weights of the local pre-ranking signals
+RELEVANCE_WEIGHT = 0.6
+REPUTATION_WEIGHT = 0.2
+FRESHNESS_WEIGHT = 0.2
+# Cosine similarity above which a source duplicates a higher-ranked one
+DUPLICATE_SIMILARITY = 0.95
+# Characters of each source embedded and shown to the LLM judge
+MAX_SOURCE_CHARS = 2000
+# LLM judge scores (0-10) at or above which a borderline source is kept
+JUDGE_KEEP_SCORE = 5
+
+_SOURCE_START = re.compile(r"^Source: ", re.MULTILINE)
+_YEAR = re.compile(r"\b(?:19|20)\d{2}\b")
+
+
+def domain_reputation(url: str) -> float:
+    """Reputation of the URL's domain from ``DOMAIN_REPUTATION``, most specific match first."""
+    host = (urlparse(url).hostname or "").lower().removeprefix("www.")
+    if not host:
+        return 0.5
+    for domain, reputation in sorted(DOMAIN_REPUTATION.items(), key=lambda item: -len(item[0])):
+        if domain.startswith("."):
+            if host.endswith(domain):
+                return reputation
+        elif host == domain or host.endswith("." + domain):
+            return reputation
+    return 0.5
+
+
+def freshness(text: str, today: date | None = None) -> float:
+    """1.0 for content mentioning the current year, decaying over a decade; 0.5 without any year."""
+    this_year = (today or date.today()).year
+    years = [int(year) for year in _YEAR.findall(text) if int(year) <= this_year]
+    if not years:
+        return 0.5
+    return max(0.0, 1.0 - (this_year - max(years)) / 10)
+
+
+def split_sources(source_data: Any) -> List[Any]:
+    """The individual sources of research data: list items, or the 'Source: ' blocks of a context string."""
+    if isinstance(source_data, list):
+        return source_data
+    if not isinstance(source_data, str):
+        return [source_data]
+    starts = [match.start() for match in _SOURCE_START.finditer(source_data)]
+    if not starts:
+        return [source_data]
+    bounds = [0] + starts[1:] + [len(source_data)] if starts[0] > 0 else starts + [len(source_data)]
+    return [block for start, end in zip(bounds, bounds[1:]) if (block := source_data[start:end].strip())]
+
+
+def _source_text(source: Any) -> str:
+    if isinstance(source, dict):
+        return str(source.get("raw_content") or source.get("content") or source.get("body") or source)
+    return str(source)
+
+
+def _source_url(source: Any) -> str:
+    if isinstance(source, dict):
+        return str(source.get("url") or source.get("href") or "")
+    match = re.search(r"^Source: (\S+)", str(source), re.MULTILINE)
+    return match.group(1) if match else ""
+
 
 class SourceCurator:
     """Ranks sources and curates data based on their relevance, credibility and reliability."""
@@ -19,54 +122,34 @@ class SourceCurator:
         """
         Rank sources based on research data and guidelines.
 
+        Sources are first ranked locally by embedding relevance to the query,
+        domain reputation and freshness, and near duplicates are dropped. The
+        top half of ``max_results`` is kept outright; only the borderline
+        sources ranked below it are judged by the LLM, in parallel batches of
+        ``CURATION_BATCH_SIZE``. Sources keep their original content.
+
         Args:
-            query: The research query/task
-            source_data: List of source documents to rank
+            source_data: Research context string of 'Source: ' blocks, or list of source documents
             max_results: Maximum number of top sources to return
 
         Returns:
-            str: Ranked list of source URLs with reasoning
+            The curated sources, in the form they were given (string or list), best first
         """
-        print(f"\n\nCurating {len(source_data)} sources: {source_data}")
+        sources = split_sources(source_data)
+        if len(sources) <= 1:
+            return source_data
+
         if self.researcher.verbose:
             await stream_output(
                 "logs",
                 "research_plan",
-                f"⚖️ Evaluating and curating sources by credibility and relevance...",
+                f"⚖️ Evaluating and curating {len(sources)} sources by credibility and relevance...",
                 self.researcher.websocket,
             )
 
-        response = ""
         try:
-            response = await create_chat_completion(
-                model=self.researcher.cfg.smart_llm_model,
-                messages=[
-                    {"role": "system", "content": f"{self.researcher.role}"},
-                    {"role": "user", "content": self.researcher.prompt_family.curate_sources(
-                        self.researcher.query, source_data, max_results)},
-                ],
-                temperature=0.2,
-                max_tokens=8000,
-                llm_provider=self.researcher.cfg.smart_llm_provider,
-                llm_kwargs=self.researcher.cfg.llm_kwargs,
-                cost_callback=self.researcher.add_costs,
-            )
-
-            curated_sources = json.loads(response)
-            print(f"\n\nFinal Curated sources {len(source_data)} sources: {curated_sources}")
-
-            if self.researcher.verbose:
-                await stream_output(
-                    "logs",
-                    "research_plan",
-                    f"🏅 Verified and ranked top {len(curated_sources)} most reliable sources",
-                    self.researcher.websocket,
-                )
-
-            return curated_sources
-
+            ranked = await self._pre_rank(sources)
         except Exception as e:
-            print(f"Error in curate_sources from LLM response: {response}")
             if self.researcher.verbose:
                 await stream_output(
                     "logs",
@@ -75,3 +158,113 @@ class SourceCurator:
                     self.researcher.websocket,
                 )
             return source_data
+
+        confident = ranked[:max(1, max_results // 2)]
+        borderline = ranked[len(confident):max_results * 2]
+        # Out of research budget, borderline sources are kept unjudged
+        judged = await self.researcher.run_controller.within_budget(
+            "curation", functools.partial(self._judge, borderline), [float(JUDGE_KEEP_SCORE)] * len(borderline)
+        )
+        # Deterministic merge: confident sources by local score, then kept borderline ones by judge score
+        kept = [candidate for _, candidate in sorted(
+            ((score, candidate) for candidate, score in zip(borderline, judged) if score >= JUDGE_KEEP_SCORE),
+            key=lambda item: (-item[0], -item[1]["score"], item[1]["index"]),
+        )]
+        curated = [candidate["source"] for candidate in (confident + kept)[:max_results]]
+
+        if self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "research_plan",
+                f"🏅 Verified and ranked top {len(curated)} most reliable sources",
+                self.researcher.websocket,
+            )
+
+        if isinstance(source_data, str):
+            return "\n\n".join(curated)
+        return curated
+
+    async def _pre_rank(self, sources: List[Any]) -> List[Dict[str, Any]]:
+        """Sources without near duplicates, best first by relevance, domain reputation and freshness."""
+        texts = [_source_text(source)[:MAX_SOURCE_CHARS] for source in sources]
+        embeddings = self.researcher.memory.get_embeddings()
+        query_vector, vectors = await asyncio.gather(
+            embeddings.aembed_query(self.researcher.query), embeddings.aembed_documents(texts)
+        )
+        self.researcher.stage_cost_callback("curation")(
+            estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=texts)
+        )
+        query_vector = np.asarray(query_vector, dtype=float)
+        vectors = np.asarray(vectors, dtype=float)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+        query_vector = query_vector / (np.linalg.norm(query_vector) or 1.0)
+        relevance = vectors @ query_vector
+
+        candidates = [
+            {
+                "index": i,
+                "source": source,
+                "text": text,
+                "url": _source_url(source),
+                "score": RELEVANCE_WEIGHT * float(relevance[i])
+                + REPUTATION_WEIGHT * domain_reputation(_source_url(source))
+                + FRESHNESS_WEIGHT * freshness(text),
+            }
+            for i, (source, text) in enumerate(zip(sources, texts))
+        ]
+        candidates.sort(key=lambda candidate: (-candidate["score"], candidate["index"]))
+
+        ranked, kept_vectors = [], []
+        for candidate in candidates:
+            vector = vectors[candidate["index"]]
+            if kept_vectors and float(np.max(np.vstack(kept_vectors) @ vector)) > DUPLICATE_SIMILARITY:
+                continue
+            kept_vectors.append(vector)
+            ranked.append(candidate)
+        return ranked
+
+    async def _judge(self, candidates: List[Dict[str, Any]]) -> List[float]:
+        """LLM scores (0-10) of the candidates, judged in parallel batches."""
+        batch_size = max(1, self.researcher.cfg.curation_batch_size)
+        batches = [candidates[i:i + batch_size] for i in range(0, len(candidates), batch_size)]
+        scores = await asyncio.gather(*[self._judge_batch(batch) for batch in batches])
+        return [score for batch_scores in scores for score in batch_scores]
+
+    async def _judge_batch(self, batch: List[Dict[str, Any]]) -> List[float]:
+        sources = [{"id": i, "url": candidate["url"], "content": candidate["text"]} for i, candidate in enumerate(batch)]
+        messages = [
+            {"role": "system", "content": f"{self.researcher.role}"},
+            {"role": "user", "content": self.researcher.prompt_family.judge_sources(
+                self.researcher.query, json.dumps(sources, ensure_ascii=False))},
+        ]
+        response = ""
+        try:
+            if self.researcher.cfg.llm_cascade:
+                response = await cascade_chat_completion(
+                    messages=messages,
+                    cfg=self.researcher.cfg,
+                    stage="curate_sources",
+                    score=score_json_list,
+                    stats=self.researcher.cascade_stats,
+                    cost_callback=self.researcher.stage_cost_callback("curation"),
+                    temperature=0.0,
+                    max_tokens=500,
+                )
+            if not response:
+                response = await create_chat_completion(
+                    model=self.researcher.cfg.smart_llm_model,
+                    messages=messages,
+                    temperature=0.0,
+                    max_tokens=500,
+                    llm_provider=self.researcher.cfg.smart_llm_provider,
+                    llm_kwargs=self.researcher.cfg.llm_kwargs,
+                    cost_callback=self.researcher.stage_cost_callback("curation"),
+                )
+            judgements = json_repair.loads(response)
+            scores = {int(item["id"]): float(item["score"]) for item in judgements}
+        except Exception as e:
+            # A failed batch keeps its sources rather than failing the whole curation
+            print(f"Error in curate_sources from LLM response: {response} ({e})")
+            return [float(JUDGE_KEEP_SCORE)] * len(batch)
+        return [scores.get(i, float(JUDGE_KEEP_SCORE)) for i in range(len(batch))]
@@ -1,5 +1,6 @@
 from typing import List, Dict, Any, Optional, Set
 import asyncio
+import functools
 import logging
 import time
 from datetime import datetime, timedelta
@@ -8,6 +9,8 @@ from gpt_researcher.llm_provider.generic.base import ReasoningEfforts
 from ..utils.llm import create_chat_completion
 from ..utils.enum import ReportType, ReportSource, Tone
 from ..actions.query_processing import get_search_results
+from ..utils.checkpoint import digest
+from .novelty import NoveltyFilter
 
 logger = logging.getLogger(__name__)
 
@@ -36,13 +39,26 @@ def trim_context_to_word_limit(context_list: List[str], max_words: int = MAX_CON
 
 class ResearchProgress:
     def __init__(self, total_depth: int, total_breadth: int):
-        self.current_depth = 1  # Start from 1 and increment up to total_depth
+        self.current_depth = 1  # Deepest level whose queries have started, from 1 up to total_depth
         self.total_depth = total_depth
-        self.current_breadth = 0  # Start from 0 and count up to total_breadth as queries complete
+        self.current_breadth = 0  # Queries completed at the current depth
         self.total_breadth = total_breadth
         self.current_query: Optional[str] = None
         self.total_queries = 0
         self.completed_queries = 0
+        # Depth level -> {"total_queries": ..., "completed_queries": ...}
+        self.levels: Dict[int, Dict[str, int]] = {}
+
+    def add_queries(self, level: int, count: int) -> None:
+        counts = self.levels.setdefault(level, {"total_queries": 0, "completed_queries": 0})
+        counts["total_queries"] += count
+        self.total_queries += count
+        self.current_depth = max(self.current_depth, level)
+
+    def complete_query(self, level: int) -> None:
+        self.levels[level]["completed_queries"] += 1
+        self.completed_queries += 1
+        self.current_breadth = self.levels.get(self.current_depth, {}).get("completed_queries", 0)
 
 
 class DeepResearchSkill:
@@ -51,6 +67,12 @@ class DeepResearchSkill:
         self.breadth = getattr(researcher.cfg, 'deep_research_breadth', 4)
         self.depth = getattr(researcher.cfg, 'deep_research_depth', 2)
         self.concurrency_limit = getattr(researcher.cfg, 'deep_research_concurrency', 2)
+        self.novelty_filter = None
+        if getattr(researcher.cfg, 'deep_research_novelty_filter', False):
+            self.novelty_filter = NoveltyFilter(
+                researcher, getattr(researcher.cfg, 'deep_research_similarity_threshold', 0.9)
+            )
+        self.min_new_learnings = getattr(researcher.cfg, 'deep_research_min_new_learnings', 1)
         self.websocket = researcher.websocket
         self.tone = researcher.tone
         self.config_path = researcher.cfg.config_path if hasattr(researcher.cfg, 'config_path') else None
@@ -73,7 +95,8 @@ class DeepResearchSkill:
             llm_provider=self.researcher.cfg.strategic_llm_provider,
             model=self.researcher.cfg.strategic_llm_model,
             reasoning_effort=self.researcher.cfg.reasoning_effort,
-            temperature=0.4
+            temperature=0.4,
+            cost_callback=self.researcher.stage_cost_callback("planning"),
         )
 
         lines = response.split('\n')
@@ -97,7 +120,7 @@ class DeepResearchSkill:
     async def generate_research_plan(self, query: str, num_questions: int = 3) -> List[str]:
         """Generate follow-up questions to clarify research direction"""
         # Get initial search results to inform query generation
-        search_results = await get_search_results(query, self.researcher.retrievers[0])
+        search_results = await get_search_results(query, self.researcher.retrievers[0], researcher=self.researcher)
         logger.info(f"Initial web knowledge obtained: {len(search_results)} results")
 
         # Get current time for context
@@ -123,7 +146,8 @@ Format each question on a new line starting with 'Question: '"""}
             llm_provider=self.researcher.cfg.strategic_llm_provider,
             model=self.researcher.cfg.strategic_llm_model,
             reasoning_effort=ReasoningEfforts.High.value,
-            temperature=0.4
+            temperature=0.4,
+            cost_callback=self.researcher.stage_cost_callback("planning"),
         )
 
         questions = [q.replace('Question:', '').strip()
@@ -145,7 +169,8 @@ Format each question on a new line starting with 'Question: '"""}
             model=self.researcher.cfg.strategic_llm_model,
             temperature=0.4,
             reasoning_effort=ReasoningEfforts.High.value,
-            max_tokens=1000
+            max_tokens=1000,
+            cost_callback=self.researcher.stage_cost_callback("compression"),
         )
 
         lines = response.split('\n')
@@ -193,7 +218,19 @@ Format each question on a new line starting with 'Question: '"""}
             visited_urls: Set[str] = None,
             on_progress=None
     ) -> Dict[str, Any]:
-        """Conduct deep iterative research"""
+        """
+        Conduct deep iterative research, breadth first.
+
+        All work goes through one priority queue served by ``concurrency_limit``
+        workers, shallower levels first: planning the search queries of a
+        prompt, and researching one search query. A researched query enqueues
+        the planning of its follow-ups right away, so deeper levels start while
+        the rest of their parent level is still running.
+
+        With the novelty filter on, search queries and learnings too similar to
+        ones the run already has are dropped, and a branch whose query yields
+        fewer than ``min_new_learnings`` new learnings goes no deeper.
+        """
         if learnings is None:
             learnings = []
         if citations is None:
@@ -206,83 +243,91 @@ Format each question on a new line starting with 'Question: '"""}
         if on_progress:
             on_progress(progress)
 
-        # Generate search queries
-        serp_queries = await self.generate_search_queries(query, num_queries=breadth)
-        progress.total_queries = len(serp_queries)
+        checkpoint = self.researcher.checkpoint
+        run_controller = self.researcher.run_controller
+        # (level, path) -> work item; a path is the index of each query on the way from the root,
+        # so sorting results by path lists every branch before its next sibling
+        queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        results: Dict[tuple, Dict[str, Any]] = {}
+
+        async def plan(prompt: str, level: int, level_breadth: int, path: tuple) -> None:
+            # Generate search queries, unless generated before the run was interrupted
+            serp_queries = checkpoint.get(f"deep_queries:{digest(prompt)}")
+            if serp_queries is None:
+                serp_queries = await run_controller.within_budget(
+                    "deep_research_queries",
+                    functools.partial(self.generate_search_queries, prompt, num_queries=level_breadth),
+                    [],
+                )
+                serp_queries = run_controller.admit(serp_queries, "deep_research_queries")
+                checkpoint.put(f"deep_queries:{digest(prompt)}", serp_queries)
+            if self.novelty_filter:
+                serp_queries = await self.novelty_filter.filter_queries(serp_queries, level)
+
+            progress.add_queries(level, len(serp_queries))
+            if on_progress:
+                on_progress(progress)
+            for index, serp_query in enumerate(serp_queries):
+                queue.put_nowait((level, path + (index,), research, (serp_query, level, level_breadth)))
+
+        async def research(serp_query: Dict[str, str], level: int, level_breadth: int, path: tuple) -> None:
+            result = await self._process_query(serp_query, progress, on_progress)
+            if result is None:
+                return
+            if self.novelty_filter:
+                result = {**result, 'learnings': await self.novelty_filter.filter_learnings(result['learnings'], level)}
+            results[path] = result
+            progress.complete_query(level)
+            logger.info(
+                f"Deep research level {level}/{depth}: "
+                f"{progress.levels[level]['completed_queries']}/{progress.levels[level]['total_queries']} queries done"
+            )
+            if on_progress:
+                on_progress(progress)
+
+            # Continue deeper if needed and the research budget allows
+            if level < depth and self.novelty_filter and len(result['learnings']) < self.min_new_learnings:
+                # The branch stopped adding information; going deeper would mostly repeat it
+                self.novelty_filter.record_stop(level)
+            elif level < depth and not run_controller.research_exhausted():
+                # Create next query from research goal and follow-up questions
+                next_query = f"""
+                Previous research goal: {result['researchGoal']}
+                Follow-up questions: {' '.join(result['followUpQuestions'])}
+                """
+                queue.put_nowait((level + 1, path, plan, (next_query, level + 1, max(2, level_breadth // 2))))
+
+        async def worker() -> None:
+            while True:
+                _, path, handler, args = await queue.get()
+                try:
+                    await handler(*args, path)
+                except Exception as e:
+                    logger.error(f"Error in deep research step {handler.__name__}: {str(e)}")
+                finally:
+                    queue.task_done()
+
+        queue.put_nowait((1, (), plan, (query, 1, breadth)))
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, self.concurrency_limit))]
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+
+        if self.novelty_filter:
+            for level, counts in self.novelty_filter.summary().items():
+                logger.info(f"Deep research level {level}/{depth} novelty pruning: {counts}")
 
         all_learnings = learnings.copy()
         all_citations = citations.copy()
-        all_visited_urls = visited_urls.copy()
+        all_visited_urls = set(visited_urls)
         all_context = []
         all_sources = []
 
-        # Process queries with concurrency limit
-        semaphore = asyncio.Semaphore(self.concurrency_limit)
-
-        async def process_query(serp_query: Dict[str, str]) -> Optional[Dict[str, Any]]:
-            async with semaphore:
-                try:
-                    progress.current_query = serp_query['query']
-                    if on_progress:
-                        on_progress(progress)
-
-                    from .. import GPTResearcher
-                    researcher = GPTResearcher(
-                        query=serp_query['query'],
-                        report_type=ReportType.ResearchReport.value,
-                        report_source=ReportSource.Web.value,
-                        tone=self.tone,
-                        websocket=self.websocket,
-                        config_path=self.config_path,
-                        headers=self.headers,
-                        visited_urls=self.visited_urls
-                    )
-
-                    # Conduct research
-                    context = await researcher.conduct_research()
-
-                    # Get results and visited URLs
-                    visited = researcher.visited_urls
-                    sources = researcher.research_sources
-
-                    # Process results to extract learnings and citations
-                    results = await self.process_research_results(
-                        query=serp_query['query'],
-                        context=context
-                    )
-
-                    # Update progress
-                    progress.completed_queries += 1
-                    progress.current_breadth += 1
-                    if on_progress:
-                        on_progress(progress)
-
-                    return {
-                        'learnings': results['learnings'],
-                        'visited_urls': list(visited),
-                        'followUpQuestions': results['followUpQuestions'],
-                        'researchGoal': serp_query['researchGoal'],
-                        'citations': results['citations'],
-                        'context': context if context else "",
-                        'sources': sources if sources else []
-                    }
-
-                except Exception as e:
-                    logger.error(f"Error processing query '{serp_query['query']}': {str(e)}")
-                    return None
-
-        # Process queries concurrently with limit
-        tasks = [process_query(query) for query in serp_queries]
-        results = await asyncio.gather(*tasks)
-        results = [r for r in results if r is not None]
-
-        # Update breadth progress based on successful queries
-        progress.current_breadth = len(results)
-        if on_progress:
-            on_progress(progress)
-
-        # Collect all results
-        for result in results:
+        # Collect all results, each branch before its next sibling
+        for path in sorted(results):
+            result = results[path]
             all_learnings.extend(result['learnings'])
             all_visited_urls.update(result['visited_urls'])
             all_citations.update(result['citations'])
@@ -291,37 +336,6 @@ Format each question on a new line starting with 'Question: '"""}
             if result['sources']:
                 all_sources.extend(result['sources'])
 
-            # Continue deeper if needed
-            if depth > 1:
-                new_breadth = max(2, breadth // 2)
-                new_depth = depth - 1
-                progress.current_depth += 1
-
-                # Create next query from research goal and follow-up questions
-                next_query = f"""
-                Previous research goal: {result['researchGoal']}
-                Follow-up questions: {' '.join(result['followUpQuestions'])}
-                """
-
-                # Recursive research
-                deeper_results = await self.deep_research(
-                    query=next_query,
-                    breadth=new_breadth,
-                    depth=new_depth,
-                    learnings=all_learnings,
-                    citations=all_citations,
-                    visited_urls=all_visited_urls,
-                    on_progress=on_progress
-                )
-
-                all_learnings = deeper_results['learnings']
-                all_visited_urls.update(deeper_results['visited_urls'])
-                all_citations.update(deeper_results['citations'])
-                if deeper_results.get('context'):
-                    all_context.extend(deeper_results['context'])
-                if deeper_results.get('sources'):
-                    all_sources.extend(deeper_results['sources'])
-
         # Update class tracking
         self.context.extend(all_context)
         self.research_sources.extend(all_sources)
@@ -338,6 +352,69 @@ Format each question on a new line starting with 'Question: '"""}
             'sources': all_sources
         }
 
+    async def _process_query(
+            self, serp_query: Dict[str, str], progress: ResearchProgress, on_progress=None
+    ) -> Optional[Dict[str, Any]]:
+        """Researches one search query and extracts its learnings and follow-up questions"""
+        checkpoint = self.researcher.checkpoint
+        stage = f"deep_result:{digest(serp_query['query'])}"
+        if (result := checkpoint.get(stage)) is not None:
+            return result
+        if self.researcher.run_controller.research_exhausted():
+            self.researcher.run_controller.record_drop("deep_research_queries")
+            return None
+        try:
+            progress.current_query = serp_query['query']
+            if on_progress:
+                on_progress(progress)
+
+            from .. import GPTResearcher
+            researcher = GPTResearcher(
+                query=serp_query['query'],
+                report_type=ReportType.ResearchReport.value,
+                report_source=ReportSource.Web.value,
+                tone=self.tone,
+                websocket=self.websocket,
+                config_path=self.config_path,
+                headers=self.headers,
+                # A copy: concurrent sub-researchers must not clear each other's visited URLs
+                visited_urls=set(self.visited_urls),
+                run_id=checkpoint.child(f"deep-{digest(serp_query['query'])}"),
+            )
+
+            # Conduct research
+            context = await researcher.conduct_research()
+            # Sub-research spends this run's budget
+            self.researcher.add_costs(researcher.get_costs(), stage="research")
+
+            # Get results and visited URLs
+            visited = researcher.visited_urls
+            sources = researcher.research_sources
+
+            # Process results to extract learnings and citations
+            # Out of budget, the query keeps its context without learnings or follow-ups
+            results = await self.researcher.run_controller.within_budget(
+                "deep_research_learnings",
+                functools.partial(self.process_research_results, query=serp_query['query'], context=context),
+                {'learnings': [], 'followUpQuestions': [], 'citations': {}},
+            )
+
+            result = {
+                'learnings': results['learnings'],
+                'visited_urls': list(visited),
+                'followUpQuestions': results['followUpQuestions'],
+                'researchGoal': serp_query['researchGoal'],
+                'citations': results['citations'],
+                'context': context if context else "",
+                'sources': sources if sources else []
+            }
+            checkpoint.put(stage, result)
+            return result
+
+        except Exception as e:
+            logger.error(f"Error processing query '{serp_query['query']}': {str(e)}")
+            return None
+
     async def run(self, on_progress=None) -> str:
         """Run the deep research process and generate final report"""
         start_time = time.time()
@@ -345,7 +422,12 @@ Format each question on a new line starting with 'Question: '"""}
         # Log initial costs
         initial_costs = self.researcher.get_costs()
 
-        follow_up_questions = await self.generate_research_plan(self.researcher.query)
+        follow_up_questions = self.researcher.checkpoint.get("deep_plan")
+        if follow_up_questions is None:
+            follow_up_questions = await self.researcher.run_controller.within_budget(
+                "deep_research_plan", functools.partial(self.generate_research_plan, self.researcher.query), []
+            )
+            self.researcher.checkpoint.put("deep_plan", follow_up_questions)
         answers = ["Automatically proceeding with research"] * len(follow_up_questions)
 
         qa_pairs = [f"Q: {q}\nA: {a}" for q, a in zip(follow_up_questions, answers)]
@@ -369,6 +451,10 @@ Format each question on a new line starting with 'Question: '"""}
                 "research_costs": research_costs,
                 "total_costs": self.researcher.get_costs()
             })
+            if self.novelty_filter:
+                await self.researcher._log_event("research", step="deep_research_pruning", details={
+                    "levels": self.novelty_filter.summary()
+                })
 
         # Prepare context with citations
         context_with_citations = []
@@ -383,8 +469,11 @@ Format each question on a new line starting with 'Question: '"""}
         if results.get('context'):
             context_with_citations.extend(results['context'])
 
-        # Trim final context to word limit
-        final_context = trim_context_to_word_limit(context_with_citations)
+        # Trim final context to word limit, unless report writing condenses large contexts itself
+        if getattr(self.researcher.cfg, "map_reduce_reports", False):
+            final_context = context_with_citations
+        else:
+            final_context = trim_context_to_word_limit(context_with_citations)
         
         # Set enhanced context and visited URLs
         self.researcher.context = "\n".join(final_context)
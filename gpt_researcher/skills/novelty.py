@@ -0,0 +1,83 @@
+import logging
+from collections import defaultdict
+from typing import Dict, List
+
+import numpy as np
+
+from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
+from ..utils.costs import estimate_embedding_cost
+
+logger = logging.getLogger(__name__)
+
+
+class NoveltyFilter:
+    """
+    Drops deep-research queries and learnings that repeat what a run already has.
+
+    Candidates are embedded and compared with every query explored and every
+    learning kept so far in the run (and with earlier candidates of the same
+    batch); those whose cosine similarity to any of them exceeds the threshold
+    are pruned. Pruning counts are kept per depth level.
+    """
+
+    def __init__(self, researcher, similarity_threshold: float = 0.9):
+        self.researcher = researcher
+        self.similarity_threshold = similarity_threshold
+        self._vectors: Dict[str, List[np.ndarray]] = {"queries": [], "learnings": []}
+        # Depth level -> counts of kept and pruned queries and learnings, and of branches stopped early
+        self.stats: Dict[int, Dict[str, int]] = defaultdict(lambda: {
+            "queries_kept": 0,
+            "queries_pruned": 0,
+            "learnings_kept": 0,
+            "learnings_pruned": 0,
+            "branches_stopped": 0,
+        })
+
+    async def _embed(self, texts: List[str]) -> np.ndarray:
+        vectors = await self.researcher.memory.get_embeddings().aembed_documents(texts)
+        self.researcher.stage_cost_callback("compression")(
+            estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=texts)
+        )
+        vectors = np.asarray(vectors, dtype=float)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+    async def _novel(self, texts: List[str], kind: str, level: int) -> List[bool]:
+        if not texts:
+            return []
+        try:
+            vectors = await self._embed(texts)
+        except Exception as e:
+            # Without embeddings nothing can be compared; keep everything
+            logger.warning(f"Novelty filter could not embed {kind}: {e}")
+            return [True] * len(texts)
+
+        # No await below, so concurrent branches see each other's additions in order
+        seen = self._vectors[kind]
+        novel = []
+        for vector in vectors:
+            is_novel = not seen or float(np.max(np.vstack(seen) @ vector)) <= self.similarity_threshold
+            if is_novel:
+                seen.append(vector)
+            novel.append(is_novel)
+
+        kept = sum(novel)
+        self.stats[level][f"{kind}_kept"] += kept
+        self.stats[level][f"{kind}_pruned"] += len(texts) - kept
+        return novel
+
+    async def filter_queries(self, serp_queries: List[Dict[str, str]], level: int) -> List[Dict[str, str]]:
+        """The search queries not too similar to a query already explored in the run."""
+        novel = await self._novel([serp_query["query"] for serp_query in serp_queries], "queries", level)
+        return [serp_query for serp_query, keep in zip(serp_queries, novel) if keep]
+
+    async def filter_learnings(self, learnings: List[str], level: int) -> List[str]:
+        """The learnings not too similar to a learning already kept in the run."""
+        novel = await self._novel(learnings, "learnings", level)
+        return [learning for learning, keep in zip(learnings, novel) if keep]
+
+    def record_stop(self, level: int) -> None:
+        self.stats[level]["branches_stopped"] += 1
+
+    def summary(self) -> Dict[int, Dict[str, int]]:
+        return {level: dict(counts) for level, counts in sorted(self.stats.items())}
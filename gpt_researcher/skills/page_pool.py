@@ -0,0 +1,124 @@
+import asyncio
+import os
+from typing import Awaitable, Callable
+
+import numpy as np
+from langchain.schema import Document
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
+from ..utils.costs import estimate_embedding_cost
+
+
+class PagePool:
+    """
+    Run-level store of scraped pages shared by all sub-queries.
+
+    Every URL is scraped at most once: the first caller starts its scrape and
+    later callers await the same future, whether the scrape was speculative
+    or claimed by another sub-query. Indexed pages are split and embedded
+    once, and each sub-query ranks against every page in the pool at its
+    ranking time instead of only the pages it scraped itself.
+    """
+
+    def __init__(self, researcher):
+        self.researcher = researcher
+        self.splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
+        self.similarity_threshold = float(os.environ.get("SIMILARITY_THRESHOLD", 0.35))
+        # url -> scrape of that URL, resolving to (pages, images)
+        self._scrapes: dict[str, asyncio.Task] = {}
+        # url -> indexing of that URL's pages into the pool
+        self._indexing: dict[str, asyncio.Task] = {}
+        self._chunks: list[Document] = []
+        self._vectors: list[np.ndarray] = []
+        self.pages: dict[str, dict] = {}
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._scrapes
+
+    def scrape(self, url: str, start: Callable[[], Awaitable[tuple[list, list]]]) -> asyncio.Task:
+        """The scrape of a URL, started with ``start`` unless it is already in flight or done."""
+        if url not in self._scrapes:
+            self._scrapes[url] = asyncio.create_task(start())
+        return self._scrapes[url]
+
+    def get(self, url: str) -> asyncio.Task:
+        """The started scrape of a URL."""
+        return self._scrapes[url]
+
+    async def index(self, urls: list[str]) -> None:
+        """Waits for the scrapes of the given URLs, where started, and adds their pages to the pool."""
+        await asyncio.gather(*[self._land(url) for url in urls if url in self._scrapes])
+
+    async def add(self, pages: list[dict]) -> None:
+        """Adds pages that were not scraped through the pool, such as search snippets."""
+        by_url: dict[str, list[dict]] = {}
+        for page in pages:
+            by_url.setdefault(page.get("url", ""), []).append(page)
+        await asyncio.gather(*[self._index_pages(url, url_pages) for url, url_pages in by_url.items()])
+
+    def cancel_pending(self) -> int:
+        """Cancels the scrapes still in flight and returns how many there were."""
+        pending = [scrape for scrape in self._scrapes.values() if not scrape.done()]
+        for scrape in pending:
+            scrape.cancel()
+        return len(pending)
+
+    async def _land(self, url: str) -> None:
+        scrape = self._scrapes[url]
+        try:
+            pages, _ = await scrape
+        except asyncio.CancelledError:
+            # A cancelled scrape has no pages to index; only the caller's own cancellation propagates
+            if not scrape.cancelled():
+                raise
+            return
+        await self._index_pages(url, pages)
+
+    async def _index_pages(self, url: str, pages: list[dict]) -> None:
+        if url not in self._indexing:
+            self._indexing[url] = asyncio.create_task(self._embed(pages))
+        await self._indexing[url]
+
+    async def _embed(self, pages: list[dict]) -> None:
+        pages = [page for page in pages if (page.get("raw_content") or "").strip()]
+        if not pages:
+            return
+        chunks = self.splitter.split_documents([
+            Document(
+                page_content=page["raw_content"],
+                metadata={"title": page.get("title", ""), "source": page.get("url", "")},
+            )
+            for page in pages
+        ])
+        vectors = await self.researcher.memory.get_embeddings().aembed_documents(
+            [chunk.page_content for chunk in chunks]
+        )
+        self.researcher.stage_cost_callback("compression")(
+            estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=[page["raw_content"] for page in pages])
+        )
+        for page in pages:
+            self.pages[page.get("url", "")] = page
+        self._chunks.extend(chunks)
+        self._vectors.extend(np.asarray(vector, dtype=float) for vector in vectors)
+
+    async def rank(self, query: str, max_results: int = 10, sources: set[str] | None = None) -> list[Document]:
+        """
+        The pool's chunks most similar to the query, above the similarity threshold,
+        optionally only those of the pages with the given source URLs.
+        """
+        # Snapshot: chunks indexed while the query is embedded are left out
+        indices = [
+            i for i, chunk in enumerate(self._chunks) if sources is None or chunk.metadata["source"] in sources
+        ]
+        if not indices:
+            return []
+        chunks, vectors = [self._chunks[i] for i in indices], np.vstack([self._vectors[i] for i in indices])
+        query_vector = np.asarray(await self.researcher.memory.get_embeddings().aembed_query(query), dtype=float)
+        norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query_vector)
+        scores = np.divide(vectors @ query_vector, norms, out=np.zeros(len(chunks)), where=norms > 0)
+        order = np.argsort(-scores, kind="stable")[:max_results]
+        return [chunks[i] for i in order if scores[i] > self.similarity_threshold]
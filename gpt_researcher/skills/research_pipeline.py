@@ -0,0 +1,163 @@
+import asyncio
+import heapq
+import itertools
+import logging
+from collections import defaultdict
+
+import numpy as np
+from langchain.schema import Document
+
+from ..context.compression import ContextCompressor
+from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
+from ..utils.costs import estimate_embedding_cost
+from ..utils.pipeline import Pipeline, PipelineStage
+
+logger = logging.getLogger(__name__)
+
+# The candidates ContextCompressor's EmbeddingsFilter keeps, and the chunks ContextManager passes on
+RANK_CANDIDATES = 20
+MAX_CONTEXT_CHUNKS = 10
+
+
+class ResearchPipeline:
+    """
+    Streams sub-queries through search, fetch, parse, chunk/embed and rank stages.
+
+    Unlike the per-sub-query flow, a page is parsed, embedded and scored as soon
+    as it is scraped, so one slow URL no longer holds back the compression of
+    every other page of its sub-query, and the bounded queues cap how much
+    scraped text is held in memory at once. Pages are chunked and filtered the
+    way ContextCompressor does it, and pages another sub-query claimed are
+    waited for and ranked for this sub-query too.
+    """
+
+    def __init__(self, conductor, query_domains: list | None = None, seed_results: dict[str, list] | None = None):
+        self.conductor = conductor
+        self.researcher = conductor.researcher
+        self.query_domains = query_domains or []
+        self.seed_results = seed_results or {}
+        self.embeddings = self.researcher.memory.get_embeddings()
+        compressor = ContextCompressor(
+            documents=[], embeddings=self.embeddings, prompt_family=self.researcher.prompt_family,
+            **self.researcher.kwargs
+        )
+        self.splitter = compressor.text_splitter()
+        self.similarity_threshold = float(compressor.similarity_threshold)
+        self._query_vectors: dict[str, asyncio.Task] = {}
+        # (url, content) -> embedding of that page's chunks, shared by every sub-query ranking it
+        self._page_chunks: dict[tuple[str, str], asyncio.Task] = {}
+        self._images: dict[str, list[dict]] = defaultdict(list)
+        self._top_chunks: dict[str, list[tuple[float, int, Document]]] = defaultdict(list)
+        self._counter = itertools.count()
+
+        cfg = self.researcher.cfg
+        self.pipeline = Pipeline(
+            [
+                PipelineStage("search", self._search, workers=cfg.pipeline_search_workers),
+                PipelineStage("fetch", self._fetch, workers=cfg.max_scraper_workers),
+                PipelineStage("parse", self._parse, workers=1),
+                PipelineStage("embed", self._embed, workers=cfg.pipeline_embed_workers),
+                PipelineStage("rank", self._rank, workers=1),
+            ],
+            queue_size=cfg.pipeline_queue_size,
+        )
+
+    async def run(self, sub_queries: list[str]) -> dict[str, str]:
+        """
+        Research all sub-queries through the pipeline.
+
+        Returns:
+            dict[str, str]: The compressed web context of each sub-query.
+        """
+        await self.pipeline.run(sub_queries, sink=self._keep_top)
+
+        contexts = {}
+        for sub_query in sub_queries:
+            new_images = self.researcher.scraper_manager.select_top_images(self._images[sub_query], k=4)
+            self.researcher.add_research_images(new_images)
+            contexts[sub_query] = self._context_for(sub_query)
+        return contexts
+
+    def utilization(self) -> dict[str, dict]:
+        return self.pipeline.utilization()
+
+    async def _search(self, sub_query: str):
+        run_controller = self.researcher.run_controller
+        if reason := run_controller.exhaustion_reason():
+            run_controller.record_drop("sub_queries")
+            logger.info(f"Research {reason} budget used up, skipping sub-query: {sub_query}")
+            return
+        results = await self.conductor._search_relevant_sources(
+            sub_query, self.query_domains, self.seed_results.get(sub_query)
+        )
+        for result in results:
+            yield sub_query, result["href"], bool(result.get("claimed"))
+
+    async def _fetch(self, item: tuple[str, str, bool]):
+        """Scrapes a URL, or waits for the scrape of the sub-query that claimed it."""
+        sub_query, url, claimed = item
+        pages, images = await self.researcher.scraper_manager.scrape_url(url)
+        if not claimed:
+            self._images[sub_query].extend(images)
+        for page in pages:
+            yield sub_query, page, claimed
+
+    async def _parse(self, item: tuple[str, dict, bool]):
+        """Keeps pages with usable text and records them as research sources once."""
+        sub_query, page, claimed = item
+        if not (page.get("raw_content") or "").strip():
+            return
+        if not claimed:
+            self.researcher.add_research_sources([page])
+            if self.researcher.vector_store:
+                self.researcher.vector_store.load([page])
+        yield sub_query, page
+
+    async def _embed(self, item: tuple[str, dict]):
+        sub_query, page = item
+        key = (page.get("url", ""), page["raw_content"])
+        if key not in self._page_chunks:
+            self._page_chunks[key] = asyncio.create_task(self._embed_page(page))
+        for chunk, vector in await self._page_chunks[key]:
+            yield sub_query, chunk, vector
+
+    async def _embed_page(self, page: dict) -> list[tuple[Document, list[float]]]:
+        chunks = self.splitter.split_documents([
+            Document(
+                page_content=page["raw_content"],
+                metadata={"title": page.get("title", ""), "source": page.get("url", "")},
+            )
+        ])
+        if not chunks:
+            return []
+        vectors = await self.embeddings.aembed_documents([chunk.page_content for chunk in chunks])
+        self.researcher.stage_cost_callback("compression")(
+            estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=[page["raw_content"]])
+        )
+        return list(zip(chunks, vectors))
+
+    async def _rank(self, item: tuple[str, Document, list[float]]):
+        sub_query, chunk, vector = item
+        if sub_query not in self._query_vectors:
+            self._query_vectors[sub_query] = asyncio.create_task(self.embeddings.aembed_query(sub_query))
+        query_vector = np.asarray(await self._query_vectors[sub_query])
+        vector = np.asarray(vector)
+        norm = np.linalg.norm(query_vector) * np.linalg.norm(vector)
+        score = float(query_vector @ vector / norm) if norm else 0.0
+        yield sub_query, score, chunk
+
+    def _keep_top(self, item: tuple[str, float, Document]) -> None:
+        """Keeps only the best-scoring chunks of each sub-query in memory."""
+        sub_query, score, chunk = item
+        candidates = self._top_chunks[sub_query]
+        entry = (score, next(self._counter), chunk)
+        if len(candidates) < RANK_CANDIDATES:
+            heapq.heappush(candidates, entry)
+        elif score > candidates[0][0]:
+            heapq.heapreplace(candidates, entry)
+
+    def _context_for(self, sub_query: str) -> str:
+        """Top chunks above the similarity threshold, most similar first."""
+        ranked = sorted(self._top_chunks[sub_query], key=lambda entry: entry[0], reverse=True)
+        relevant = [chunk for score, _, chunk in ranked if score > self.similarity_threshold]
+        return self.researcher.prompt_family.pretty_print_docs(relevant, MAX_CONTEXT_CHUNKS)
@@ -1,13 +1,28 @@
 import asyncio
-import random
+import functools
+import inspect
 import logging
 import os
+import time
+
+import numpy as np
+from langchain.schema import Document
+
 from ..actions.utils import stream_output
 from ..actions.query_processing import plan_research_outline, get_search_results
 from ..document import DocumentLoader, OnlineDocumentLoader, LangChainDocumentLoader
 from ..utils.enum import ReportSource, ReportType
 from ..utils.logging_config import get_json_handler
-from ..actions.agent_creator import choose_agent
+from ..actions.agent_creator import DEFAULT_AGENT, choose_agent
+from ..retrievers.base import run_search, run_search_many
+from ..retrievers.fusion import canonicalize_url, reciprocal_rank_fusion, select_within_budget
+from ..utils.metrics import RetrieverStats
+from ..utils.budget import bounded_timeout
+from ..utils.checkpoint import digest
+from ..utils.costs import estimate_embedding_cost
+from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
+from .research_pipeline import ResearchPipeline
+from .saturation import SaturationMonitor
 
 
 class ResearchConductor:
@@ -21,6 +36,70 @@ class ResearchConductor:
         self._mcp_results_cache = None
         # Track MCP query count for balanced mode
         self._mcp_query_count = 0
+        # Initial planning searches, keyed by (query, query_domains), so they can
+        # be started early, shared between planning calls and reused as scrape seeds
+        self._planning_search_tasks: dict[tuple, asyncio.Task] = {}
+        # (retriever name, query, query domains) -> batch search covering that query
+        self._batch_searches: dict[tuple, asyncio.Task] = {}
+        # Per-stage utilization of the last research pipeline run
+        self.pipeline_stats: dict[str, dict] = {}
+        # Per-retriever search latency histograms and outcomes
+        self.retriever_stats = RetrieverStats()
+        # Novelty of the context of each sub-query of the current web research, with SATURATION_STOPPING
+        self.saturation: SaturationMonitor | None = None
+
+    def _get_planning_search(self, query, query_domains=None) -> asyncio.Task:
+        """Returns the (possibly already running) initial search task for a query."""
+        key = (query, tuple(query_domains or []))
+        if key not in self._planning_search_tasks:
+            self._planning_search_tasks[key] = asyncio.create_task(
+                self._run_planning_search(query, query_domains)
+            )
+        return self._planning_search_tasks[key]
+
+    async def _run_planning_search(self, query, query_domains=None) -> list:
+        """Runs the initial search and starts scraping its results as soon as they arrive."""
+        search_results = await get_search_results(
+            query, self.researcher.retrievers[0], query_domains, researcher=self.researcher
+        )
+        if (
+            self.researcher.cfg.prefetch_planning_sources
+            and self._scrapes_web_results()
+            and not self._is_mcp(self.researcher.retrievers[0])
+        ):
+            self.researcher.scraper_manager.prefetch_urls([
+                result.get("href") for result in search_results
+                if result.get("href") and result.get("href") not in self.researcher.visited_urls
+            ])
+        return search_results
+
+    def _get_planning_seed(self, query, query_domains=None) -> list | None:
+        """
+        Returns the planning-phase search results for a query, if they can stand in
+        for searching that query again with the primary retriever.
+        """
+        task = self._planning_search_tasks.get((query, tuple(query_domains or [])))
+        if task is None or not task.done() or task.cancelled() or task.exception():
+            return None
+        if self._is_mcp(self.researcher.retrievers[0]):
+            return None
+        return task.result()
+
+    @staticmethod
+    def _is_mcp(retriever_class) -> bool:
+        return "mcpretriever" in retriever_class.__name__.lower()
+
+    def _uses_research_planning(self) -> bool:
+        """Whether the configured report source goes through ``plan_research``."""
+        if self.researcher.source_urls:
+            return self.researcher.complement_source_urls
+        return self.researcher.report_source != ReportSource.Static.value
+
+    def _scrapes_web_results(self) -> bool:
+        """Whether research scrapes web search results, so prefetching the planning sources can pay off."""
+        if self.researcher.source_urls:
+            return self.researcher.complement_source_urls
+        return self.researcher.report_source in (ReportSource.Web.value, ReportSource.Hybrid.value)
 
     async def plan_research(self, query, query_domains=None):
         """Gets the sub-queries from the query
@@ -36,7 +115,7 @@ class ResearchConductor:
             self.researcher.websocket,
         )
 
-        search_results = await get_search_results(query, self.researcher.retrievers[0], query_domains, researcher=self.researcher)
+        search_results = await self._get_planning_search(query, query_domains)
         self.logger.info(f"Initial search results obtained: {len(search_results)} results")
 
         await stream_output(
@@ -49,17 +128,20 @@ class ResearchConductor:
         retriever_names = [r.__name__ for r in self.researcher.retrievers]
         # Remove duplicate logging - this will be logged once in conduct_research instead
 
-        outline = await plan_research_outline(
+        # Out of budget, no sub-queries are planned; the original query is still researched
+        outline = await self.researcher.run_controller.within_budget("planning", functools.partial(
+            plan_research_outline,
             query=query,
             search_results=search_results,
             agent_role_prompt=self.researcher.role,
             cfg=self.researcher.cfg,
             parent_query=self.researcher.parent_query,
             report_type=self.researcher.report_type,
-            cost_callback=self.researcher.add_costs,
+            cost_callback=self.researcher.stage_cost_callback("planning"),
             retriever_names=retriever_names,  # Pass retriever names for MCP optimization
+            cascade_stats=self.researcher.cascade_stats,
             **self.researcher.kwargs
-        )
+        ), [])
         self.logger.info(f"Research outline planned: {outline}")
         return outline
 
@@ -92,16 +174,39 @@ class ResearchConductor:
                 self.researcher.websocket
             )
 
-        # Choose agent and role if not already defined
+        # Start the initial planning search so it overlaps with agent selection
+        if self._uses_research_planning():
+            self._get_planning_search(self.researcher.query, self.researcher.query_domains)
+
+        # Choose agent and role if not already defined or chosen before the run was interrupted
+        if not (self.researcher.agent and self.researcher.role) and (chosen := self.researcher.checkpoint.get("agent")):
+            self.researcher.agent, self.researcher.role = chosen
         if not (self.researcher.agent and self.researcher.role):
-            self.researcher.agent, self.researcher.role = await choose_agent(
-                query=self.researcher.query,
-                cfg=self.researcher.cfg,
-                parent_query=self.researcher.parent_query,
-                cost_callback=self.researcher.add_costs,
-                headers=self.researcher.headers,
-                prompt_family=self.researcher.prompt_family
+            await self.researcher._log_event("action", action="choose_agent")
+            self.researcher.agent, self.researcher.role = await self.researcher.run_controller.within_budget(
+                "agent_selection",
+                functools.partial(
+                    choose_agent,
+                    query=self.researcher.query,
+                    cfg=self.researcher.cfg,
+                    parent_query=self.researcher.parent_query,
+                    cost_callback=self.researcher.stage_cost_callback("planning"),
+                    headers=self.researcher.headers,
+                    prompt_family=self.researcher.prompt_family,
+                    cascade_stats=self.researcher.cascade_stats,
+                    **self.researcher.kwargs
+                ),
+                DEFAULT_AGENT,
             )
+            await self.researcher._log_event("action", action="agent_selected", details={
+                "agent": self.researcher.agent,
+                "role": self.researcher.role
+            })
+            self.researcher.checkpoint.put("agent", [self.researcher.agent, self.researcher.role])
+        await self.researcher._log_event("research", step="conducting_research", details={
+            "agent": self.researcher.agent,
+            "role": self.researcher.role
+        })
                 
         # Check if MCP retrievers are configured
         has_mcp_retriever = any("mcpretriever" in r.__name__.lower() for r in self.researcher.retrievers)
@@ -167,6 +272,10 @@ class ResearchConductor:
         elif self.researcher.report_source == ReportSource.LangChainVectorStore.value:
             research_data = await self._get_context_by_vectorstore(self.researcher.query, self.researcher.vector_store_filter)
 
+        # Prefetched pages research did not claim are not needed any more
+        if cancelled := self.researcher.scraper_manager.cancel_pending():
+            self.logger.info(f"Cancelled {cancelled} unclaimed scrapes")
+
         # Rank and curate the sources
         self.researcher.context = research_data
         if self.researcher.cfg.curate_sources:
@@ -182,8 +291,25 @@ class ResearchConductor:
             )
             if self.json_handler:
                 self.json_handler.update_content("costs", self.researcher.get_costs())
+                self.json_handler.update_content("cost_breakdown", self.researcher.get_costs(breakdown=True))
+                self.json_handler.update_content("cascade", self.researcher.get_cascade_stats())
+                self.json_handler.update_content("retrievers", self.retriever_stats.summary())
+                if self.researcher.run_controller.enabled:
+                    self.json_handler.update_content("budget", self.researcher.run_controller.summary())
+                if self.saturation is not None:
+                    self.json_handler.update_content("saturation", self.saturation.summary())
                 self.json_handler.update_content("context", self.researcher.context)
 
+        self.logger.info(f"Research costs by stage: {self.researcher.get_costs(breakdown=True)}")
+        self.logger.info(f"Retriever latency and outcomes: {self.retriever_stats.summary()}")
+        if self.researcher.search_cache is not None:
+            self.logger.info(f"Search cache hit rates: {self.researcher.search_cache.stats.summary()}")
+        if self.researcher.run_controller.enabled:
+            self.logger.info(f"Research budget: {self.researcher.run_controller.summary()}")
+        if self.saturation is not None:
+            self.logger.info(f"Research saturation: {self.saturation.summary()}")
+        if self.researcher.cfg.llm_cascade:
+            self.logger.info(f"Model cascade escalation rates: {self.researcher.get_cascade_stats()}")
         self.logger.info(f"Research completed. Context size: {len(str(self.researcher.context))}")
         return self.researcher.context
 
@@ -303,9 +429,18 @@ class ResearchConductor:
                 self._mcp_results_cache = mcp_context
                 self.logger.info(f"MCP results cached: {len(mcp_context)} total context entries")
 
-        # Generate Sub-Queries including original query
-        sub_queries = await self.plan_research(query, query_domains)
-        self.logger.info(f"Generated sub-queries: {sub_queries}")
+        # Generate Sub-Queries including original query, unless planned before the run was interrupted
+        checkpoint = self.researcher.checkpoint
+        source = "documents" if scraped_data else "web"
+        sub_queries = checkpoint.get(f"sub_queries:{source}:{digest(query)}")
+        if sub_queries is None:
+            sub_queries = await self.plan_research(query, query_domains)
+            self.logger.info(f"Generated sub-queries: {sub_queries}")
+            # Planned sub-queries come in priority order; the budget trims the tail
+            sub_queries = self.researcher.run_controller.admit(sub_queries, "sub_queries")
+            checkpoint.put(f"sub_queries:{source}:{digest(query)}", sub_queries)
+        else:
+            self.logger.info(f"Restored sub-queries: {sub_queries}")
         
         # If this is not part of a sub researcher, add original query to research for better results
         if self.researcher.report_type != "subtopic_report":
@@ -321,17 +456,75 @@ class ResearchConductor:
                 sub_queries,
             )
 
-        # Using asyncio.gather to process the sub_queries asynchronously
-        try:
-            context = await asyncio.gather(
-                *[
-                    self._process_sub_query(sub_query, scraped_data, query_domains)
-                    for sub_query in sub_queries
-                ]
+        # The original query was already searched with the primary retriever while
+        # planning, so those results seed its research instead of a second search
+        planning_seed = self._get_planning_seed(query, query_domains)
+
+        # Sub-queries researched before the run was interrupted keep their ranked context
+        restored = {}
+        for sub_query in sub_queries:
+            if (done := checkpoint.get(f"context:{source}:{digest(sub_query)}")) is not None:
+                restored[sub_query] = done["context"]
+                self.researcher.visited_urls.update(done["visited_urls"])
+        pending = [sub_query for sub_query in sub_queries if sub_query not in restored]
+        if restored:
+            self.logger.info(f"Restored context of {len(restored)} sub-queries, researching {len(pending)}")
+
+        if not scraped_data:
+            self._start_batch_searches(pending, query_domains, seeded_query=query if planning_seed is not None else None)
+
+        cfg = self.researcher.cfg
+        use_pipeline = cfg.research_pipeline and not scraped_data
+        if use_pipeline and (ignored := [
+            name for name, enabled in (("SATURATION_STOPPING", cfg.saturation_stopping), ("SNIPPET_FIRST", cfg.snippet_first))
+            if enabled
+        ]):
+            self.logger.warning(
+                f"{' and '.join(ignored)} not applied: RESEARCH_PIPELINE researches all sub-queries at once "
+                f"and scrapes every selected URL"
+            )
+        self.saturation = None
+        if cfg.saturation_stopping and len(pending) > 1 and not use_pipeline:
+            self.saturation = SaturationMonitor(
+                self.researcher,
+                planned=len(pending),
+                threshold=cfg.saturation_novelty_threshold,
+                min_fraction=cfg.saturation_min_fraction,
             )
+
+        try:
+            if not pending:
+                pending_context = []
+            elif use_pipeline:
+                pending_context = await self._get_context_by_pipeline(query, pending, query_domains, planning_seed)
+            else:
+                # Using asyncio.gather to process the sub_queries asynchronously
+                pending_context = await asyncio.gather(
+                    *[
+                        self._process_sub_query(
+                            sub_query,
+                            scraped_data,
+                            query_domains,
+                            seed_results=planning_seed if sub_query == query else None,
+                        )
+                        for sub_query in pending
+                    ]
+                )
+            for sub_query, sub_query_context in zip(pending, pending_context):
+                # Empty context may come from a failure, so it is researched again on resume
+                if sub_query_context:
+                    checkpoint.put(f"context:{source}:{digest(sub_query)}", {
+                        "context": sub_query_context,
+                        "visited_urls": list(self.researcher.visited_urls),
+                    })
+            restored.update(zip(pending, pending_context))
+            context = [restored[sub_query] for sub_query in sub_queries]
             self.logger.info(f"Gathered context from {len(context)} sub-queries")
             # Filter out empty results and join the context
             context = [c for c in context if c]
+            if not context and planning_seed and self.researcher.run_controller.research_exhausted():
+                # Out of budget before any sub-query was researched, the planning search is what was gathered
+                context = [self._search_results_context(planning_seed)]
             if context:
                 combined_context = " ".join(context)
                 self.logger.info(f"Combined context size: {len(combined_context)}")
@@ -341,6 +534,56 @@ class ResearchConductor:
             self.logger.error(f"Error during web search: {e}", exc_info=True)
             return []
 
+    def _search_results_context(self, search_results: list) -> str:
+        """Search results as context, their snippets standing in for the pages."""
+        documents = [
+            Document(
+                page_content=result.get("raw_content") or result["body"],
+                metadata={"source": result["href"], "title": result.get("title", "")},
+            )
+            for result in search_results
+            if result.get("href") and (result.get("raw_content") or result.get("body"))
+        ]
+        return self.researcher.prompt_family.pretty_print_docs(documents)
+
+    async def _get_context_by_pipeline(self, query, sub_queries: list, query_domains: list, planning_seed: list | None = None) -> list:
+        """
+        Gathers the context of all sub-queries through the staged research pipeline.
+
+        Pages from every sub-query share the search, fetch, parse, chunk/embed and
+        rank stages, while MCP context is gathered alongside.
+
+        Returns:
+            list: The combined context of each sub-query.
+        """
+        if self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "research_pipeline",
+                f"🏭 Researching {len(sub_queries)} queries through the research pipeline...",
+                self.researcher.websocket,
+            )
+
+        pipeline = ResearchPipeline(
+            self,
+            query_domains,
+            seed_results={query: planning_seed} if planning_seed is not None else None,
+        )
+        web_contexts, mcp_contexts = await asyncio.gather(
+            pipeline.run(sub_queries),
+            asyncio.gather(*[self._get_mcp_context(sub_query) for sub_query in sub_queries]),
+        )
+
+        self.pipeline_stats = pipeline.utilization()
+        self.logger.info(f"Research pipeline utilization: {self.pipeline_stats}")
+        if self.json_handler:
+            self.json_handler.update_content("pipeline", self.pipeline_stats)
+
+        return [
+            self._combine_mcp_and_web_context(mcp_context, web_contexts[sub_query], sub_query)
+            for sub_query, mcp_context in zip(sub_queries, mcp_contexts)
+        ]
+
     def _get_mcp_strategy(self) -> str:
         """
         Get the MCP strategy configuration.
@@ -423,8 +666,29 @@ class ResearchConductor:
         
         return all_mcp_context
 
-    async def _process_sub_query(self, sub_query: str, scraped_data: list = [], query_domains: list = []):
-        """Takes in a sub query and scrapes urls based on it and gathers context."""
+    async def _observe_novelty(self, sub_query: str, web_context, pool_pages: list | None = None) -> None:
+        """
+        Measures how much new information a sub-query's context adds. A context ranked
+        against the shared page pool overlaps earlier sub-queries' by construction, so
+        only its content from ``pool_pages``, the pages the sub-query scraped itself, counts.
+        """
+        if pool_pages is None:
+            await self.saturation.observe(sub_query, str(web_context))
+            return
+        sources = {page.get("url") for page in pool_pages if page.get("url")}
+        docs = await self.researcher.scraper_manager.page_pool.rank(sub_query, sources=sources) if sources else []
+        if docs:
+            await self.saturation.observe(sub_query, self.researcher.prompt_family.pretty_print_docs(docs))
+        else:
+            self.saturation.record(sub_query, 0.0)
+
+    async def _process_sub_query(self, sub_query: str, scraped_data: list = [], query_domains: list = [], seed_results: list | None = None):
+        """Takes in a sub query and scrapes urls based on it and gathers context.
+
+        Args:
+            seed_results: Search results already obtained for this sub-query from
+                the primary retriever, used instead of searching it again.
+        """
         if self.json_handler:
             self.json_handler.log_event("sub_query", {
                 "query": sub_query,
@@ -439,70 +703,44 @@ class ResearchConductor:
                 self.researcher.websocket,
             )
 
+        if reason := self.researcher.run_controller.exhaustion_reason():
+            self.researcher.run_controller.record_drop("sub_queries")
+            self.logger.info(f"Research {reason} budget used up, skipping sub-query: {sub_query}")
+            return ""
+        if self.saturation and self.saturation.skip(sub_query, "sub_queries"):
+            return ""
+
         try:
             # Identify MCP retrievers
             mcp_retrievers = [r for r in self.researcher.retrievers if "mcpretriever" in r.__name__.lower()]
             non_mcp_retrievers = [r for r in self.researcher.retrievers if "mcpretriever" not in r.__name__.lower()]
             
             # Initialize context components
-            mcp_context = []
             web_context = ""
             
             # Get MCP strategy configuration
             mcp_strategy = self._get_mcp_strategy()
             
-            # **CONFIGURABLE MCP PROCESSING**
-            if mcp_retrievers:
-                if mcp_strategy == "disabled":
-                    # MCP disabled - skip entirely
-                    self.logger.info(f"MCP disabled for sub-query: {sub_query}")
-                elif mcp_strategy == "fast" and self._mcp_results_cache is not None:
-                    # Fast: Use cached results
-                    mcp_context = self._mcp_results_cache.copy()
-                    
-                    if self.researcher.verbose:
-                        await stream_output(
-                            "logs",
-                            "mcp_cache_reuse",
-                            f"♻️ Reusing cached MCP results ({len(mcp_context)} sources) for: {sub_query}",
-                            self.researcher.websocket,
-                        )
-                    
-                    self.logger.info(f"Reused {len(mcp_context)} cached MCP results for sub-query: {sub_query}")
-                elif mcp_strategy == "deep":
-                    # Deep: Run MCP for every sub-query
-                    self.logger.info(f"Running deep MCP research for: {sub_query}")
-                    if self.researcher.verbose:
-                        await stream_output(
-                            "logs",
-                            "mcp_comprehensive_run",
-                            f"🔍 Running deep MCP research for: {sub_query}",
-                            self.researcher.websocket,
-                        )
-                    
-                    mcp_context = await self._execute_mcp_research_for_queries([sub_query], mcp_retrievers)
-                else:
-                    # Fallback: if no cache and not deep mode, run MCP for this query
-                    self.logger.warning("MCP cache not available, falling back to per-sub-query execution")
-                    if self.researcher.verbose:
-                        await stream_output(
-                            "logs",
-                            "mcp_fallback",
-                            f"🔌 MCP cache unavailable, running MCP research for: {sub_query}",
-                            self.researcher.websocket,
-                        )
-                    
-                    mcp_context = await self._execute_mcp_research_for_queries([sub_query], mcp_retrievers)
-            
+            mcp_context = await self._get_mcp_context(sub_query)
+
             # Get web search context using non-MCP retrievers (if no scraped data provided)
+            use_page_pool = False
             if not scraped_data:
-                scraped_data = await self._scrape_data_by_urls(sub_query, query_domains)
+                scraped_data = await self._scrape_data_by_urls(sub_query, query_domains, seed_results)
                 self.logger.info(f"Scraped data size: {len(scraped_data)}")
+                use_page_pool = self.researcher.cfg.shared_page_pool
 
-            # Get similar content based on scraped data
-            if scraped_data:
+            # Get similar content based on scraped data, or on every page scraped so far in the run
+            if self.saturation and (use_page_pool or scraped_data) and self.saturation.skip(sub_query, "ranking"):
+                web_context = ""
+            elif use_page_pool:
+                web_context = await self.researcher.context_manager.get_similar_content_from_page_pool(sub_query)
+                self.logger.info(f"Web content found for sub-query: {len(str(web_context)) if web_context else 0} chars")
+            elif scraped_data:
                 web_context = await self.researcher.context_manager.get_similar_content_by_query(sub_query, scraped_data)
                 self.logger.info(f"Web content found for sub-query: {len(str(web_context)) if web_context else 0} chars")
+            if self.saturation and web_context:
+                await self._observe_novelty(sub_query, web_context, scraped_data if use_page_pool else None)
 
             # Combine MCP context with web context intelligently
             combined_context = self._combine_mcp_and_web_context(mcp_context, web_context, sub_query)
@@ -554,6 +792,57 @@ class ResearchConductor:
                 )
             return ""
 
+    async def _get_mcp_context(self, sub_query: str) -> list:
+        """Gathers MCP context for a sub-query according to the configured MCP strategy."""
+        mcp_retrievers = [r for r in self.researcher.retrievers if "mcpretriever" in r.__name__.lower()]
+        mcp_strategy = self._get_mcp_strategy()
+        mcp_context = []
+
+        # **CONFIGURABLE MCP PROCESSING**
+        if mcp_retrievers:
+            if mcp_strategy == "disabled":
+                # MCP disabled - skip entirely
+                self.logger.info(f"MCP disabled for sub-query: {sub_query}")
+            elif mcp_strategy == "fast" and self._mcp_results_cache is not None:
+                # Fast: Use cached results
+                mcp_context = self._mcp_results_cache.copy()
+
+                if self.researcher.verbose:
+                    await stream_output(
+                        "logs",
+                        "mcp_cache_reuse",
+                        f"♻️ Reusing cached MCP results ({len(mcp_context)} sources) for: {sub_query}",
+                        self.researcher.websocket,
+                    )
+
+                self.logger.info(f"Reused {len(mcp_context)} cached MCP results for sub-query: {sub_query}")
+            elif mcp_strategy == "deep":
+                # Deep: Run MCP for every sub-query
+                self.logger.info(f"Running deep MCP research for: {sub_query}")
+                if self.researcher.verbose:
+                    await stream_output(
+                        "logs",
+                        "mcp_comprehensive_run",
+                        f"🔍 Running deep MCP research for: {sub_query}",
+                        self.researcher.websocket,
+                    )
+
+                mcp_context = await self._execute_mcp_research_for_queries([sub_query], mcp_retrievers)
+            else:
+                # Fallback: if no cache and not deep mode, run MCP for this query
+                self.logger.warning("MCP cache not available, falling back to per-sub-query execution")
+                if self.researcher.verbose:
+                    await stream_output(
+                        "logs",
+                        "mcp_fallback",
+                        f"🔌 MCP cache unavailable, running MCP research for: {sub_query}",
+                        self.researcher.websocket,
+                    )
+
+                mcp_context = await self._execute_mcp_research_for_queries([sub_query], mcp_retrievers)
+
+        return mcp_context
+
     async def _execute_mcp_research(self, retriever, query):
         """
         Execute MCP research using the new two-stage approach.
@@ -725,45 +1014,184 @@ class ResearchConductor:
 
         return new_urls
 
-    async def _search_relevant_source_urls(self, query, query_domains: list | None = None):
-        new_search_urls = []
+    async def _search_relevant_source_urls(self, query, query_domains: list | None = None, seed_results: list | None = None):
+        search_results = await self._search_relevant_sources(query, query_domains, seed_results)
+        return [result["href"] for result in search_results if not result.get("claimed")]
+
+    async def _search_relevant_sources(self, query, query_domains: list | None = None, seed_results: list | None = None) -> list[dict]:
+        """
+        Searches with all retrievers and returns the fused results selected for the query.
+
+        Results already claimed by another sub-query of the run are included
+        with ``claimed`` set and the claimed URL as ``href``; they are not
+        scraped again.
+        """
+        ranked_lists = []
         if query_domains is None:
             query_domains = []
 
-        # Iterate through the currently set retrievers
-        # This allows the method to work when retrievers are temporarily modified
-        for retriever_class in self.researcher.retrievers:
+        checkpoint = self.researcher.checkpoint
+        stage = f"search:{digest(query)}"
+        if (searched := checkpoint.get(stage)) is not None:
+            ranked_lists = searched
+            self.logger.info(f"Restored search results for query: {query}")
+        else:
+            retrievers = self.researcher.retrievers
+            if seed_results is not None:
+                # The primary retriever's results for this query are already known
+                ranked_lists.append(seed_results)
+                retrievers = retrievers[1:]
+                self.logger.info(f"Reusing {len(seed_results)} planning search results for query: {query}")
+
+            # Fan out to the currently set retrievers concurrently, each under its own deadline
+            # This allows the method to work when retrievers are temporarily modified
             # Skip MCP retrievers as they don't provide URLs for scraping
-            if "mcpretriever" in retriever_class.__name__.lower():
-                continue
-                
-            try:
-                # Instantiate the retriever with the sub-query
-                retriever = retriever_class(query, query_domains=query_domains)
+            all_results = await asyncio.gather(*[
+                self._search_with_deadline(retriever_class, query, query_domains)
+                for retriever_class in retrievers
+                if not self._is_mcp(retriever_class)
+            ])
+            ranked_lists.extend(all_results)
+            checkpoint.put(stage, ranked_lists)
 
-                # Perform the search using the current retriever
-                search_results = await asyncio.to_thread(
-                    retriever.search, max_results=self.researcher.cfg.max_search_results_per_query
-                )
+        selected, claimed = self._fuse_search_results(query, ranked_lists, query_domains)
+        selected = self.researcher.run_controller.admit(selected, "urls")
+        new_urls = set(await self._get_new_urls([result["href"] for result in selected]))
+        return [result for result in selected if result["href"] in new_urls] + claimed
 
-                # Collect new URLs from search results
-                search_urls = [url.get("href") for url in search_results if url.get("href")]
-                new_search_urls.extend(search_urls)
-            except Exception as e:
-                self.logger.error(f"Error searching with {retriever_class.__name__}: {e}")
+    def _fuse_search_results(self, query, ranked_lists: list[list], query_domains: list) -> tuple[list[dict], list[dict]]:
+        """
+        Merges the retrievers' result lists and picks the URLs worth scraping.
 
-        # Get unique URLs
-        new_search_urls = await self._get_new_urls(new_search_urls)
-        random.shuffle(new_search_urls)
+        Near-duplicate URLs are merged, already visited sources set aside, and
+        the rest ranked by reciprocal rank fusion and cut to SCRAPE_BUDGET with
+        at most MAX_URLS_PER_DOMAIN per domain (not applied when the search is
+        restricted to specific domains).
 
-        return new_search_urls
+        Returns:
+            tuple[list[dict], list[dict]]: the results selected for scraping and
+            the results already claimed earlier in the run.
+        """
+        cfg = self.researcher.cfg
+        visited = {canonicalize_url(url): url for url in self.researcher.visited_urls}
+        fused, claimed = [], []
+        for result in reciprocal_rank_fusion(ranked_lists):
+            if result["canonical"] in visited:
+                claimed.append({**result, "href": visited[result["canonical"]], "claimed": True})
+            else:
+                fused.append(result)
+        selected = select_within_budget(
+            fused,
+            budget=cfg.scrape_budget,
+            max_per_domain=None if query_domains else cfg.max_urls_per_domain,
+        )
+        total = sum(len(results) for results in ranked_lists)
+        self.logger.info(
+            f"Fused {total} search results into {len(fused)} new sources, "
+            f"selected {len(selected)} to scrape for query: {query}"
+        )
+        return selected, claimed
+
+    def _retriever_timeout(self, retriever_class) -> float:
+        """
+        Search deadline for a retriever: its RETRIEVER_TIMEOUTS entry, else
+        RETRIEVER_TIMEOUT, cut short by the run's research deadline.
+        """
+        name = retriever_class.__name__.lower()
+        timeout = float(self.researcher.cfg.retriever_timeout)
+        for key, value in (self.researcher.cfg.retriever_timeouts or {}).items():
+            if name.startswith(key.lower().replace("_", "")):
+                timeout = float(value)
+                break
+        return bounded_timeout(timeout)
+
+    def _retriever_options(self, retriever_class) -> dict:
+        """Extra constructor arguments for retrievers that support them."""
+        if not self.researcher.cfg.snippet_first:
+            return {}
+        try:
+            parameters = inspect.signature(retriever_class).parameters
+        except (TypeError, ValueError):
+            return {}
+        # Full page texts returned with the search results save scraping them
+        return {"include_raw_content": True} if "include_raw_content" in parameters else {}
 
-    async def _scrape_data_by_urls(self, sub_query, query_domains: list | None = None):
+    def _start_batch_searches(self, queries: list, query_domains: list, seeded_query: str | None = None) -> None:
+        """
+        Searches all queries with one ``search_many`` request per retriever whose
+        API accepts several queries at once, instead of one request per query.
+
+        Each sub-query's search then awaits its share of the batch. The query
+        seeded from the planning search is left out for the primary retriever.
+        """
+        for index, retriever_class in enumerate(self.researcher.retrievers):
+            if self._is_mcp(retriever_class) or not getattr(retriever_class, "native_search_many", False):
+                continue
+            batch_queries = [q for q in dict.fromkeys(queries) if not (index == 0 and q == seeded_query)]
+            if len(batch_queries) < 2:
+                continue
+            task = asyncio.create_task(run_search_many(
+                retriever_class,
+                batch_queries,
+                max_results=self.researcher.cfg.max_search_results_per_query,
+                query_domains=query_domains,
+                cache=self.researcher.search_cache,
+                **self._retriever_options(retriever_class),
+            ))
+            # A failed batch is reported to the sub-queries awaiting it, if they still are
+            task.add_done_callback(lambda done: done.cancelled() or done.exception())
+            self.logger.info(f"Searching {len(batch_queries)} queries with one {retriever_class.__name__} request")
+            for batch_query in batch_queries:
+                self._batch_searches[(retriever_class.__name__, batch_query, tuple(query_domains or []))] = task
+
+    async def _search_with_deadline(self, retriever_class, query, query_domains: list) -> list:
+        """
+        Searches with one retriever, giving up once its deadline passes.
+
+        A late retriever's results are dropped so they never hold back the other
+        retrievers; latency and outcome are recorded in ``retriever_stats``.
+        """
+        retriever_name = retriever_class.__name__
+        timeout = self._retriever_timeout(retriever_class)
+        started = time.perf_counter()
+        try:
+            batch = self._batch_searches.get((retriever_name, query, tuple(query_domains or [])))
+            if batch is not None:
+                # The query was sent along with the other sub-queries in one batch request
+                search_results = (await asyncio.wait_for(asyncio.shield(batch), timeout=timeout))[query]
+            else:
+                # Instantiate the retriever with the sub-query
+                retriever = retriever_class(query, query_domains=query_domains, **self._retriever_options(retriever_class))
+                search_results = await asyncio.wait_for(
+                    run_search(
+                        retriever,
+                        max_results=self.researcher.cfg.max_search_results_per_query,
+                        cache=self.researcher.search_cache,
+                    ),
+                    timeout=timeout,
+                )
+        except asyncio.TimeoutError:
+            self.retriever_stats.record(retriever_name, time.perf_counter() - started, "timeout")
+            self.logger.warning(
+                f"Dropped {retriever_name} results for query '{query}': no response within its {timeout:g}s deadline "
+                f"(raise RETRIEVER_TIMEOUT or RETRIEVER_TIMEOUTS to wait longer)"
+            )
+            return []
+        except Exception as e:
+            self.retriever_stats.record(retriever_name, time.perf_counter() - started, "error")
+            self.logger.error(f"Error searching with {retriever_name}: {e}")
+            return []
+
+        self.retriever_stats.record(retriever_name, time.perf_counter() - started)
+        return search_results or []
+
+    async def _scrape_data_by_urls(self, sub_query, query_domains: list | None = None, seed_results: list | None = None):
         """
         Runs a sub-query across multiple retrievers and scrapes the resulting URLs.
 
         Args:
             sub_query (str): The sub-query to search for.
+            seed_results (list, optional): Primary retriever results already obtained for the sub-query.
 
         Returns:
             list: A list of scraped content results.
@@ -771,7 +1199,11 @@ class ResearchConductor:
         if query_domains is None:
             query_domains = []
 
-        new_search_urls = await self._search_relevant_source_urls(sub_query, query_domains)
+        search_results = await self._search_relevant_sources(sub_query, query_domains, seed_results)
+        if self.saturation and self.saturation.skip(sub_query, "scrapes"):
+            return []
+        claimed_urls = [result["href"] for result in search_results if result.get("claimed")]
+        search_results = [result for result in search_results if not result.get("claimed")]
 
         # Log the research process if verbose mode is on
         if self.researcher.verbose:
@@ -782,14 +1214,77 @@ class ResearchConductor:
                 self.researcher.websocket,
             )
 
-        # Scrape the new URLs
-        scraped_content = await self.researcher.scraper_manager.browse_urls(new_search_urls)
+        if self.researcher.cfg.snippet_first:
+            scraped_content = await self._snippet_first_pages(sub_query, search_results)
+        else:
+            # Scrape the new URLs
+            scraped_content = await self.researcher.scraper_manager.browse_urls(
+                [result["href"] for result in search_results]
+            )
 
         if self.researcher.vector_store:
             self.researcher.vector_store.load(scraped_content)
 
+        if self.researcher.cfg.shared_page_pool:
+            # Sources another sub-query is still scraping are waited for, not skipped
+            await self.researcher.scraper_manager.page_pool.index(claimed_urls)
+
         return scraped_content
 
+    async def _snippet_first_pages(self, sub_query, search_results: list[dict]) -> list[dict]:
+        """
+        Uses the retrievers' snippets as pages, scraping only where a snippet falls short.
+
+        Snippets are scored by embedding similarity to the sub-query. Of those
+        above the similarity threshold, the SNIPPET_SCRAPE_LIMIT best whose text
+        looks truncated are scraped and replaced by the full page.
+        """
+        cfg = self.researcher.cfg
+        pages = [
+            {
+                "url": result["href"],
+                "raw_content": result.get("raw_content") or result["body"],
+                "title": result.get("title", ""),
+                "image_urls": [],
+            }
+            for result in search_results
+            if result.get("raw_content") or result.get("body")
+        ]
+        if not pages:
+            return []
+
+        embeddings = self.researcher.memory.get_embeddings()
+        texts = [page["raw_content"] for page in pages]
+        query_vector, page_vectors = await asyncio.gather(
+            embeddings.aembed_query(sub_query), embeddings.aembed_documents(texts)
+        )
+        self.researcher.stage_cost_callback("compression")(
+            estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=texts)
+        )
+        query_vector = np.asarray(query_vector)
+        page_vectors = np.asarray(page_vectors)
+        norms = np.linalg.norm(page_vectors, axis=1) * np.linalg.norm(query_vector)
+        scores = np.divide(page_vectors @ query_vector, norms, out=np.zeros(len(pages)), where=norms > 0)
+
+        threshold = float(os.environ.get("SIMILARITY_THRESHOLD", 0.35))
+        ranked = [pages[i] for i in np.argsort(-scores, kind="stable") if scores[i] > threshold]
+        to_scrape = [
+            page["url"] for page in ranked
+            if len(page["raw_content"]) < cfg.snippet_min_chars or page["raw_content"].rstrip().endswith(("...", "…"))
+        ][:cfg.snippet_scrape_limit]
+
+        scraped = await self.researcher.scraper_manager.browse_urls(to_scrape) if to_scrape else []
+        scraped_urls = {page.get("url") for page in scraped if page.get("raw_content")}
+        snippet_pages = [page for page in ranked if page["url"] not in scraped_urls]
+        self.researcher.add_research_sources(snippet_pages)
+        if cfg.shared_page_pool:
+            await self.researcher.scraper_manager.page_pool.add(snippet_pages)
+        self.logger.info(
+            f"Snippet-first: {len(pages)} snippets, {len(ranked)} relevant, "
+            f"{len(scraped_urls)} of {len(to_scrape)} truncated ones scraped for query: {sub_query}"
+        )
+        return scraped + snippet_pages
+
     async def _search(self, retriever, query):
         """
         Perform a search using the specified retriever.
@@ -827,8 +1322,10 @@ class ResearchConductor:
             
             # Perform the search
             if hasattr(retriever_instance, 'search'):
-                results = retriever_instance.search(
-                    max_results=self.researcher.cfg.max_search_results_per_query
+                results = await run_search(
+                    retriever_instance,
+                    max_results=self.researcher.cfg.max_search_results_per_query,
+                    cache=self.researcher.search_cache,
                 )
                 
                 # Log result information
@@ -0,0 +1,120 @@
+import logging
+import math
+from typing import Any, Dict, List
+
+import numpy as np
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
+from ..utils.costs import estimate_embedding_cost
+
+logger = logging.getLogger(__name__)
+
+
+class SaturationMonitor:
+    """
+    Stops research once new context stops adding information.
+
+    The context each sub-query contributes is split into chunks and embedded.
+    With the shared page pool, every sub-query ranks against the same pages,
+    so only the context from the pages it scraped itself is observed.
+    A chunk is novel unless its cosine similarity to a chunk already in the
+    run's context exceeds ``duplicate_similarity``, and a sub-query's novelty
+    is its share of novel chunks. Once at least ``min_fraction`` of the planned
+    sub-queries are observed and the mean novelty of the last ``window`` of
+    them falls below ``threshold``, the run is saturated: remaining sub-queries
+    skip their work and outstanding scrapes are cancelled.
+    """
+
+    def __init__(
+        self,
+        researcher,
+        planned: int,
+        threshold: float = 0.2,
+        min_fraction: float = 0.5,
+        duplicate_similarity: float = 0.85,
+        window: int = 2,
+    ):
+        self.researcher = researcher
+        self.threshold = threshold
+        self.min_fraction = min_fraction
+        self.duplicate_similarity = duplicate_similarity
+        self.window = window
+        self.splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=0)
+        self.planned = planned
+        self.novelty: Dict[str, float] = {}
+        self.reason: str | None = None
+        self.skipped: Dict[str, int] = {}
+        self.scrapes_cancelled = 0
+        self._vectors: List[np.ndarray] = []
+
+    @property
+    def saturated(self) -> bool:
+        return self.reason is not None
+
+    async def observe(self, sub_query: str, context: str) -> float | None:
+        """
+        Adds a sub-query's context to the run's and returns its novelty, or None
+        if it could not be measured. May mark the run saturated.
+        """
+        chunks = self.splitter.split_text(context) if context else []
+        if not chunks:
+            return None
+        try:
+            vectors = await self.researcher.memory.get_embeddings().aembed_documents(chunks)
+        except Exception as e:
+            logger.warning(f"Saturation monitor could not embed the context of '{sub_query}': {e}")
+            return None
+        self.researcher.stage_cost_callback("compression")(
+            estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=chunks)
+        )
+        vectors = np.asarray(vectors, dtype=float)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+        # No await below, so concurrent sub-queries are measured against each other in turn
+        if self._vectors:
+            similarity = (vectors @ np.vstack(self._vectors).T).max(axis=1)
+            novelty = float(np.mean(similarity <= self.duplicate_similarity))
+        else:
+            novelty = 1.0
+        self._vectors.extend(vectors)
+        self.record(sub_query, novelty)
+        return novelty
+
+    def record(self, sub_query: str, novelty: float) -> None:
+        """Records a sub-query's novelty, such as 0 for one that found nothing new. May mark the run saturated."""
+        self.novelty[sub_query] = novelty
+        logger.info(f"Context novelty of '{sub_query}': {novelty:.2f}")
+        self._check()
+
+    def _check(self) -> None:
+        if self.saturated or len(self.novelty) < max(self.window, math.ceil(self.planned * self.min_fraction)):
+            return
+        recent = list(self.novelty.values())[-self.window:]
+        mean_novelty = sum(recent) / len(recent)
+        if mean_novelty < self.threshold:
+            self.reason = (
+                f"novelty {mean_novelty:.2f} of the last {len(recent)} sub-queries below {self.threshold} "
+                f"after {len(self.novelty)} of {self.planned} planned"
+            )
+            logger.info(f"Research saturated: {self.reason}")
+            self.scrapes_cancelled = self.researcher.scraper_manager.cancel_pending()
+
+    def skip(self, sub_query: str, stage: str) -> bool:
+        """Whether the sub-query should skip its remaining work, recording the skip if so."""
+        if not self.saturated:
+            return False
+        self.skipped[stage] = self.skipped.get(stage, 0) + 1
+        logger.info(f"Research saturated ({self.reason}), skipping {stage} for sub-query: {sub_query}")
+        return True
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "planned": self.planned,
+            "observed": len(self.novelty),
+            "novelty": {sub_query: round(novelty, 3) for sub_query, novelty in self.novelty.items()},
+            "stop_reason": self.reason,
+            "skipped": dict(self.skipped),
+            "scrapes_cancelled": self.scrapes_cancelled,
+        }
@@ -1,14 +1,35 @@
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional
+import asyncio
 import json
+import logging
+import math
+import re
 
+import numpy as np
+
+from ..memory.embeddings import OPENAI_EMBEDDING_MODEL
+from ..utils.costs import estimate_embedding_cost
+from ..utils.enum import ReportType
 from ..utils.llm import construct_subtopics
 from ..actions import (
     stream_output,
     generate_report,
     generate_draft_section_titles,
     write_report_introduction,
-    write_conclusion
+    write_report_section,
+    write_conclusion,
+    markdown_index,
+    add_references,
+    needs_reduction,
+    reduce_context,
 )
+from .curator import MAX_SOURCE_CHARS, split_sources
+
+logger = logging.getLogger(__name__)
+
+# Words of each section given to the conclusion of a sectioned report
+SECTION_SUMMARY_WORDS = 80
+_CITED_URL = re.compile(r"\]\((https?://[^)\s]+)\)")
 
 
 class ReportGenerator:
@@ -70,12 +91,17 @@ class ReportGenerator:
                 "main_topic": self.researcher.parent_query,
                 "existing_headers": existing_headers,
                 "relevant_written_contents": relevant_written_contents,
-                "cost_callback": self.researcher.add_costs,
+                "cost_callback": self.researcher.stage_cost_callback("writing"),
             })
         else:
-            report_params["cost_callback"] = self.researcher.add_costs
+            report_params["cost_callback"] = self.researcher.stage_cost_callback("writing")
 
-        report = await generate_report(**report_params, **self.researcher.kwargs)
+        if self._writes_sections(custom_prompt):
+            report = await self._write_sectioned_report(context)
+        else:
+            report = None
+        if not report:
+            report = await generate_report(**report_params, **self.researcher.kwargs)
 
         if self.researcher.verbose:
             await stream_output(
@@ -87,6 +113,167 @@ class ReportGenerator:
 
         return report
 
+    def _writes_sections(self, custom_prompt: str = "") -> bool:
+        """Whether the report is long enough to be written section by section."""
+        cfg = self.researcher.cfg
+        return (
+            getattr(cfg, "sectioned_reports", False)
+            and self.researcher.report_type == ReportType.ResearchReport.value
+            and not custom_prompt
+            and cfg.total_words >= cfg.sectioned_report_min_words
+        )
+
+    async def _write_sectioned_report(self, context) -> Optional[str]:
+        """
+        Write the report section by section. Section titles come from a draft
+        outline, and every section is written concurrently from the part of
+        the context most similar to its title. A context too large for one call
+        is reduced once, before it is split between the sections. The
+        introduction and conclusion are written last, from a summary of the
+        sections, and the report is then streamed in order.
+
+        Returns None, having streamed nothing, if the outline has fewer than two
+        sections or no section was written, so the report is written in one call instead.
+        """
+        cfg = self.researcher.cfg
+        role = cfg.agent_role or self.researcher.role
+        cost_callback = self.researcher.stage_cost_callback("writing")
+        outline = await generate_draft_section_titles(
+            query=self.researcher.query,
+            current_subtopic=self.researcher.query,
+            context=context,
+            role=role,
+            config=cfg,
+            cost_callback=cost_callback,
+            prompt_family=self.researcher.prompt_family,
+            **self.researcher.kwargs
+        )
+        titles = list(dict.fromkeys(
+            section["section_title"] for section in markdown_index("\n".join(outline)).sections()
+            if section["section_title"]
+        ))
+        if len(titles) < 2:
+            return None
+
+        if self.researcher.verbose:
+            await stream_output(
+                "logs",
+                "writing_sections",
+                f"✍️ Writing {len(titles)} sections concurrently for '{self.researcher.query}'...",
+                self.researcher.websocket,
+            )
+
+        # Reduced once here rather than by every section's call
+        if needs_reduction(context, cfg):
+            context = await reduce_context(
+                self.researcher.query, context, cfg,
+                cost_callback=cost_callback, prompt_family=self.researcher.prompt_family,
+            )
+        section_contexts = await self._section_contexts(titles, context)
+        semaphore = asyncio.Semaphore(max(1, cfg.section_concurrency))
+        section_words = max(200, cfg.total_words // len(titles))
+
+        async def write(title: str, section_context) -> str:
+            async with semaphore:
+                return await write_report_section(
+                    query=self.researcher.query,
+                    section_title=title,
+                    other_titles=[other for other in titles if other != title],
+                    context=section_context,
+                    agent_role_prompt=role,
+                    tone=self.researcher.tone,
+                    cfg=cfg,
+                    total_words=section_words,
+                    cost_callback=cost_callback,
+                    prompt_family=self.researcher.prompt_family,
+                    **self.researcher.kwargs
+                )
+
+        written = await asyncio.gather(*[
+            write(title, section_context) for title, section_context in zip(titles, section_contexts)
+        ])
+        sections = [section.strip() for section in written if section.strip()]
+        if not sections:
+            return None
+
+        summaries = "\n\n".join(self._summarize_section(section) for section in sections)
+        introduction, conclusion = await asyncio.gather(
+            write_report_introduction(
+                query=self.researcher.query,
+                context=summaries,
+                agent_role_prompt=role,
+                config=cfg,
+                cost_callback=cost_callback,
+                prompt_family=self.researcher.prompt_family,
+                **self.researcher.kwargs
+            ),
+            write_conclusion(
+                query=self.researcher.query,
+                context=summaries,
+                agent_role_prompt=role,
+                config=cfg,
+                cost_callback=cost_callback,
+                prompt_family=self.researcher.prompt_family,
+                **self.researcher.kwargs
+            ),
+        )
+        for part in (introduction, *sections, conclusion):
+            if part:
+                await stream_output("report", "report", f"{part}\n\n", self.researcher.websocket, False)
+
+        body = "\n\n".join(sections)
+        cited_urls = list(dict.fromkeys(_CITED_URL.findall(body)))
+        report = "\n\n".join(part for part in (introduction, body, conclusion) if part)
+        return add_references(report, cited_urls) if cited_urls else report
+
+    async def _section_contexts(self, titles: List[str], context) -> List[Any]:
+        """
+        The context of each section: the sources most similar to its title, plus
+        every source most similar to it, so no source is left out of the report.
+        Every section gets the whole context if the sources cannot be embedded.
+        """
+        sources = split_sources(context)
+        if len(sources) <= len(titles):
+            return [context] * len(titles)
+        texts = [str(source)[:MAX_SOURCE_CHARS] for source in sources]
+        queries = [f"{self.researcher.query}: {title}" for title in titles]
+        try:
+            embeddings = self.researcher.memory.get_embeddings()
+            source_vectors, title_vectors = await asyncio.gather(
+                embeddings.aembed_documents(texts), embeddings.aembed_documents(queries)
+            )
+            self.researcher.stage_cost_callback("writing")(
+                estimate_embedding_cost(model=OPENAI_EMBEDDING_MODEL, docs=texts + queries)
+            )
+        except Exception as e:
+            logger.warning(f"Error embedding the context of report sections, giving each the whole context: {e}")
+            return [context] * len(titles)
+
+        def normalized(vectors) -> np.ndarray:
+            vectors = np.asarray(vectors, dtype=float)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+
+        similarity = normalized(source_vectors) @ normalized(title_vectors).T
+        per_section = math.ceil(2 * len(sources) / len(titles))
+        best_section = similarity.argmax(axis=1)
+        section_contexts = []
+        for section in range(len(titles)):
+            chosen = set(np.argsort(-similarity[:, section], kind="stable")[:per_section].tolist())
+            chosen.update(np.flatnonzero(best_section == section).tolist())
+            section_sources = [sources[i] for i in sorted(chosen)]
+            section_contexts.append("\n\n".join(section_sources) if isinstance(context, str) else section_sources)
+        return section_contexts
+
+    @staticmethod
+    def _summarize_section(section: str) -> str:
+        """The section's heading and first words, with their citations, for the introduction and conclusion."""
+        lines = section.strip().splitlines()
+        heading = lines[0] if lines and lines[0].startswith("#") else ""
+        words = " ".join(lines[1:] if heading else lines).split()
+        summary = " ".join(words[:SECTION_SUMMARY_WORDS]) + (" ..." if len(words) > SECTION_SUMMARY_WORDS else "")
+        return f"{heading}\n{summary}" if heading else summary
+
     async def write_report_conclusion(self, report_content: str) -> str:
         """
         Write the conclusion for the report.
@@ -110,7 +297,7 @@ class ReportGenerator:
             context=report_content,
             config=self.researcher.cfg,
             agent_role_prompt=self.researcher.cfg.agent_role or self.researcher.role,
-            cost_callback=self.researcher.add_costs,
+            cost_callback=self.researcher.stage_cost_callback("writing"),
             websocket=self.researcher.websocket,
             prompt_family=self.researcher.prompt_family,
             **self.researcher.kwargs
@@ -142,7 +329,7 @@ class ReportGenerator:
             agent_role_prompt=self.researcher.cfg.agent_role or self.researcher.role,
             config=self.researcher.cfg,
             websocket=self.researcher.websocket,
-            cost_callback=self.researcher.add_costs,
+            cost_callback=self.researcher.stage_cost_callback("writing"),
             prompt_family=self.researcher.prompt_family,
             **self.researcher.kwargs
         )
@@ -203,7 +390,7 @@ class ReportGenerator:
             role=self.researcher.cfg.agent_role or self.researcher.role,
             websocket=self.researcher.websocket,
             config=self.researcher.cfg,
-            cost_callback=self.researcher.add_costs,
+            cost_callback=self.researcher.stage_cost_callback("writing"),
             prompt_family=self.researcher.prompt_family,
             **self.researcher.kwargs
         )
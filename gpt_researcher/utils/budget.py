@@ -0,0 +1,194 @@
+"""
+Wall-clock and cost budgets of a research run.
+
+The ``RunController`` of a researcher splits its budgets into a research share
+and a reserve kept for report writing. While a phase runs, its deadline is held
+in a context variable, so every search, scrape and LLM call started from it (in
+any task or worker thread spawned from it) can bound its own timeout with
+``bounded_timeout`` without the deadline being passed down explicitly.
+"""
+import asyncio
+import logging
+import math
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Iterator, Sequence, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# time.monotonic() value at which the current phase must be done, if any
+_deadline: ContextVar[float | None] = ContextVar("research_deadline", default=None)
+
+
+def time_left() -> float | None:
+    """Seconds until the current phase's deadline, or None without one."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+def bounded_timeout(timeout: float | None) -> float | None:
+    """A timeout shortened to the current phase's deadline, if that comes first."""
+    remaining = time_left()
+    if remaining is None:
+        return timeout
+    if timeout is None:
+        return remaining
+    return min(timeout, remaining)
+
+
+class RunController:
+    """
+    Enforces a run's time and cost budgets.
+
+    Research may use all but ``writing_reserve`` of each budget; once a share
+    runs low, lower-priority work (the tail of ordered sub-query and URL lists)
+    is dropped, and once it is used up no new research work is admitted.
+    Budgets of 0 or None are unlimited.
+    """
+
+    def __init__(
+        self,
+        researcher,
+        time_budget_s: float | None = None,
+        cost_budget_usd: float | None = None,
+        writing_reserve: float = 0.25,
+    ):
+        self.researcher = researcher
+        self.time_budget_s = time_budget_s or None
+        self.cost_budget_usd = cost_budget_usd or None
+        self.writing_reserve = min(max(writing_reserve, 0.0), 1.0)
+        self.started: float | None = None
+        self.dropped: dict[str, int] = defaultdict(int)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.time_budget_s or self.cost_budget_usd)
+
+    def start(self) -> None:
+        """Starts the clock; later calls keep the original start."""
+        if self.started is None:
+            self.started = time.monotonic()
+
+    def _deadline(self, share: float) -> float | None:
+        if not self.time_budget_s:
+            return None
+        self.start()
+        return self.started + self.time_budget_s * share
+
+    @property
+    def research_deadline(self) -> float | None:
+        return self._deadline(1.0 - self.writing_reserve)
+
+    @property
+    def run_deadline(self) -> float | None:
+        return self._deadline(1.0)
+
+    def research_share_left(self) -> float:
+        """Fraction (0 to 1) of the tighter research budget still unused."""
+        shares = [1.0]
+        if self.time_budget_s:
+            research_time = self.time_budget_s * (1.0 - self.writing_reserve)
+            remaining = self.research_deadline - time.monotonic()
+            shares.append(remaining / research_time if research_time else 0.0)
+        if self.cost_budget_usd:
+            research_cost = self.cost_budget_usd * (1.0 - self.writing_reserve)
+            remaining = research_cost - self.researcher.research_costs
+            shares.append(remaining / research_cost if research_cost else 0.0)
+        return min(max(min(shares), 0.0), 1.0)
+
+    def exhaustion_reason(self) -> str | None:
+        """Why no more research work is admitted, or None while budget is left."""
+        if self.time_budget_s and time.monotonic() >= self.research_deadline:
+            return "time"
+        # The deadline of the current phase may be a parent run's
+        if time_left() == 0:
+            return "time"
+        if self.cost_budget_usd and self.researcher.research_costs >= self.cost_budget_usd * (1.0 - self.writing_reserve):
+            return "cost"
+        return None
+
+    def research_exhausted(self) -> bool:
+        return self.exhaustion_reason() is not None
+
+    def admit(self, items: Sequence[T], kind: str) -> list[T]:
+        """
+        The highest-priority items (list order) the remaining research budget allows.
+
+        The share of items kept follows the share of budget left, so the tail
+        of the list is dropped first as the budget runs out.
+        """
+        items = list(items)
+        if not self.enabled or not items:
+            return items
+        if self.research_exhausted():
+            keep = 0
+        else:
+            keep = max(1, math.ceil(len(items) * self.research_share_left()))
+        if keep < len(items):
+            self.dropped[kind] += len(items) - keep
+            logger.info(
+                f"Research budget: dropping {len(items) - keep} of {len(items)} {kind} "
+                f"({self.exhaustion_reason() or 'running low'})"
+            )
+        return items[:keep]
+
+    def record_drop(self, kind: str, count: int = 1) -> None:
+        self.dropped[kind] += count
+
+    async def within_budget(self, kind: str, step: Callable[[], Awaitable[T]], fallback: T) -> T:
+        """
+        The result of an LLM step of research, or ``fallback`` once the research
+        budget is used up, whether before the step starts or while it runs.
+
+        A run that is out of budget thereby skips its remaining LLM steps and
+        keeps what it gathered, rather than failing on the deadline.
+        """
+        if reason := self.exhaustion_reason():
+            self.record_drop(kind)
+            logger.info(f"Research {reason} budget used up, skipping {kind}")
+            return fallback
+        try:
+            return await step()
+        except asyncio.TimeoutError:
+            if not (reason := self.exhaustion_reason()):
+                raise
+            self.record_drop(kind)
+            logger.info(f"Research {reason} budget ran out during {kind}")
+            return fallback
+
+    @contextmanager
+    def _phase(self, deadline: float | None) -> Iterator[None]:
+        # A nested run (e.g. a deep-research sub-researcher) never outlives its parent's phase
+        inherited = _deadline.get()
+        if inherited is not None:
+            deadline = inherited if deadline is None else min(deadline, inherited)
+        token = _deadline.set(deadline)
+        try:
+            yield
+        finally:
+            _deadline.reset(token)
+
+    def research_phase(self):
+        """Context in which searches, scrapes and LLM calls end by the research deadline."""
+        return self._phase(self.research_deadline)
+
+    def writing_phase(self):
+        """Context in which LLM calls end by the run deadline, using the writing reserve."""
+        return self._phase(self.run_deadline)
+
+    def summary(self) -> dict[str, Any]:
+        elapsed = time.monotonic() - self.started if self.started is not None else 0.0
+        return {
+            "time_budget_s": self.time_budget_s,
+            "cost_budget_usd": self.cost_budget_usd,
+            "elapsed_s": round(elapsed, 2),
+            "cost_usd": round(self.researcher.research_costs, 6),
+            "exhausted": self.exhaustion_reason(),
+            "dropped": dict(self.dropped),
+        }
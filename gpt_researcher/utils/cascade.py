@@ -0,0 +1,169 @@
+"""
+Model cascade for auxiliary LLM calls.
+
+Cheap auxiliary steps (sub-query generation, agent selection, source curation,
+draft review) first try the fast LLM. The answer is kept only when a confidence
+score built from heuristics (JSON validity, coverage of the query terms and,
+optionally, agreement between two samples) clears the configured threshold;
+otherwise the caller escalates to its usual strategic/smart model.
+"""
+import asyncio
+import logging
+import re
+from collections import defaultdict
+from typing import Any, Callable
+
+import json_repair
+
+from .llm import create_chat_completion
+
+logger = logging.getLogger(__name__)
+
+_WORD_PATTERN = re.compile(r"\w+")
+_STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "how", "in", "is", "it",
+    "of", "on", "or", "that", "the", "this", "to", "was", "what", "when", "where", "which",
+    "who", "why", "will", "with",
+}
+
+
+class CascadeStats:
+    """Tracks how often each cascade stage escalates to the expensive model."""
+
+    def __init__(self):
+        self._attempts: dict[str, int] = defaultdict(int)
+        self._escalations: dict[str, int] = defaultdict(int)
+
+    def record(self, stage: str, escalated: bool) -> None:
+        self._attempts[stage] += 1
+        if escalated:
+            self._escalations[stage] += 1
+
+    def escalation_rate(self, stage: str) -> float:
+        attempts = self._attempts.get(stage, 0)
+        return self._escalations.get(stage, 0) / attempts if attempts else 0.0
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        """Per-stage attempts, escalations and escalation rate."""
+        return {
+            stage: {
+                "attempts": attempts,
+                "escalations": self._escalations.get(stage, 0),
+                "escalation_rate": round(self.escalation_rate(stage), 3),
+            }
+            for stage, attempts in self._attempts.items()
+        }
+
+
+def _terms(text: str) -> set[str]:
+    return {word for word in _WORD_PATTERN.findall(text.lower()) if word not in _STOPWORDS}
+
+
+def term_coverage(query: str, text: str) -> float:
+    """Fraction of the query's content words that appear in the text."""
+    query_terms = _terms(query)
+    if not query_terms:
+        return 1.0
+    return len(query_terms & _terms(text)) / len(query_terms)
+
+
+def sample_agreement(first: str, second: str) -> float:
+    """Jaccard similarity of the content words of two sampled answers."""
+    first_terms, second_terms = _terms(first), _terms(second)
+    if not first_terms and not second_terms:
+        return 1.0
+    return len(first_terms & second_terms) / len(first_terms | second_terms)
+
+
+def score_sub_queries(query: str) -> Callable[[str], float]:
+    """Scores a sub-query list: it must parse, and together cover the query terms."""
+    def score(response: str) -> float:
+        try:
+            parsed = json_repair.loads(response)
+        except Exception:
+            return 0.0
+        if not isinstance(parsed, list) or not parsed or not all(isinstance(q, str) for q in parsed):
+            return 0.0
+        return 0.5 + 0.5 * term_coverage(query, " ".join(parsed))
+    return score
+
+
+def score_json_object(*required_keys: str) -> Callable[[str], float]:
+    """Scores a JSON object answer: parseable (possibly fenced) JSON carrying all required keys."""
+    def score(response: str) -> float:
+        try:
+            parsed = json_repair.loads(response)
+        except Exception:
+            return 0.0
+        if not isinstance(parsed, dict) or not all(parsed.get(key) for key in required_keys):
+            return 0.0
+        return 1.0
+    return score
+
+
+def score_json_list(response: str) -> float:
+    """Scores a JSON list answer: parseable (possibly fenced), non-empty JSON list."""
+    try:
+        parsed = json_repair.loads(response)
+    except Exception:
+        return 0.0
+    return 1.0 if isinstance(parsed, list) and parsed else 0.0
+
+
+async def cascade_chat_completion(
+    messages: list[dict[str, str]],
+    cfg,
+    stage: str,
+    score: Callable[[str], float],
+    stats: CascadeStats | None = None,
+    cost_callback: callable = None,
+    samples: int | None = None,
+    agreement: Callable[[str, str], float] = sample_agreement,
+    **kwargs
+) -> str | None:
+    """
+    Try an auxiliary call on the fast LLM first.
+
+    Args:
+        messages: The messages to send.
+        cfg: Configuration object.
+        stage: Name of the pipeline stage, used for escalation statistics.
+        score: Maps a response to a confidence between 0 and 1.
+        stats: Optional statistics collector.
+        cost_callback: Callback for cost calculation.
+        samples: Number of fast samples to draw, defaults to ``LLM_CASCADE_SAMPLES``.
+        agreement: Maps two sampled responses to an agreement score between 0 and 1.
+        **kwargs: Additional arguments for ``create_chat_completion``.
+
+    Returns:
+        The fast model's response when it is confident enough, otherwise None
+        so the caller falls back to its strategic/smart model.
+    """
+    samples = max(1, int(samples or getattr(cfg, "llm_cascade_samples", 1) or 1))
+    try:
+        responses = await asyncio.gather(*[
+            create_chat_completion(
+                model=cfg.fast_llm_model,
+                messages=messages,
+                llm_provider=cfg.fast_llm_provider,
+                llm_kwargs=cfg.llm_kwargs,
+                cost_callback=cost_callback,
+                **kwargs
+            )
+            for _ in range(samples)
+        ])
+        confidence = min(score(response) for response in responses)
+        if samples > 1:
+            confidence *= min(agreement(responses[0], other) for other in responses[1:])
+    except Exception as e:
+        logger.warning(f"Cascade stage '{stage}' failed on the fast LLM: {e}")
+        responses, confidence = [None], 0.0
+
+    escalated = confidence < cfg.llm_cascade_threshold
+    if stats is not None:
+        stats.record(stage, escalated)
+    logger.info(
+        f"Cascade stage '{stage}': confidence {confidence:.2f}, "
+        f"{'escalating to the strategic/smart model' if escalated else 'using fast LLM answer'}"
+    )
+    return None if escalated else responses[0]
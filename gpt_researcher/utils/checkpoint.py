@@ -0,0 +1,182 @@
+"""
+Checkpoints of research runs, so an interrupted run can be resumed.
+
+A ``CheckpointStore`` is a local SQLite file holding, per run id, the
+parameters the run was started with and the result of every stage it has
+completed: agent and role, sub-queries, search results, ranked context per
+sub-query, the research context and written sections. Scraped pages are
+stored once per cache key and referenced from the runs that scraped them.
+
+A ``RunCheckpoint`` binds a store to one run id. Stages look themselves up
+before doing their work and record their result after it, so a resumed run
+restarts from its last completed stage. Without a store every lookup misses
+and every record is dropped.
+"""
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    params TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS stages (
+    run_id TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    value TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (run_id, stage)
+);
+CREATE TABLE IF NOT EXISTS pages (
+    cache_key TEXT PRIMARY KEY,
+    url TEXT NOT NULL,
+    pages TEXT NOT NULL
+);
+"""
+
+_stores: dict[str, "CheckpointStore"] = {}
+_stores_lock = threading.Lock()
+
+
+def digest(text: str) -> str:
+    """Short stable key for arbitrary text such as a query or URL."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+
+
+def get_checkpoint_store(path: str) -> "CheckpointStore":
+    """The store at ``path``, shared by every run of the process that uses it."""
+    path = os.path.abspath(path)
+    with _stores_lock:
+        if path not in _stores:
+            _stores[path] = CheckpointStore(path)
+        return _stores[path]
+
+
+class CheckpointStore:
+    """SQLite-backed store of run parameters, completed stages and scraped pages."""
+
+    def __init__(self, path: str):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def _write(self, sql: str, args: tuple) -> None:
+        with self._lock:
+            self._conn.execute(sql, args)
+            self._conn.commit()
+
+    def _read(self, sql: str, args: tuple) -> tuple | None:
+        with self._lock:
+            return self._conn.execute(sql, args).fetchone()
+
+    def register_run(self, run_id: str, kind: str, params: dict, replace: bool = False) -> None:
+        """Records what a run was started with; an existing record is kept unless ``replace``."""
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        self._write(
+            f"{verb} INTO runs (run_id, kind, params, created_at) VALUES (?, ?, ?, ?)",
+            (run_id, kind, json.dumps(params, default=str), time.time()),
+        )
+
+    def get_run(self, run_id: str) -> dict | None:
+        row = self._read("SELECT kind, params FROM runs WHERE run_id = ?", (run_id,))
+        if row is None:
+            return None
+        return {"kind": row[0], "params": json.loads(row[1])}
+
+    def put(self, run_id: str, stage: str, value: Any) -> None:
+        self._write(
+            "INSERT OR REPLACE INTO stages (run_id, stage, value, updated_at) VALUES (?, ?, ?, ?)",
+            (run_id, stage, json.dumps(value, default=str), time.time()),
+        )
+
+    def get(self, run_id: str, stage: str) -> Any:
+        row = self._read("SELECT value FROM stages WHERE run_id = ? AND stage = ?", (run_id, stage))
+        return json.loads(row[0]) if row else None
+
+    def put_pages(self, cache_key: str, url: str, pages: list[dict]) -> None:
+        self._write(
+            "INSERT OR REPLACE INTO pages (cache_key, url, pages) VALUES (?, ?, ?)",
+            (cache_key, url, json.dumps(pages, default=str)),
+        )
+
+    def get_pages(self, cache_key: str) -> list[dict] | None:
+        row = self._read("SELECT pages FROM pages WHERE cache_key = ?", (cache_key,))
+        return json.loads(row[0]) if row else None
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class RunCheckpoint:
+    """
+    The completed stages of one run. Stage values must be JSON-serializable.
+
+    ``RunCheckpoint()`` without a store is disabled: ``get`` always misses and
+    ``put`` does nothing, so callers need not check whether checkpointing is on.
+    """
+
+    def __init__(self, store: CheckpointStore | None = None, run_id: str | None = None):
+        self.store = store if run_id else None
+        self.run_id = run_id
+
+    @property
+    def enabled(self) -> bool:
+        return self.store is not None
+
+    def register(self, kind: str, params: dict, replace: bool = False) -> None:
+        if self.store:
+            self.store.register_run(self.run_id, kind, params, replace=replace)
+
+    def get(self, stage: str, default: Any = None) -> Any:
+        if not self.store:
+            return default
+        value = self.store.get(self.run_id, stage)
+        if value is None:
+            return default
+        logger.debug(f"Run {self.run_id}: restored stage {stage}")
+        return value
+
+    def put(self, stage: str, value: Any) -> None:
+        if not self.store:
+            return
+        try:
+            self.store.put(self.run_id, stage, value)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            # A failed checkpoint only costs the ability to skip this stage on resume
+            logger.warning(f"Run {self.run_id}: could not checkpoint stage {stage}: {e}")
+
+    def child(self, name: str) -> str | None:
+        """Run id for a nested run (e.g. a subtopic researcher) checkpointed under this one."""
+        return f"{self.run_id}/{name}" if self.store else None
+
+    def get_pages(self, url: str) -> list[dict] | None:
+        """The pages this run scraped from ``url``, if it got that far."""
+        cache_key = self.get(f"page:{digest(url)}")
+        return self.store.get_pages(cache_key) if cache_key else None
+
+    def put_pages(self, url: str, pages: list[dict]) -> None:
+        if not self.store:
+            return
+        cache_key = digest(url)
+        try:
+            self.store.put_pages(cache_key, url, pages)
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            logger.warning(f"Run {self.run_id}: could not checkpoint pages of {url}: {e}")
+            return
+        self.put(f"page:{cache_key}", cache_key)
@@ -1,3 +1,7 @@
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any
+
 import tiktoken
 
 # Per OpenAI Pricing Page: https://openai.com/api/pricing/
@@ -7,19 +11,177 @@ OUTPUT_COST_PER_TOKEN = 0.000015
 IMAGE_INFERENCE_COST = 0.003825
 EMBEDDING_COST = 0.02 / 1000000 # Assumes new ada-3-small
 
+# Texts longer than this are not tokenized for cost estimates; their token
+# count is approximated from their length instead.
+MAX_EXACT_TOKENIZE_CHARS = 20_000
+CHARS_PER_TOKEN = 4
+
+# USD per million tokens: (input, output, cached input). Model names are matched
+# by longest prefix, with any "provider/" prefix stripped.
+MODEL_PRICES: dict[str, tuple[float, float, float]] = {
+    "gpt-5-nano": (0.05, 0.40, 0.005),
+    "gpt-5-mini": (0.25, 2.00, 0.025),
+    "gpt-5": (1.25, 10.00, 0.125),
+    "gpt-4.1-nano": (0.10, 0.40, 0.025),
+    "gpt-4.1-mini": (0.40, 1.60, 0.10),
+    "gpt-4.1": (2.00, 8.00, 0.50),
+    "gpt-4o-mini": (0.15, 0.60, 0.075),
+    "gpt-4o": (2.50, 10.00, 1.25),
+    "o4-mini": (1.10, 4.40, 0.275),
+    "o3-mini": (1.10, 4.40, 0.55),
+    "o3": (2.00, 8.00, 0.50),
+    "o1-mini": (1.10, 4.40, 0.55),
+    "o1": (15.00, 60.00, 7.50),
+    "claude-opus-4": (15.00, 75.00, 1.50),
+    "claude-sonnet-4": (3.00, 15.00, 0.30),
+    "claude-3-7-sonnet": (3.00, 15.00, 0.30),
+    "claude-3-5-sonnet": (3.00, 15.00, 0.30),
+    "claude-3-5-haiku": (0.80, 4.00, 0.08),
+    "gemini-2.5-pro": (1.25, 10.00, 0.31),
+    "gemini-2.5-flash": (0.30, 2.50, 0.075),
+    "deepseek-chat": (0.27, 1.10, 0.07),
+    "deepseek-reasoner": (0.55, 2.19, 0.14),
+}
+
+# Context window sizes in tokens, matched like MODEL_PRICES.
+MODEL_CONTEXT_WINDOWS: dict[str, int] = {
+    "gpt-5": 400_000,
+    "gpt-4.1": 1_047_576,
+    "gpt-4o": 128_000,
+    "o4-mini": 200_000,
+    "o3": 200_000,
+    "o1-mini": 128_000,
+    "o1": 200_000,
+    "claude": 200_000,
+    "gemini-2.5": 1_048_576,
+    "deepseek": 64_000,
+}
+
+# USD per million tokens.
+EMBEDDING_PRICES: dict[str, float] = {
+    "text-embedding-3-small": 0.02,
+    "text-embedding-3-large": 0.13,
+    "text-embedding-ada-002": 0.10,
+}
+
+# Anthropic bills prompt-cache writes at 1.25x the input price.
+CACHE_WRITE_MULTIPLIER = 1.25
+
+
+@lru_cache(maxsize=None)
+def get_encoding(model: str | None = None) -> tiktoken.Encoding:
+    """Cached tiktoken encoding for a model, falling back to ``ENCODING_MODEL``."""
+    if model:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            pass
+    return tiktoken.get_encoding(ENCODING_MODEL)
+
+
+def count_tokens(text: str, model: str | None = None) -> int:
+    """Token count of a text; long texts are approximated from their length."""
+    if len(text) > MAX_EXACT_TOKENIZE_CHARS:
+        return len(text) // CHARS_PER_TOKEN
+    return len(get_encoding(model).encode(text, disallowed_special=()))
+
+
+def _lookup_price(model: str | None, prices: dict):
+    if not model:
+        return None
+    name = model.rsplit("/", 1)[-1].lower()
+    matches = [key for key in prices if name.startswith(key)]
+    return prices[max(matches, key=len)] if matches else None
+
+
+def get_model_prices(model: str | None) -> tuple[float, float, float]:
+    """Per-token (input, output, cached input) prices for a model."""
+    if prices := _lookup_price(model, MODEL_PRICES):
+        return tuple(price / 1_000_000 for price in prices)
+    return INPUT_COST_PER_TOKEN, OUTPUT_COST_PER_TOKEN, INPUT_COST_PER_TOKEN
 
-# Cost estimation is via OpenAI libraries and models. May vary for other models
-def estimate_llm_cost(input_content: str, output_content: str) -> float:
-    encoding = tiktoken.get_encoding(ENCODING_MODEL)
-    input_tokens = encoding.encode(input_content)
-    output_tokens = encoding.encode(output_content)
-    input_costs = len(input_tokens) * INPUT_COST_PER_TOKEN
-    output_costs = len(output_tokens) * OUTPUT_COST_PER_TOKEN
-    return input_costs + output_costs
+
+def get_context_window(model: str | None) -> int | None:
+    """Context window of a model in tokens, or None when it is unknown."""
+    return _lookup_price(model, MODEL_CONTEXT_WINDOWS)
+
+
+def llm_usage_cost(
+    input_tokens: int,
+    output_tokens: int,
+    model: str | None = None,
+    cached_tokens: int = 0,
+    cache_write_tokens: int = 0,
+) -> float:
+    """Cost of an LLM call from its token counts and the model's prices."""
+    input_price, output_price, cached_price = get_model_prices(model)
+    uncached_tokens = max(input_tokens - cached_tokens - cache_write_tokens, 0)
+    return (
+        uncached_tokens * input_price
+        + cached_tokens * cached_price
+        + cache_write_tokens * input_price * CACHE_WRITE_MULTIPLIER
+        + output_tokens * output_price
+    )
+
+
+def usage_from_metadata(usage_metadata: dict[str, Any] | None) -> dict[str, int] | None:
+    """Token counts from LangChain ``usage_metadata``, or None when it is missing."""
+    if not isinstance(usage_metadata, dict) or not usage_metadata.get("input_tokens"):
+        return None
+    details = usage_metadata.get("input_token_details") or {}
+    return {
+        "input_tokens": usage_metadata.get("input_tokens", 0),
+        "output_tokens": usage_metadata.get("output_tokens", 0),
+        "cached_tokens": details.get("cache_read", 0) or 0,
+        "cache_write_tokens": details.get("cache_creation", 0) or 0,
+    }
+
+
+def estimate_usage(input_content: str, output_content: str, model: str | None = None) -> dict[str, int]:
+    """Token counts estimated locally for providers that report no usage."""
+    return {
+        "input_tokens": count_tokens(input_content, model),
+        "output_tokens": count_tokens(output_content, model),
+        "cached_tokens": 0,
+        "cache_write_tokens": 0,
+    }
+
+
+# Local estimate for calls whose provider reports no token usage
+def estimate_llm_cost(input_content: str, output_content: str, model: str | None = None) -> float:
+    return llm_usage_cost(**estimate_usage(input_content, output_content, model), model=model)
 
 
 def estimate_embedding_cost(model, docs):
-    encoding = tiktoken.encoding_for_model(model)
-    total_tokens = sum(len(encoding.encode(str(doc))) for doc in docs)
-    return total_tokens * EMBEDDING_COST
+    # Approximated from length: embedding calls report no usage, and tokenizing
+    # every scraped page would cost more time than the estimate is worth.
+    total_tokens = sum(len(str(doc)) for doc in docs) // CHARS_PER_TOKEN
+    price = _lookup_price(model, EMBEDDING_PRICES)
+    return total_tokens * (price / 1_000_000 if price is not None else EMBEDDING_COST)
+
+
+class UsageTracker:
+    """Accumulates cost, token counts and calls per research stage."""
+
+    def __init__(self):
+        self._stages: dict[str, dict[str, float]] = defaultdict(lambda: {
+            "cost": 0.0,
+            "calls": 0,
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cached_tokens": 0,
+        })
+
+    def record(self, stage: str, cost: float, usage: dict[str, int] | None = None) -> None:
+        totals = self._stages[stage]
+        totals["cost"] += cost
+        totals["calls"] += 1
+        for key in ("input_tokens", "output_tokens", "cached_tokens"):
+            totals[key] += (usage or {}).get(key, 0)
 
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Per-stage totals, with costs rounded to micro-dollars."""
+        return {
+            stage: {**totals, "cost": round(totals["cost"], 6)}
+            for stage, totals in self._stages.items()
+        }
@@ -0,0 +1,51 @@
+"""
+Shared HTTP clients.
+
+One ``httpx.AsyncClient`` is kept per event loop so that every search API call
+made during a run reuses pooled keep-alive connections (per host) instead of
+opening a new TCP/TLS connection each time. Inside a ``ResearchSession`` the
+session's own client is used instead, and closed with the session. HTTP/2 is
+negotiated when the optional ``h2`` package is installed.
+"""
+import asyncio
+import importlib.util
+import weakref
+
+import httpx
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+DEFAULT_TIMEOUT = httpx.Timeout(20.0, connect=10.0)
+DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0)
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+
+def _new_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=DEFAULT_LIMITS,
+        timeout=DEFAULT_TIMEOUT,
+        follow_redirects=True,
+    )
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """The current session's client, else the shared client of the running event loop, created on first use."""
+    from ..session import current_session
+
+    if (session := current_session()) is not None:
+        return session.http_client(_new_client)
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _new_client()
+        _clients[loop] = client
+    return client
+
+
+async def close_http_client() -> None:
+    """Closes the shared client of the running event loop, if one was opened."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
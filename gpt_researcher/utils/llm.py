@@ -1,6 +1,8 @@
 # libraries
 from __future__ import annotations
 
+import asyncio
+import inspect
 import logging
 from typing import Any
 
@@ -10,13 +12,56 @@ from langchain.prompts import PromptTemplate
 from gpt_researcher.llm_provider.generic.base import NO_SUPPORT_TEMPERATURE_MODELS, SUPPORT_REASONING_EFFORT_MODELS, ReasoningEfforts
 
 from ..prompts import PromptFamily
-from .costs import estimate_llm_cost
+from .budget import time_left
+from .costs import estimate_usage, llm_usage_cost, usage_from_metadata
 from .validators import Subtopics
 import os
 
 
+def cacheable_user_message(content: str, prefix: str) -> dict[str, Any]:
+    """Build a user message whose leading ``prefix`` is marked as cacheable.
+
+    The prefix becomes its own content block carrying an ephemeral
+    ``cache_control`` marker. Providers without explicit cache markers get the
+    blocks joined back into the original string by ``GenericLLMProvider``.
+    """
+    if not prefix or not content.startswith(prefix) or len(content) == len(prefix):
+        return {"role": "user", "content": content}
+    return {
+        "role": "user",
+        "content": [
+            {"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": content[len(prefix):]},
+        ],
+    }
+
+
+def cached_input_tokens(usage: dict[str, Any] | None) -> int:
+    """Number of prompt tokens the provider served from its prefix cache."""
+    if not isinstance(usage, dict):
+        return 0
+    return (usage.get("input_token_details") or {}).get("cache_read", 0) or 0
+
+
+def _report_cost(cost_callback: callable, cost: float, usage: dict[str, int]) -> None:
+    """Pass the token usage along to cost callbacks that accept it."""
+    try:
+        accepts_usage = "usage" in inspect.signature(cost_callback).parameters
+    except (TypeError, ValueError):
+        accepts_usage = False
+    if accepts_usage:
+        cost_callback(cost, usage=usage)
+    else:
+        cost_callback(cost)
+
+
 def get_llm(llm_provider, **kwargs):
     from gpt_researcher.llm_provider import GenericLLMProvider
+    from gpt_researcher.session import current_session
+
+    # Inside a research session, calls with the same arguments share one chat model
+    if (session := current_session()) is not None:
+        return session.llm(llm_provider, **kwargs)
     return GenericLLMProvider.from_provider(llm_provider, **kwargs)
 
 
@@ -81,13 +126,24 @@ async def create_chat_completion(
     response = ""
     # create response
     for _ in range(10):  # maximum of 10 attempts
-        response = await provider.get_chat_response(
-            messages, stream, websocket, **kwargs
+        # Calls made while a run budget applies end by its current deadline
+        response = await asyncio.wait_for(
+            provider.get_chat_response(messages, stream, websocket, **kwargs),
+            timeout=time_left(),
         )
 
+        if cached_tokens := cached_input_tokens(getattr(provider, "last_usage", None)):
+            logging.getLogger(__name__).info(
+                f"Prompt cache hit: {cached_tokens} of {provider.last_usage.get('input_tokens', 0)} "
+                f"input tokens served from cache ({model})"
+            )
+
         if cost_callback:
-            llm_costs = estimate_llm_cost(str(messages), response)
-            cost_callback(llm_costs)
+            # Prefer the provider's own token counts over tokenizing locally
+            usage = usage_from_metadata(getattr(provider, "last_usage", None)) \
+                or estimate_usage(str(messages), response, model)
+            llm_costs = llm_usage_cost(**usage, model=model)
+            _report_cost(cost_callback, llm_costs, usage)
 
         return response
 
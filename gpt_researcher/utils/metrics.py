@@ -0,0 +1,70 @@
+"""
+Lightweight in-process metrics for research runs.
+"""
+import bisect
+from collections import defaultdict
+from typing import Any
+
+# Upper bounds, in seconds, of the latency histogram buckets
+LATENCY_BUCKETS = (0.25, 0.5, 1.0, 2.0, 5.0, 10.0, 30.0)
+
+
+class LatencyHistogram:
+    """Counts observations into fixed latency buckets."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.observations = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.total += seconds
+        self.observations += 1
+
+    def summary(self) -> dict[str, Any]:
+        labels = [f"<={bound}s" for bound in self.buckets] + [f">{self.buckets[-1]}s"]
+        return {
+            "count": self.observations,
+            "mean_seconds": round(self.total / self.observations, 3) if self.observations else 0.0,
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class RetrieverStats:
+    """Per-retriever latency histograms and outcome counts (ok, error, timeout)."""
+
+    def __init__(self):
+        self._latency: dict[str, LatencyHistogram] = defaultdict(LatencyHistogram)
+        self._outcomes: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def record(self, retriever: str, seconds: float, outcome: str = "ok") -> None:
+        self._latency[retriever].observe(seconds)
+        self._outcomes[retriever][outcome] += 1
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        return {
+            retriever: {"outcomes": dict(self._outcomes[retriever]), "latency": histogram.summary()}
+            for retriever, histogram in self._latency.items()
+        }
+
+
+class CacheStats:
+    """Per-name cache lookup counts (hit, miss, expired) and hit rates."""
+
+    def __init__(self):
+        self._outcomes: dict[str, dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def record(self, name: str, outcome: str) -> None:
+        self._outcomes[name][outcome] += 1
+
+    def summary(self) -> dict[str, dict[str, Any]]:
+        summary = {}
+        for name, outcomes in self._outcomes.items():
+            lookups = sum(outcomes.values())
+            summary[name] = {
+                **dict(outcomes),
+                "hit_rate": round(outcomes.get("hit", 0) / lookups, 3) if lookups else 0.0,
+            }
+        return summary
@@ -0,0 +1,126 @@
+"""
+Staged pipeline engine.
+
+Items flow through a chain of async stages connected by bounded queues. Each
+stage runs its own pool of workers, so an item moves on as soon as its stage is
+done with it and a full queue pushes back on the stages before it. Stage
+handlers are async generators: they may yield zero, one or many items for the
+next stage.
+"""
+import asyncio
+import logging
+import time
+from typing import Any, AsyncIterator, Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class PipelineStage:
+    """A named pipeline stage with its handler, worker count and statistics."""
+
+    def __init__(self, name: str, handler: Callable[[Any], AsyncIterator[Any]], workers: int = 1):
+        self.name = name
+        self.handler = handler
+        self.workers = max(1, int(workers))
+        self.processed = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.max_queue_depth = 0
+
+    async def _process(self, item: Any, output: asyncio.Queue | Callable[[Any], None]) -> None:
+        """Run the handler on one item, timing only the handler's own work."""
+        generator = self.handler(item)
+        while True:
+            started = time.perf_counter()
+            try:
+                result = await generator.__anext__()
+            except StopAsyncIteration:
+                self.busy_seconds += time.perf_counter() - started
+                break
+            self.busy_seconds += time.perf_counter() - started
+            # Waiting on a full downstream queue is backpressure, not work
+            if isinstance(output, asyncio.Queue):
+                await output.put(result)
+            else:
+                output(result)
+
+    async def _worker(self, queue: asyncio.Queue, output: asyncio.Queue | Callable[[Any], None]) -> None:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            self.max_queue_depth = max(self.max_queue_depth, queue.qsize() + 1)
+            try:
+                await self._process(item, output)
+                self.processed += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                logger.error(f"Pipeline stage '{self.name}' failed on {item!r}: {e}")
+
+
+class Pipeline:
+    """Runs items through stages connected by bounded asyncio queues."""
+
+    def __init__(self, stages: list[PipelineStage], queue_size: int = 32):
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.stages = stages
+        self.queue_size = max(1, int(queue_size))
+        self.elapsed_seconds = 0.0
+
+    async def run(self, items: Iterable[Any], sink: Callable[[Any], None] | None = None) -> list[Any]:
+        """
+        Push items through every stage and wait until the pipeline drains.
+
+        Args:
+            items: Inputs of the first stage.
+            sink: Optional consumer of the last stage's outputs. Without one they
+                are collected and returned.
+
+        Returns:
+            list: Everything yielded by the last stage, in completion order
+            (empty when a sink is given).
+        """
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.stages]
+        results: list[Any] = []
+        sink = sink or results.append
+        started = time.perf_counter()
+
+        async def feed():
+            for item in items:
+                await queues[0].put(item)
+            for _ in range(self.stages[0].workers):
+                await queues[0].put(_DONE)
+
+        async def run_stage(index: int):
+            stage = self.stages[index]
+            output = queues[index + 1] if index + 1 < len(self.stages) else sink
+            await asyncio.gather(*[stage._worker(queues[index], output) for _ in range(stage.workers)])
+            if index + 1 < len(self.stages):
+                for _ in range(self.stages[index + 1].workers):
+                    await queues[index + 1].put(_DONE)
+
+        try:
+            await asyncio.gather(feed(), *[run_stage(i) for i in range(len(self.stages))])
+        finally:
+            self.elapsed_seconds = time.perf_counter() - started
+        return results
+
+    def utilization(self) -> dict[str, dict[str, Any]]:
+        """Per-stage throughput and the share of worker time spent doing work."""
+        stats = {}
+        for stage in self.stages:
+            capacity = stage.workers * self.elapsed_seconds
+            stats[stage.name] = {
+                "workers": stage.workers,
+                "processed": stage.processed,
+                "errors": stage.errors,
+                "busy_seconds": round(stage.busy_seconds, 3),
+                "utilization": round(stage.busy_seconds / capacity, 3) if capacity else 0.0,
+                "max_queue_depth": stage.max_queue_depth,
+            }
+        return stats
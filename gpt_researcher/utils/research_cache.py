@@ -0,0 +1,171 @@
+"""
+Cache of completed research, served to repeated and paraphrased queries.
+
+A ``ResearchCache`` is a local SQLite file holding the outcome of research
+runs: the final (curated) context, visited URLs, sources, images, agent and
+role. Entries are keyed by a fingerprint of everything besides the query that
+changes what research finds (report type and source, domains, source URLs,
+retrievers, embedding model, ...) together with the embedding of the query.
+A run is served an entry with the same fingerprint whose query embedding is
+similar enough to its own and that is younger than the cache's time to
+live. Least recently used entries are evicted once the cache holds more than
+its maximum number of entries.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from .metrics import CacheStats
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS research (
+    entry_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    fingerprint TEXT NOT NULL,
+    query TEXT NOT NULL,
+    embedding TEXT NOT NULL,
+    research TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS research_fingerprint ON research (fingerprint);
+CREATE INDEX IF NOT EXISTS research_last_used ON research (last_used);
+"""
+
+_caches: dict[str, "ResearchCache"] = {}
+_caches_lock = threading.Lock()
+
+
+def get_research_cache(cfg) -> "ResearchCache | None":
+    """The research cache configured by ``cfg``, shared by every run using its file; None when disabled."""
+    if not getattr(cfg, "research_cache", False):
+        return None
+    path = os.path.abspath(cfg.research_cache_path)
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = ResearchCache(path, max_entries=cfg.research_cache_max_entries)
+        cache = _caches[path]
+    cache.ttl = float(cfg.research_cache_ttl_s)
+    return cache
+
+
+def research_fingerprint(researcher) -> str | None:
+    """
+    Fingerprint of the parameters besides the query that shape a researcher's
+    research, or None if its research cannot be cached (it is given documents,
+    a vector store or MCP servers whose content the cache cannot see).
+    """
+    if researcher.documents or researcher.vector_store or researcher.mcp_configs:
+        return None
+    cfg = researcher.cfg
+    params = {
+        "report_type": researcher.report_type,
+        "report_source": researcher.report_source,
+        "parent_query": researcher.parent_query,
+        # Only an agent and role given by the caller; chosen ones come from the cache
+        "agent": researcher.agent,
+        "role": researcher.role,
+        "query_domains": sorted(domain.lower() for domain in researcher.query_domains),
+        "source_urls": sorted(researcher.source_urls or []),
+        "document_urls": sorted(researcher.document_urls or []),
+        "complement_source_urls": researcher.complement_source_urls,
+        "retrievers": sorted(retriever.__name__ for retriever in researcher.retrievers),
+        "embedding": [cfg.embedding_provider, cfg.embedding_model],
+        "curate_sources": cfg.curate_sources,
+        "doc_path": cfg.doc_path,
+    }
+    if researcher.deep_researcher is not None:
+        params["deep_research"] = [researcher.deep_researcher.breadth, researcher.deep_researcher.depth]
+    raw = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ResearchCache:
+    """On-disk, TTL-bounded LRU cache of research outcomes, looked up by query similarity."""
+
+    def __init__(self, path: str, ttl: float = 21600, max_entries: int = 1000):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def lookup(self, fingerprint: str, embedding: List[float], threshold: float) -> Dict[str, Any] | None:
+        """
+        The fresh entry with the fingerprint whose query embedding is most
+        similar to ``embedding``, if their cosine similarity is at least
+        ``threshold``: its ``research`` with the ``query`` it was made for, its
+        ``similarity`` and its ``age_s``. None if there is no such entry.
+        """
+        now = time.time()
+        with self._lock:
+            expired = self._conn.execute(
+                "DELETE FROM research WHERE fingerprint = ? AND created_at <= ?", (fingerprint, now - self.ttl)
+            ).rowcount
+            rows = self._conn.execute(
+                "SELECT entry_id, query, embedding, created_at FROM research WHERE fingerprint = ?", (fingerprint,)
+            ).fetchall()
+            self._conn.commit()
+        if not rows:
+            self.stats.record("research", "expired" if expired else "miss")
+            return None
+
+        vectors = np.asarray([json.loads(row[2]) for row in rows], dtype=float)
+        query_vector = np.asarray(embedding, dtype=float)
+        norms = np.linalg.norm(vectors, axis=1) * (np.linalg.norm(query_vector) or 1.0)
+        similarity = np.divide(vectors @ query_vector, norms, out=np.zeros(len(rows)), where=norms > 0)
+        # Most similar first, then most recent
+        best = max(range(len(rows)), key=lambda i: (round(float(similarity[i]), 6), rows[i][3]))
+        if similarity[best] < threshold:
+            self.stats.record("research", "miss")
+            return None
+
+        entry_id, query, _, created_at = rows[best]
+        with self._lock:
+            row = self._conn.execute("SELECT research FROM research WHERE entry_id = ?", (entry_id,)).fetchone()
+            self._conn.execute("UPDATE research SET last_used = ? WHERE entry_id = ?", (now, entry_id))
+            self._conn.commit()
+        if row is None:
+            self.stats.record("research", "miss")
+            return None
+        self.stats.record("research", "hit")
+        return {
+            "query": query,
+            "research": json.loads(row[0]),
+            "similarity": float(similarity[best]),
+            "age_s": now - created_at,
+        }
+
+    def store(self, fingerprint: str, query: str, embedding: List[float], research: Dict[str, Any]) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO research (fingerprint, query, embedding, research, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (fingerprint, query, json.dumps([float(x) for x in embedding]), json.dumps(research, default=str), now, now),
+            )
+            # Evict the least recently used entries beyond the maximum size
+            self._conn.execute(
+                "DELETE FROM research WHERE entry_id IN ("
+                "SELECT entry_id FROM research ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM research").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
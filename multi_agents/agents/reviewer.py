@@ -1,3 +1,8 @@
+import re
+
+from gpt_researcher.config.config import Config
+from gpt_researcher.utils.cascade import CascadeStats, cascade_chat_completion
+
 from .utils.views import print_agent_output
 from .utils.llms import call_model
 
@@ -6,11 +11,54 @@ Your goal is to review research drafts and provide feedback to the reviser only
 """
 
 
+# Fast review samples are drawn with some randomness so their agreement says something
+REVIEW_SAMPLE_TEMPERATURE = 0.7
+# "None" on its own, or followed by punctuation such as "None - the draft is good"
+_ACCEPTANCE = re.compile(r"None(?:$|\s*[-\u2013\u2014:.,;!\n])")
+
+
+def _verdict(review: str) -> str | None:
+    """
+    The verdict of a review: "accept" when it returns None, "revise" when it gives
+    revision notes, and None when it is empty or mentions None among its notes.
+    """
+    text = (review or "").strip().strip("\"'`*").strip()
+    if not text:
+        return None
+    if _ACCEPTANCE.match(text):
+        return "accept"
+    return None if "None" in text else "revise"
+
+
+def _score_verdict(review: str) -> float:
+    """A review is only usable when its verdict parses."""
+    return 1.0 if _verdict(review) else 0.0
+
+
+def _same_verdict(first: str, second: str) -> float:
+    """Two reviews agree when both accept or both ask for revisions."""
+    return float(_verdict(first) == _verdict(second))
+
+
 class ReviewerAgent:
     def __init__(self, websocket=None, stream_output=None, headers=None):
         self.websocket = websocket
         self.stream_output = stream_output
         self.headers = headers or {}
+        self.cascade_stats = CascadeStats()
+        self.review_costs = 0.0
+        self._configs = {}
+
+    def config(self, task: dict) -> Config:
+        """The configuration of the task's ``config_path``, loaded once per path."""
+        config_path = task.get("config_path")
+        if config_path not in self._configs:
+            self._configs[config_path] = Config(config_path)
+        return self._configs[config_path]
+
+    def add_costs(self, cost: float) -> None:
+        """Counts the cost of a review call on the fast model."""
+        self.review_costs += cost
 
     async def review_draft(self, draft_state: dict):
         """
@@ -41,7 +89,27 @@ Guidelines: {guidelines}\nDraft: {draft_state.get("draft")}\n
             {"role": "user", "content": review_prompt},
         ]
 
-        response = await call_model(prompt, model=task.get("model"))
+        cfg = self.config(task)
+        response = None
+        if cfg.llm_cascade:
+            # A review is only trusted from the fast model when two samples give the same clear verdict
+            response = await cascade_chat_completion(
+                messages=prompt,
+                cfg=cfg,
+                stage="review_draft",
+                score=_score_verdict,
+                stats=self.cascade_stats,
+                cost_callback=self.add_costs,
+                samples=2,
+                agreement=_same_verdict,
+                temperature=REVIEW_SAMPLE_TEMPERATURE,
+            )
+            if task.get("verbose"):
+                print_agent_output(
+                    f"Cascade escalation rates: {self.cascade_stats.summary()}", agent="REVIEWER"
+                )
+        if response is None:
+            response = await call_model(prompt, model=task.get("model"))
 
         if task.get("verbose"):
             if self.websocket and self.stream_output:
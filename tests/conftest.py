@@ -0,0 +1,12 @@
+"""
+Shared fixtures for the test suite.
+"""
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_stores(monkeypatch, tmp_path):
+    """Keeps the on-disk caches and checkpoints of every Config built by a test out of the working tree."""
+    monkeypatch.setenv("SEARCH_CACHE_PATH", str(tmp_path / "search_cache.db"))
+    monkeypatch.setenv("RESEARCH_CACHE_PATH", str(tmp_path / "research_cache.db"))
+    monkeypatch.setenv("CHECKPOINT_PATH", str(tmp_path / "checkpoints.db"))
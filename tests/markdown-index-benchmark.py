@@ -0,0 +1,78 @@
+"""
+Benchmark of report assembly with the markdown structure index.
+
+Assembles reports of 10 to 50 pages section by section. After each section is
+appended the headers, sections and table of contents of the growing report
+are read: by rendering the whole report to HTML and regexing it (how
+markdown_processing worked before the index), from one index the sections
+are appended to, and through the module functions, which cache indexes.
+
+Run from the repository root with: PYTHONPATH=. python tests/markdown-index-benchmark.py
+"""
+import re
+import time
+
+import markdown
+
+from gpt_researcher.actions.markdown_processing import MarkdownIndex, extract_sections, table_of_contents
+
+# About 500 words per page, three sections per page
+SECTIONS_PER_PAGE = 3
+PARAGRAPH = (
+    "Solar capacity grew quickly as **module prices** fell, and grid operators adapted "
+    "their [planning](https://example.com/planning) to variable output. "
+) * 8
+
+
+def section(number: int) -> str:
+    level = "##" if number % SECTIONS_PER_PAGE == 0 else "###"
+    return f"{level} Section {number}\n\n{PARAGRAPH}\n\n- First point\n- Second point\n\n{PARAGRAPH}"
+
+
+def html_structure(report: str) -> tuple:
+    """Headers, sections and table of contents by rendering the report to HTML."""
+    html = markdown.markdown(report)
+    headers = re.findall(r"<h(\d)>(.*?)</h\d>", html)
+    sections = [
+        (title, re.sub(r"<.*?>", "", content).strip())
+        for title, content in re.findall(r"<h\d>(.*?)</h\d>(.*?)(?=<h\d>|$)", html, re.DOTALL)
+    ]
+    toc = "".join(f"- {text}\n" for _, text in headers)
+    return headers, sections, toc
+
+
+def assemble_rendering(pages: int) -> float:
+    start = time.perf_counter()
+    report = ""
+    for number in range(pages * SECTIONS_PER_PAGE):
+        report += f"\n\n\n{section(number)}"
+        html_structure(report)
+    return time.perf_counter() - start
+
+
+def assemble_indexed(pages: int) -> float:
+    start = time.perf_counter()
+    index = MarkdownIndex()
+    for number in range(pages * SECTIONS_PER_PAGE):
+        index.append(f"\n\n\n{section(number)}")
+        index.headers, index.sections(), index.table_of_contents()
+    return time.perf_counter() - start
+
+
+def assemble_cached(pages: int) -> float:
+    """Through the module functions, which extend the cached index of the previous report."""
+    start = time.perf_counter()
+    report = ""
+    for number in range(pages * SECTIONS_PER_PAGE):
+        report += f"\n\n\n{section(number)}"
+        extract_sections(report), table_of_contents(report)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    print(f"{'pages':>5} {'rendering':>11} {'index':>9} {'cached':>9}")
+    for pages in (10, 20, 30, 40, 50):
+        print(
+            f"{pages:>5} {assemble_rendering(pages):>10.2f}s "
+            f"{assemble_indexed(pages):>8.2f}s {assemble_cached(pages):>8.2f}s"
+        )
@@ -0,0 +1,113 @@
+"""
+Unit tests for map-reduce report synthesis from contexts larger than one call's budget.
+"""
+import asyncio
+import re
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from gpt_researcher.actions.map_reduce import needs_reduction, reduce_context, report_context_token_limit
+from gpt_researcher.actions.report_generation import generate_report
+from gpt_researcher.utils.enum import Tone
+
+
+def make_cfg(**overrides):
+    cfg = dict(
+        fast_llm_model="gpt-4o-mini", fast_llm_provider="openai", fast_token_limit=500,
+        smart_llm_model="gpt-4o", smart_llm_provider="openai", smart_token_limit=1000,
+        llm_kwargs={}, language="english", report_format="apa", total_words=500, prompt_caching=False,
+        map_reduce_reports=True, report_context_token_limit=60, map_reduce_chunk_tokens=30, map_reduce_concurrency=3,
+    )
+    cfg.update(overrides)
+    return SimpleNamespace(**cfg)
+
+
+@pytest.fixture(autouse=True)
+def word_tokens():
+    """Counts words as tokens, without loading a tiktoken encoding."""
+    encoding = Mock(encode=Mock(side_effect=lambda text, **kwargs: text.split()))
+    with patch("gpt_researcher.utils.costs.get_encoding", return_value=encoding):
+        yield
+
+
+CONTEXT = "\n\n".join(
+    f"Source: https://site{i}.example/page\nContent: {'Cake recipes.' if i == 5 else f'Solar fact {i % 3}.'}"
+    for i in range(12)
+)
+
+
+class FakeFastLLM:
+    """Notes one fact per source; merges combine notes of the same fact and keep their citations."""
+
+    def __init__(self):
+        self.calls = []
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self, messages, model, **kwargs):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        prompt = messages[-1]["content"]
+        if "CONTEXT:" in prompt:
+            self.calls.append("map")
+            notes = [
+                f"- {fact} [Source: {url}]"
+                for url, fact in re.findall(r"Source: (\S+)\nContent: (Solar fact \d\.)", prompt)
+            ]
+            return "\n".join(notes) or "NONE"
+        self.calls.append("merge")
+        facts = {}
+        for fact, sources in re.findall(r"- (Solar fact \d\.) (.*)", prompt):
+            facts.setdefault(fact, []).append(sources)
+        return "\n".join(f"- {fact} {' '.join(sources)}" for fact, sources in facts.items())
+
+
+class TestMapReduce:
+    """Test suite for condensing large contexts into cited notes."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_are_noted_in_parallel_and_merged_hierarchically(self):
+        fast = FakeFastLLM()
+        with patch("gpt_researcher.actions.map_reduce.create_chat_completion", side_effect=fast.__call__):
+            notes = await reduce_context("solar power", CONTEXT, make_cfg())
+
+        assert fast.calls.count("map") > 3 and fast.calls.count("merge") > 1
+        assert 1 < fast.max_running <= 3
+        # Every relevant source is still cited; the irrelevant one is gone
+        cited = set(re.findall(r"https://site(\d+)", notes))
+        assert cited == {str(i) for i in range(12) if i != 5}
+        assert "Cake" not in notes
+
+    @pytest.mark.asyncio
+    async def test_report_is_written_from_notes_only_when_context_exceeds_budget(self):
+        fast = FakeFastLLM()
+        prompts = []
+
+        async def smart(messages, **kwargs):
+            prompts.append(messages[-1]["content"])
+            return "# Report"
+
+        with patch("gpt_researcher.actions.map_reduce.create_chat_completion", side_effect=fast.__call__), \
+                patch("gpt_researcher.actions.report_generation.create_chat_completion", side_effect=smart):
+            for cfg in (make_cfg(), make_cfg(report_context_token_limit=10000), make_cfg(map_reduce_reports=False)):
+                await generate_report(
+                    "solar power", CONTEXT, "You are a researcher.", "research_report",
+                    Tone.Objective, "web", None, cfg,
+                )
+
+        assert "Solar fact 0. [Source: https://site0.example/page]" in prompts[0]
+        assert "Content: Solar fact 0." not in prompts[0]
+        assert "Content: Solar fact 0." in prompts[1] and "Content: Solar fact 0." in prompts[2]
+        assert not needs_reduction(CONTEXT, make_cfg(map_reduce_reports=False))
+
+    def test_context_limit_follows_the_smart_model_unless_overridden(self):
+        assert report_context_token_limit(make_cfg(report_context_token_limit=0)) == int((128_000 - 1000) * 0.8)
+        assert report_context_token_limit(
+            make_cfg(report_context_token_limit=0, smart_llm_model="anthropic/claude-sonnet-4-20250514")
+        ) == int((200_000 - 1000) * 0.8)
+        assert report_context_token_limit(make_cfg(report_context_token_limit=0, smart_llm_model="llama3")) == 40000
+        assert report_context_token_limit(make_cfg()) == 60
@@ -0,0 +1,76 @@
+"""
+Unit tests for the markdown structure index behind header, section and table of contents extraction.
+"""
+from gpt_researcher.actions.markdown_processing import (
+    MarkdownIndex,
+    extract_headers,
+    extract_sections,
+    markdown_index,
+    table_of_contents,
+)
+
+REPORT = """Preamble.
+
+# Solar *power*
+
+Capacity grew in 2024.
+
+## Costs
+
+- Modules got cheaper
+- Installation did not
+
+```
+# not a header
+```
+
+## Grid
+
+# Outlook
+"""
+
+
+class TestMarkdownIndex:
+    """Test suite for indexing reports in one pass and incrementally."""
+
+    def test_headers_sections_and_table_of_contents(self):
+        assert extract_headers(REPORT) == [
+            {"level": 1, "text": "Solar power", "children": [
+                {"level": 2, "text": "Costs"},
+                {"level": 2, "text": "Grid"},
+            ]},
+            {"level": 1, "text": "Outlook"},
+        ]
+        # Sections without content are left out
+        assert extract_sections(REPORT) == [
+            {"section_title": "Solar power", "written_content": "Capacity grew in 2024."},
+            {"section_title": "Costs", "written_content": "Modules got cheaper\nInstallation did not\n# not a header"},
+        ]
+        assert table_of_contents(REPORT) == (
+            "## Table of Contents\n\n- Solar power\n    - Costs\n    - Grid\n- Outlook\n"
+        )
+
+    def test_appended_sections_are_indexed_like_the_whole_report(self):
+        sections = ["## Appendix\n\nMore data.", "### Method\n\nSurveys.", "# Sources\n\nListed below."]
+        index = MarkdownIndex(REPORT)
+        report = REPORT
+        for section in sections:
+            index.append(f"\n\n\n{section}")
+            report += f"\n\n\n{section}"
+
+        whole = MarkdownIndex(report)
+        assert index.text == report
+        assert index.headers == whole.headers
+        assert index.sections() == whole.sections()
+        assert index.table_of_contents() == whole.table_of_contents()
+
+    def test_cached_index_is_extended_only_at_block_boundaries(self):
+        base = markdown_index(REPORT)
+        assert markdown_index(REPORT) is base
+
+        extended = markdown_index(REPORT + "\n## Appendix\n\nMore data.")
+        assert extended.sections()[-1]["written_content"] == "More data."
+        # The cached index of the shorter report is left as it was
+        assert base.sections()[-1]["section_title"] == "Outlook"
+        assert not base.continues(REPORT + "    indented into the last block")
+        assert not MarkdownIndex("```\ncode").continues("```\ncode\n\n# Not a header")
@@ -0,0 +1,147 @@
+"""
+Unit tests for prompt-prefix caching in the report-writing calls.
+
+The calls are sent to a local OpenAI-compatible stub that records the prompts
+and reports cached prompt tokens the way OpenAI does.
+"""
+import json
+import logging
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from gpt_researcher.actions.report_generation import (
+    generate_draft_section_titles,
+    generate_report,
+    write_conclusion,
+    write_report_introduction,
+)
+from gpt_researcher.llm_provider.generic.base import GenericLLMProvider
+from gpt_researcher.prompts import PromptFamily
+from gpt_researcher.utils.enum import Tone
+from gpt_researcher.utils.llm import cacheable_user_message
+
+CONTEXT = "Source: https://example.com\nContent: solar capacity grew 24% in 2024."
+
+
+@pytest_asyncio.fixture
+async def stub_server(monkeypatch):
+    requests = []
+
+    async def chat_completions(request):
+        body = await request.json()
+        requests.append(body)
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        chunk = {
+            "id": "stub", "object": "chat.completion.chunk", "created": 0, "model": body["model"],
+            "choices": [{"index": 0, "delta": {"role": "assistant", "content": "### Section\n"}, "finish_reason": None}],
+        }
+        await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+        usage = {
+            "id": "stub", "object": "chat.completion.chunk", "created": 0, "model": body["model"],
+            "choices": [],
+            "usage": {
+                "prompt_tokens": 2000, "completion_tokens": 3, "total_tokens": 2003,
+                "prompt_tokens_details": {"cached_tokens": 1024 if len(requests) > 1 else 0},
+            },
+        }
+        await response.write(f"data: {json.dumps(usage)}\n\n".encode())
+        await response.write(b"data: [DONE]\n\n")
+        return response
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", chat_completions)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    monkeypatch.setenv("OPENAI_BASE_URL", f"http://127.0.0.1:{port}/v1")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    yield requests
+    await runner.cleanup()
+
+
+@pytest.fixture
+def cfg():
+    return SimpleNamespace(
+        smart_llm_model="gpt-4o",
+        smart_llm_provider="openai",
+        smart_token_limit=1000,
+        llm_kwargs={},
+        language="english",
+        report_format="apa",
+        total_words=500,
+        prompt_caching=True,
+    )
+
+
+class TestPromptCaching:
+    """Test suite for the cacheable research-context prefix."""
+
+    @pytest.mark.asyncio
+    async def test_report_calls_share_context_prefix(self, stub_server, cfg, caplog):
+        caplog.set_level(logging.INFO)
+
+        await write_report_introduction("solar power", CONTEXT, "You are a researcher.", cfg)
+        await generate_draft_section_titles("solar power", "capacity", CONTEXT, "You are a researcher.", cfg)
+        await generate_report(
+            "solar power", CONTEXT, "You are a researcher.", "research_report",
+            Tone.Objective, "web", None, cfg,
+        )
+
+        prefix = f'Information: "{CONTEXT}"\n---\n'
+        assert len(stub_server) == 3
+        for request in stub_server:
+            assert request["messages"][0] == {"role": "system", "content": "You are a researcher."}
+            assert request["messages"][1]["content"].startswith(prefix)
+            assert request["stream_options"] == {"include_usage": True}
+        assert "Prompt cache hit: 1024 of 2000 input tokens" in caplog.text
+
+    def test_cache_control_kept_only_for_anthropic(self):
+        message = cacheable_user_message("PREFIX\nrest of the prompt", "PREFIX\n")
+        assert message["content"][0]["cache_control"] == {"type": "ephemeral"}
+
+        anthropic = GenericLLMProvider(llm=None, provider="anthropic")
+        assert anthropic._prepare_messages([message]) == [message]
+
+        openai = GenericLLMProvider(llm=None, provider="openai")
+        assert openai._prepare_messages([message]) == [
+            {"role": "user", "content": "PREFIX\nrest of the prompt"}
+        ]
+
+    def test_message_without_prefix_is_left_plain(self):
+        assert cacheable_user_message("no shared prefix", "PREFIX") == {
+            "role": "user", "content": "no shared prefix"
+        }
+
+    @pytest.mark.asyncio
+    async def test_custom_context_block_is_the_cached_prefix(self, cfg):
+        class TaggedPromptFamily(PromptFamily):
+            @staticmethod
+            def research_context_block(context) -> str:
+                return f"<context>{context}</context>\n"
+
+        completion = AsyncMock(return_value="# Solar power")
+        with patch("gpt_researcher.actions.report_generation.create_chat_completion", completion):
+            await write_report_introduction(
+                "solar power", CONTEXT, "You are a researcher.", cfg, prompt_family=TaggedPromptFamily
+            )
+
+        content = completion.call_args.kwargs["messages"][1]["content"]
+        assert content[0] == {
+            "type": "text", "text": f"<context>{CONTEXT}</context>\n", "cache_control": {"type": "ephemeral"}
+        }
+
+    @pytest.mark.asyncio
+    async def test_conclusion_is_sent_as_a_plain_message(self, cfg):
+        completion = AsyncMock(return_value="In conclusion")
+        with patch("gpt_researcher.actions.report_generation.create_chat_completion", completion):
+            await write_conclusion("solar power", "# Report\nSolar grew.", "You are a researcher.", cfg)
+
+        message = completion.call_args.kwargs["messages"][1]
+        assert message["role"] == "user" and isinstance(message["content"], str)
@@ -10,7 +10,7 @@ Tests the core functionality of the ReviewerAgent including:
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 
-from multi_agents.agents.reviewer import ReviewerAgent
+from multi_agents.agents.reviewer import ReviewerAgent, _same_verdict, _score_verdict
 
 
 class TestReviewerAgent:
@@ -118,4 +118,45 @@ class TestReviewerAgent:
         await agent.run(draft_state)
         
         # Verify stream_output was called for logging
-        agent.stream_output.assert_called()
\ No newline at end of file
+        agent.stream_output.assert_called()
+    @pytest.mark.asyncio
+    async def test_cascade_samples_vary_and_need_a_clear_verdict(self, monkeypatch, draft_state):
+        """Fast reviews are sampled with randomness and kept only when their verdicts parse and agree."""
+        monkeypatch.setenv("LLM_CASCADE", "true")
+        agent = ReviewerAgent()
+        cascade = AsyncMock(return_value="None")
+
+        with patch('multi_agents.agents.reviewer.cascade_chat_completion', cascade), \
+                patch('multi_agents.agents.reviewer.call_model') as mock_call_model:
+            result = await agent.review_draft(draft_state)
+
+        assert result is None
+        mock_call_model.assert_not_called()
+        assert cascade.call_args.kwargs["temperature"] > 0
+        assert _score_verdict("None") == 1.0
+        assert _score_verdict("Please cite the sources of the conclusion.") == 1.0
+        assert _score_verdict("None of the sources are cited.") == 0.0
+        assert _score_verdict("") == 0.0
+        assert _same_verdict("None", "\"None\"") == 1.0
+        assert _same_verdict("None", "Add a conclusion.") == 0.0
+
+    @pytest.mark.asyncio
+    async def test_cascade_uses_the_task_config_and_counts_its_costs(self, tmp_path, draft_state):
+        """The fast review follows the task's config file and its costs are counted."""
+        config_path = tmp_path / "config.json"
+        config_path.write_text('{"LLM_CASCADE": true}')
+        draft_state["task"]["config_path"] = str(config_path)
+        agent = ReviewerAgent()
+
+        async def cascade(*args, cost_callback=None, **kwargs):
+            cost_callback(0.002)
+            return "None"
+
+        with patch('multi_agents.agents.reviewer.cascade_chat_completion', side_effect=cascade) as mock_cascade, \
+                patch('multi_agents.agents.reviewer.call_model') as mock_call_model:
+            result = await agent.review_draft(draft_state)
+
+        assert result is None
+        mock_call_model.assert_not_called()
+        assert mock_cascade.call_args.kwargs["cfg"].llm_cascade is True
+        assert agent.review_costs == 0.002
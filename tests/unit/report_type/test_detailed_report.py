@@ -0,0 +1,122 @@
+"""
+Unit tests for concurrent subtopic research in detailed reports.
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from backend.report_type.detailed_report import detailed_report
+from backend.report_type.detailed_report.detailed_report import DetailedReport
+from gpt_researcher.utils.checkpoint import RunCheckpoint
+
+
+class FakeAssistant:
+    """Subtopic researcher whose research takes longer for earlier subtopics."""
+
+    events = []
+    running = 0
+    max_running = 0
+
+    def __init__(self, query, visited_urls, **kwargs):
+        self.query = query
+        self.visited_urls = visited_urls
+        self.context = []
+
+    async def conduct_research(self):
+        cls = type(self)
+        cls.running += 1
+        cls.max_running = max(cls.max_running, cls.running)
+        await asyncio.sleep(0.05 if self.query == "first" else 0.01)
+        self.visited_urls.add(f"https://example.com/{self.query}")
+        cls.running -= 1
+        cls.events.append(f"researched {self.query}")
+
+    async def get_draft_section_titles(self, query):
+        return f"## {query}"
+
+    async def get_similar_written_contents_by_draft_section_titles(self, query, titles, written_sections):
+        return list(written_sections)
+
+    async def write_report(self, existing_headers, relevant_contents):
+        type(self).events.append(f"wrote {self.query} after {len(existing_headers)}")
+        return f"## {self.query}\n\nAbout {self.query}."
+
+
+def make_report(concurrency):
+    report = DetailedReport.__new__(DetailedReport)
+    report.query = "topic"
+    report.query_domains = []
+    report.report_source = "web"
+    report.websocket = None
+    report.headers = {}
+    report.subtopics = []
+    report.tone = ""
+    report.complement_source_urls = False
+    report.source_urls = []
+    report.checkpoint = RunCheckpoint()
+    report.gpt_researcher = SimpleNamespace(
+        cfg=SimpleNamespace(subtopic_concurrency=concurrency),
+        agent=None,
+        role=None,
+        extract_headers=lambda markdown: [{"text": line.lstrip("# ")} for line in markdown.splitlines() if line.startswith("#")],
+        extract_sections=lambda markdown: [markdown],
+    )
+    report.existing_headers = []
+    report.global_context = []
+    report.global_written_sections = []
+    report.global_urls = set()
+    return report
+
+
+@pytest.fixture(autouse=True)
+def fake_assistant():
+    FakeAssistant.events, FakeAssistant.running, FakeAssistant.max_running = [], 0, 0
+    with patch.object(detailed_report, "GPTResearcher", FakeAssistant):
+        yield
+
+
+class TestSubtopicReports:
+    """Test suite for concurrent research with in-order writing and assembly."""
+
+    @pytest.mark.asyncio
+    async def test_subtopics_research_concurrently_and_assemble_in_order(self):
+        report = make_report(concurrency=2)
+        subtopics = [{"task": "first"}, {"task": "second"}, {"task": "third"}]
+
+        results, body = await report._generate_subtopic_reports(subtopics)
+
+        assert FakeAssistant.max_running == 2
+        # Later subtopics finished researching while the first was still running
+        assert FakeAssistant.events.index("researched second") < FakeAssistant.events.index("researched first")
+        writes = [event for event in FakeAssistant.events if event.startswith("wrote")]
+        assert writes == ["wrote first after 0", "wrote second after 1", "wrote third after 2"]
+        assert [result["topic"]["task"] for result in results] == ["first", "second", "third"]
+        assert body.index("## first") < body.index("## second") < body.index("## third")
+        assert report.global_urls == {f"https://example.com/{task}" for task in ("first", "second", "third")}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_of_one_researches_one_subtopic_at_a_time(self):
+        report = make_report(concurrency=1)
+
+        await report._generate_subtopic_reports([{"task": "first"}, {"task": "second"}])
+
+        assert FakeAssistant.max_running == 1
+
+    @pytest.mark.asyncio
+    async def test_subtopic_reports_wait_for_the_streamed_introduction(self):
+        report = make_report(concurrency=2)
+
+        async def write_introduction():
+            await asyncio.sleep(0.1)
+            FakeAssistant.events.append("wrote introduction")
+
+        introduction = asyncio.create_task(write_introduction())
+        await report._generate_subtopic_reports([{"task": "first"}, {"task": "second"}], before_writing=introduction)
+
+        # Subtopics were researched while the introduction was written, but none was written before it
+        assert FakeAssistant.events.index("researched first") < FakeAssistant.events.index("wrote introduction")
+        assert [event for event in FakeAssistant.events if event.startswith("wrote")] == [
+            "wrote introduction", "wrote first after 0", "wrote second after 1",
+        ]
@@ -0,0 +1,143 @@
+"""
+Unit tests for the async retriever interface and its shared HTTP client.
+
+Searches go to a local JSON endpoint through the custom retriever, which
+records the client port of every request to observe connection reuse.
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import Mock
+
+import pytest
+
+from gpt_researcher.retrievers import CustomRetriever, SerperSearch
+from gpt_researcher.retrievers.base import run_search, run_search_many
+from gpt_researcher.retrievers.cache import SearchCache
+from gpt_researcher.utils.http import close_http_client, get_http_client
+
+RESULTS = [{"url": "https://example.com/a", "raw_content": "Solar capacity grew 24% in 2024."}]
+
+
+@pytest.fixture
+def endpoint(monkeypatch):
+    client_ports = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            client_ports.append(self.client_address[1])
+            body = json.dumps(RESULTS).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("RETRIEVER_ENDPOINT", f"http://127.0.0.1:{server.server_port}/search")
+    yield client_ports
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def serper_endpoint(monkeypatch):
+    bodies = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            searches = request if isinstance(request, list) else [request]
+            bodies.append(searches)
+            responses = [
+                {"organic": [{"title": search["q"], "link": f"https://example.com/{search['q']}", "snippet": ""}]}
+                for search in searches
+            ]
+            body = json.dumps(responses if isinstance(request, list) else responses[0]).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("SERPER_API_KEY", "test")
+    monkeypatch.setattr("gpt_researcher.retrievers.serper.serper.SERPER_URL", f"http://127.0.0.1:{server.server_port}/search")
+    yield bodies
+    server.shutdown()
+    server.server_close()
+
+
+class TestAsyncRetrievers:
+    """Test suite for asearch, the blocking shim and run_search."""
+
+    @pytest.mark.asyncio
+    async def test_searches_share_one_keep_alive_connection(self, endpoint):
+        try:
+            first = await CustomRetriever("solar").asearch()
+            second = await run_search(CustomRetriever("wind"), max_results=5)
+            assert get_http_client() is get_http_client()
+        finally:
+            await close_http_client()
+
+        assert first == second == RESULTS
+        assert len(endpoint) == 2 and len(set(endpoint)) == 1
+
+    def test_blocking_search_shim(self, endpoint):
+        assert CustomRetriever("solar").search() == RESULTS
+
+    @pytest.mark.asyncio
+    async def test_blocking_shim_works_inside_an_event_loop(self, endpoint):
+        assert CustomRetriever("solar").search() == RESULTS
+
+    @pytest.mark.asyncio
+    async def test_sync_only_retrievers_run_in_a_thread(self):
+        retriever = Mock(spec=["search"])
+        retriever.search.return_value = [{"href": "https://example.com/b"}]
+
+        assert await run_search(retriever, max_results=3) == [{"href": "https://example.com/b"}]
+        retriever.search.assert_called_once_with(max_results=3)
+
+    @pytest.mark.asyncio
+    async def test_serper_searches_many_queries_in_one_request(self, serper_endpoint, tmp_path):
+        cache = SearchCache(str(tmp_path / "search_cache.db"))
+        try:
+            await run_search(SerperSearch("wind"), max_results=5, cache=cache)
+            results = await run_search_many(SerperSearch, ["solar", "wind", "hydro"], max_results=5, cache=cache)
+        finally:
+            await close_http_client()
+            cache.close()
+
+        assert [[result["href"] for result in results[query]] for query in ("solar", "wind", "hydro")] == [
+            ["https://example.com/solar"], ["https://example.com/wind"], ["https://example.com/hydro"],
+        ]
+        # The cached query is left out of the batch
+        assert [[search["q"] for search in body] for body in serper_endpoint] == [["wind"], ["solar", "hydro"]]
+
+    @pytest.mark.asyncio
+    async def test_unusable_search_cache_is_a_miss_for_batch_searches(self, serper_endpoint, tmp_path):
+        cache = SearchCache(str(tmp_path / "search_cache.db"))
+        cache.close()
+        try:
+            results = await run_search_many(SerperSearch, ["solar", "wind"], max_results=5, cache=cache)
+        finally:
+            await close_http_client()
+
+        assert [[result["href"] for result in results[query]] for query in ("solar", "wind")] == [
+            ["https://example.com/solar"], ["https://example.com/wind"],
+        ]
+        assert [[search["q"] for search in body] for body in serper_endpoint] == [["solar", "wind"]]
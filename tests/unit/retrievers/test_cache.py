@@ -0,0 +1,95 @@
+"""
+Unit tests for the search result cache.
+"""
+import asyncio
+
+import pytest
+
+from gpt_researcher.retrievers.base import run_search
+from gpt_researcher.retrievers.cache import SearchCache
+from gpt_researcher.retrievers.serper.serper import SerperSearch
+
+
+class FakeSearch:
+    """Counts its searches and answers after a short delay."""
+
+    calls = 0
+
+    def __init__(self, query, query_domains=None, topic="general"):
+        self.query = query
+        self.query_domains = query_domains
+        self.topic = topic
+
+    def cache_params(self):
+        return {"topic": self.topic}
+
+    async def asearch(self, max_results=10):
+        type(self).calls += 1
+        await asyncio.sleep(0.01)
+        return [{"href": f"https://example.com/{type(self).calls}", "body": self.query}]
+
+
+class ArxivSearch(FakeSearch):
+    pass
+
+
+@pytest.fixture
+def cache(tmp_path):
+    FakeSearch.calls = 0
+    cache = SearchCache(str(tmp_path / "search_cache.db"), default_ttl=60, ttls={"news": 1, "arxiv": 3600})
+    yield cache
+    cache.close()
+
+
+class TestSearchCache:
+    """Test suite for cache keys, TTLs, LRU eviction and hit-rate metrics."""
+
+    @pytest.mark.asyncio
+    async def test_normalized_repeat_searches_hit_the_cache(self, cache):
+        first = await run_search(FakeSearch("Solar  Power", ["b.com", "a.com"]), max_results=5, cache=cache)
+        again = await run_search(FakeSearch("solar power", ["a.com", "b.com"]), max_results=5, cache=cache)
+        other = await run_search(FakeSearch("solar power", ["a.com", "b.com"]), max_results=10, cache=cache)
+
+        assert again == first
+        assert other != first
+        assert FakeSearch.calls == 2
+        assert cache.stats.summary()["FakeSearch"] == {"miss": 2, "hit": 1, "hit_rate": 0.333}
+
+    def test_retriever_settings_are_part_of_the_key(self, cache, monkeypatch):
+        monkeypatch.setenv("SERPER_API_KEY", "test-key")
+        monkeypatch.setenv("SERPER_REGION", "us")
+        us = cache.key_for(SerperSearch("solar power"), 5)
+        monkeypatch.setenv("SERPER_EXCLUDE_SITES", "b.com, a.com")
+        us_excluding = cache.key_for(SerperSearch("solar power"), 5)
+        monkeypatch.setenv("SERPER_REGION", "kr")
+
+        assert len({us, us_excluding, cache.key_for(SerperSearch("solar power"), 5)}) == 3
+        assert cache.key_for(SerperSearch("solar power", exclude_sites=["a.com", "b.com"]), 5) == \
+            cache.key_for(SerperSearch("solar power", country="kr"), 5)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_searches_run_once(self, cache):
+        results = await asyncio.gather(*[run_search(FakeSearch("solar"), cache=cache) for _ in range(3)])
+
+        assert FakeSearch.calls == 1
+        assert results[0] == results[1] == results[2]
+
+    def test_ttl_per_retriever_and_news_topic(self, cache):
+        assert cache.ttl_for(FakeSearch("q")) == 60
+        assert cache.ttl_for(FakeSearch("q", topic="news")) == 1
+        assert cache.ttl_for(ArxivSearch("q")) == 3600
+
+    @pytest.mark.asyncio
+    async def test_expired_and_evicted_results_are_searched_again(self, cache):
+        cache.max_entries = 2
+        cache.ttls["news"] = 0
+        await run_search(FakeSearch("breaking", topic="news"), cache=cache)
+        await run_search(FakeSearch("breaking", topic="news"), cache=cache)
+        assert FakeSearch.calls == 2
+        assert cache.stats.summary()["FakeSearch"]["expired"] == 1
+
+        for query in ("a", "b", "c"):
+            await run_search(FakeSearch(query), cache=cache)
+        assert len(cache) == 2
+        assert cache.get(cache.key_for(FakeSearch("a"), None), "FakeSearch") is None
+        assert cache.get(cache.key_for(FakeSearch("c"), None), "FakeSearch") is not None
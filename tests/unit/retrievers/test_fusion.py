@@ -0,0 +1,63 @@
+"""
+Unit tests for cross-retriever result fusion.
+"""
+import pytest
+
+from gpt_researcher.retrievers.fusion import (
+    canonicalize_url,
+    reciprocal_rank_fusion,
+    select_within_budget,
+    strip_tracking,
+)
+
+
+class TestFusion:
+    """Test suite for URL canonicalization, rank fusion and budget selection."""
+
+    @pytest.mark.parametrize("variant", [
+        "https://www.example.com/news/solar?utm_source=feed&utm_medium=rss",
+        "http://example.com/news/solar/#comments",
+        "https://m.example.com/news/solar?fbclid=abc",
+        "https://example.com/amp/news/solar",
+        "https://example.com/news/solar/amp/",
+        "https://amp.example.com/news/solar",
+    ])
+    def test_variants_share_a_canonical_url(self, variant):
+        assert canonicalize_url(variant) == "example.com/news/solar"
+
+    def test_meaningful_query_parameters_are_kept(self):
+        assert canonicalize_url("https://example.com/search?b=2&a=1&gclid=x") == "example.com/search?a=1&b=2"
+        assert canonicalize_url("https://example.com/search?q=1") != canonicalize_url("https://example.com/search?q=2")
+
+    def test_strip_tracking_keeps_a_fetchable_url(self):
+        assert strip_tracking("https://www.example.com/a?id=7&utm_campaign=x#top") == "https://www.example.com/a?id=7"
+        assert strip_tracking("https://example.com/a?q=solar+power") == "https://example.com/a?q=solar+power"
+
+    def test_results_found_by_several_retrievers_rank_first(self):
+        tavily = [
+            {"href": "https://a.com/1", "body": "short"},
+            {"href": "https://b.com/1?utm_source=x", "body": "b"},
+        ]
+        bing = [
+            {"href": "https://www.b.com/1", "body": "a longer snippet"},
+            {"href": "https://c.com/1"},
+        ]
+
+        fused = reciprocal_rank_fusion([tavily, bing])
+
+        assert [result["canonical"] for result in fused] == ["b.com/1", "a.com/1", "c.com/1"]
+        assert fused[0]["votes"] == 2
+        assert fused[0]["href"] == "https://www.b.com/1"
+        assert fused[0]["body"] == "a longer snippet"
+
+    def test_budget_and_domain_cap(self):
+        fused = reciprocal_rank_fusion([[
+            {"href": f"https://big.com/{i}"} for i in range(5)
+        ] + [{"href": "https://small.com/1"}, {"href": "https://other.com/1"}]])
+
+        selected = select_within_budget(fused, budget=3, max_per_domain=2)
+
+        assert [result["href"] for result in selected] == [
+            "https://big.com/0", "https://big.com/1", "https://small.com/1",
+        ]
+        assert len(select_within_budget(fused, budget=0, max_per_domain=0)) == 7
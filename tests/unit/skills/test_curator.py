@@ -0,0 +1,98 @@
+"""
+Unit tests for local pre-ranking and batched LLM judging of sources.
+"""
+import json
+import re
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from gpt_researcher.skills.curator import SourceCurator, domain_reputation, freshness, split_sources
+from gpt_researcher.utils.budget import RunController
+
+
+class FakeEmbeddings:
+    """Embeds sources mentioning solar towards the query; repeated content ("... again") embeds alike."""
+
+    def __init__(self):
+        self.axes = {}
+
+    def _embed(self, text):
+        axis = self.axes.setdefault(text.split("Content: ")[-1].replace(" again", ""), len(self.axes))
+        return [1.0 if "solar" in text.lower() else 0.0] + [0.5 if i == axis else 0.0 for i in range(16)]
+
+    async def aembed_documents(self, texts):
+        return [self._embed(text) for text in texts]
+
+    async def aembed_query(self, text):
+        return [1.0] + [0.0] * 16
+
+
+def make_curator(batch_size=2):
+    researcher = SimpleNamespace(
+        query="solar power",
+        role="researcher",
+        verbose=False,
+        websocket=None,
+        cfg=SimpleNamespace(curation_batch_size=batch_size, llm_cascade=False, smart_llm_model="gpt-4o",
+                            smart_llm_provider="openai", llm_kwargs={}),
+        memory=Mock(get_embeddings=Mock(return_value=FakeEmbeddings())),
+        stage_cost_callback=Mock(return_value=Mock()),
+        prompt_family=SimpleNamespace(judge_sources=lambda query, sources: sources),
+        cascade_stats=None,
+        research_costs=0.0,
+    )
+    researcher.run_controller = RunController(researcher)
+    return SourceCurator(researcher)
+
+
+def context_of(*blocks):
+    return "\n".join(f"Source: https://{url}\nTitle: \nContent: {content}\n" for url, content in blocks)
+
+
+class TestSourceCurator:
+    """Test suite for the curation pipeline."""
+
+    def test_local_signals(self):
+        assert domain_reputation("https://www.cdc.gov/page") == 1.0
+        assert domain_reputation("https://en.wikipedia.org/wiki/Sun") == 0.7
+        assert domain_reputation("https://unknown.example/post") == 0.5
+        assert freshness("Updated in 2024.", today=date(2025, 1, 1)) == pytest.approx(0.9)
+        assert freshness("No dates here.") == 0.5
+        assert len(split_sources(context_of(("a.com", "one"), ("b.com", "two")))) == 2
+
+    @pytest.mark.asyncio
+    async def test_only_borderline_sources_are_judged_in_batches(self):
+        curator = make_curator(batch_size=2)
+        context = context_of(
+            ("nasa.gov/solar", "Solar output data"),
+            ("news.example/solar", "Solar installations grew"),
+            ("blog.example/solar-again", "Solar output data again"),
+            ("shop.example/solar", "Buy solar panels, keep"),
+            ("forum.example/solar", "Solar power opinions, drop"),
+            ("recipes.example/cake", "How to bake a cake, keep"),
+            ("travel.example/paris", "Visit Paris, drop"),
+        )
+        prompts = []
+
+        async def judge(messages, **kwargs):
+            sources = json.loads(messages[1]["content"])
+            prompts.append(sources)
+            if len(prompts) == 2:
+                return "not json"
+            return json.dumps([{"id": s["id"], "score": 8 if "keep" in s["content"] else 2} for s in sources])
+
+        with patch("gpt_researcher.skills.curator.create_chat_completion", side_effect=judge):
+            curated = await curator.curate_sources(context, max_results=4)
+
+        urls = re.findall(r"^Source: (\S+)", curated, re.MULTILINE)
+        # The duplicate is dropped and the top two are kept before judging; a failed batch keeps its sources
+        assert urls == [
+            "https://nasa.gov/solar",
+            "https://news.example/solar",
+            "https://shop.example/solar",
+            "https://recipes.example/cake",
+        ]
+        assert [len(sources) for sources in prompts] == [2, 2]
@@ -0,0 +1,148 @@
+"""
+Unit tests for the breadth-first deep research scheduler.
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from gpt_researcher.skills.deep_research import DeepResearchSkill
+from gpt_researcher.skills.novelty import NoveltyFilter
+from gpt_researcher.utils.budget import RunController
+from gpt_researcher.utils.checkpoint import RunCheckpoint
+
+
+class FakeEmbeddings:
+    """Embeds all texts about batteries alike and every other text on an axis of its own."""
+
+    def __init__(self):
+        self.axes = {}
+
+    def _embed(self, text):
+        axis = self.axes.setdefault("battery" if "batter" in text.lower() else text, len(self.axes))
+        return [1.0 if i == axis else 0.0 for i in range(16)]
+
+    async def aembed_documents(self, texts):
+        return [self._embed(text) for text in texts]
+
+
+def make_skill(concurrency, **cfg):
+    researcher = SimpleNamespace(
+        cfg=SimpleNamespace(
+            deep_research_breadth=2, deep_research_depth=2, deep_research_concurrency=concurrency, **cfg
+        ),
+        memory=Mock(get_embeddings=Mock(return_value=FakeEmbeddings())),
+        stage_cost_callback=Mock(return_value=Mock()),
+        websocket=None,
+        tone=None,
+        headers={},
+        visited_urls=set(),
+        checkpoint=RunCheckpoint(),
+        research_costs=0.0,
+    )
+    researcher.run_controller = RunController(researcher)
+    skill = DeepResearchSkill(researcher)
+    skill.events = []
+    skill.running = skill.max_running = 0
+    skill.learning = lambda query: f"learned {query}"
+
+    async def generate_search_queries(query, num_queries=3):
+        prefix = "child of " if "Previous research goal" in query else ""
+        goal = query.split("Previous research goal: ")[-1].split("\n")[0] if prefix else "root"
+        return [{"query": f"{prefix}{goal} {i}", "researchGoal": f"{goal} {i}"} for i in range(num_queries)]
+
+    async def process_query(serp_query, progress, on_progress=None):
+        skill.running += 1
+        skill.max_running = max(skill.max_running, skill.running)
+        # The first root query is slow, so its sibling's subtree can start before it finishes
+        await asyncio.sleep(0.05 if serp_query["query"] == "root 0" else 0.01)
+        skill.running -= 1
+        skill.events.append(serp_query["query"])
+        return {
+            "learnings": [skill.learning(serp_query["query"])],
+            "visited_urls": [f"https://example.com/{serp_query['query']}"],
+            "followUpQuestions": ["why?"],
+            "researchGoal": serp_query["researchGoal"],
+            "citations": {},
+            "context": f"context of {serp_query['query']}",
+            "sources": [],
+        }
+
+    skill.generate_search_queries = generate_search_queries
+    skill._process_query = process_query
+    return skill
+
+
+class TestDeepResearchScheduler:
+    """Test suite for one work queue with a global concurrency limit."""
+
+    @pytest.mark.asyncio
+    async def test_deeper_queries_start_as_soon_as_their_parent_finishes(self):
+        skill = make_skill(concurrency=2)
+        updates = []
+
+        results = await skill.deep_research("root", breadth=2, depth=2, on_progress=lambda p: updates.append(p.levels))
+
+        assert skill.max_running == 2
+        assert skill.events.index("child of root 1 0") < skill.events.index("root 0")
+        assert len(skill.events) == 6
+        # Every branch is listed before its next sibling, whatever order the work finished in
+        assert results["context"] == [
+            "context of root 0",
+            "context of child of root 0 0",
+            "context of child of root 0 1",
+            "context of root 1",
+            "context of child of root 1 0",
+            "context of child of root 1 1",
+        ]
+        assert updates[-1] == {
+            1: {"total_queries": 2, "completed_queries": 2},
+            2: {"total_queries": 4, "completed_queries": 4},
+        }
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_holds_across_levels(self):
+        skill = make_skill(concurrency=1)
+
+        await skill.deep_research("root", breadth=2, depth=2)
+
+        assert skill.max_running == 1
+        # Breadth first: the whole first level runs before the second
+        assert skill.events[:2] == ["root 0", "root 1"]
+
+
+class TestNoveltyFilter:
+    """Test suite for pruning repeated queries and learnings."""
+
+    @pytest.mark.asyncio
+    async def test_similar_queries_and_learnings_are_pruned(self):
+        skill = make_skill(concurrency=1)
+        novelty = NoveltyFilter(skill.researcher, similarity_threshold=0.9)
+
+        queries = await novelty.filter_queries(
+            [{"query": "battery chemistry"}, {"query": "solar panels"}, {"query": "new battery types"}], level=1
+        )
+        learnings = await novelty.filter_learnings(
+            ["Batteries store energy.", "Wind is variable.", "Battery cells degrade."], level=2
+        )
+
+        assert [query["query"] for query in queries] == ["battery chemistry", "solar panels"]
+        assert learnings == ["Batteries store energy.", "Wind is variable."]
+        assert novelty.summary() == {
+            1: {"queries_kept": 2, "queries_pruned": 1, "learnings_kept": 0, "learnings_pruned": 0, "branches_stopped": 0},
+            2: {"queries_kept": 0, "queries_pruned": 0, "learnings_kept": 2, "learnings_pruned": 1, "branches_stopped": 0},
+        }
+
+    @pytest.mark.asyncio
+    async def test_branches_without_new_learnings_stop_early(self):
+        skill = make_skill(concurrency=2, deep_research_novelty_filter=True)
+        skill.learning = lambda query: f"Batteries store energy ({query})."
+
+        await skill.deep_research("root", breadth=2, depth=2)
+
+        # Both root queries learn the same thing, so only the branch that learned it first goes deeper
+        assert sorted(skill.events) == ["child of root 1 0", "child of root 1 1", "root 0", "root 1"]
+        assert skill.novelty_filter.summary()[1] == {
+            "queries_kept": 2, "queries_pruned": 0, "learnings_kept": 1, "learnings_pruned": 1, "branches_stopped": 1,
+        }
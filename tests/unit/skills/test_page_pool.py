@@ -0,0 +1,134 @@
+"""
+Unit tests for the run-level page pool shared by sub-queries.
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from gpt_researcher.skills.browser import BrowserManager
+from gpt_researcher.utils.checkpoint import CheckpointStore, RunCheckpoint
+
+
+class FakeEmbeddings:
+    """Embeds texts mentioning 'quantum' on one axis and everything else on another."""
+
+    @staticmethod
+    def _embed(text):
+        return [1.0, 0.0] if "quantum" in text.lower() else [0.0, 1.0]
+
+    async def aembed_documents(self, texts):
+        return [self._embed(text) for text in texts]
+
+    async def aembed_query(self, text):
+        return self._embed(text)
+
+
+PAGES = {
+    "https://example.com/qc": "Quantum bits explained.",
+    "https://example.com/cake": "How to bake a cake.",
+    "https://example.com/qec": "Quantum error correction.",
+}
+
+
+def make_browser():
+    researcher = SimpleNamespace(
+        cfg=SimpleNamespace(max_scraper_workers=4, shared_page_pool=True),
+        memory=Mock(get_embeddings=Mock(return_value=FakeEmbeddings())),
+        stage_cost_callback=Mock(return_value=Mock()),
+        checkpoint=RunCheckpoint(),
+    )
+    return BrowserManager(researcher)
+
+
+@pytest.fixture
+def scrape_urls():
+    async def fake_scrape_urls(urls, cfg, worker_pool):
+        await asyncio.sleep(0.05)
+        return [{"url": url, "raw_content": PAGES[url], "title": "", "image_urls": []} for url in urls], []
+
+    with patch("gpt_researcher.skills.browser.scrape_urls", side_effect=fake_scrape_urls) as mock:
+        yield mock
+
+
+class TestPagePool:
+    """Test suite for shared per-URL scrapes and pool-wide ranking."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_claims_share_in_flight_scrapes(self, scrape_urls):
+        browser = make_browser()
+
+        (first, _), (second, _) = await asyncio.gather(
+            browser._scrape(["https://example.com/qc", "https://example.com/cake"]),
+            browser._scrape(["https://example.com/cake", "https://example.com/qec"]),
+        )
+
+        scraped = [call.args[0] for call in scrape_urls.call_args_list]
+        assert scraped == [["https://example.com/qc"], ["https://example.com/cake"], ["https://example.com/qec"]]
+        assert [page["url"] for page in second] == ["https://example.com/cake", "https://example.com/qec"]
+        assert len(browser.page_pool) == 3
+
+    @pytest.mark.asyncio
+    async def test_claimed_page_does_not_wait_for_slower_pages(self):
+        browser = make_browser()
+
+        async def scrape_urls(urls, cfg, worker_pool):
+            await asyncio.sleep(5 if urls == ["https://example.com/cake"] else 0.01)
+            return [{"url": url, "raw_content": PAGES[url], "title": "", "image_urls": []} for url in urls], []
+
+        with patch("gpt_researcher.skills.browser.scrape_urls", side_effect=scrape_urls):
+            browser.prefetch_urls(["https://example.com/cake", "https://example.com/qc"])
+            pages, _ = await asyncio.wait_for(browser._scrape(["https://example.com/qc"]), timeout=1)
+
+        assert [page["url"] for page in pages] == ["https://example.com/qc"]
+        assert browser.cancel_pending() == 1
+
+    @pytest.mark.asyncio
+    async def test_sub_queries_rank_against_the_whole_pool(self, scrape_urls):
+        browser = make_browser()
+        await browser._scrape(["https://example.com/qc"])
+        await browser._scrape(["https://example.com/cake", "https://example.com/qec"])
+
+        docs = await browser.page_pool.rank("quantum computing")
+
+        assert [doc.metadata["source"] for doc in docs] == ["https://example.com/qc", "https://example.com/qec"]
+
+    @pytest.mark.asyncio
+    async def test_waiting_on_another_sub_querys_scrape(self, scrape_urls):
+        browser = make_browser()
+        browser.prefetch_urls(["https://example.com/qec"])
+
+        await browser.page_pool.index(["https://example.com/qec", "https://example.com/unknown"])
+
+        assert scrape_urls.call_count == 1
+        assert list(browser.page_pool.pages) == ["https://example.com/qec"]
+
+    @pytest.mark.asyncio
+    async def test_checkpointed_pages_are_not_scraped_again(self, tmp_path):
+        checkpoint = RunCheckpoint(CheckpointStore(str(tmp_path / "checkpoints.db")), "run-1")
+        checkpoint.put_pages("https://example.com/a", [{"url": "https://example.com/a", "raw_content": "A"}])
+        researcher = SimpleNamespace(
+            cfg=SimpleNamespace(max_scraper_workers=2, shared_page_pool=False), checkpoint=checkpoint,
+        )
+        browser = BrowserManager(researcher)
+        scraped = [{"url": "https://example.com/b", "raw_content": "B", "image_urls": []}]
+
+        with patch("gpt_researcher.skills.browser.scrape_urls", AsyncMock(return_value=(scraped, []))) as scrape_urls:
+            pages, _ = await browser._scrape(["https://example.com/a", "https://example.com/b"])
+
+        assert scrape_urls.await_args.args[0] == ["https://example.com/b"]
+        assert [page["raw_content"] for page in pages] == ["A", "B"]
+        assert checkpoint.get_pages("https://example.com/b") == scraped
+
+    @pytest.mark.asyncio
+    async def test_cancelled_scrapes_are_left_out(self, scrape_urls):
+        browser = make_browser()
+        await browser._scrape(["https://example.com/qc"])
+        browser.prefetch_urls(["https://example.com/cake", "https://example.com/qec"])
+
+        assert browser.cancel_pending() == 2
+        pages, _ = await browser._scrape(["https://example.com/qc", "https://example.com/cake"])
+
+        assert [page["url"] for page in pages] == ["https://example.com/qc"]
+        assert list(browser.page_pool.pages) == ["https://example.com/qc"]
@@ -0,0 +1,343 @@
+"""
+Unit tests for ResearchConductor start-up scheduling.
+
+Covers the overlap between agent selection and the initial planning search,
+and the speculative prefetch of planning results, plus pipelined web research.
+"""
+import asyncio
+import logging
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from gpt_researcher.prompts import PromptFamily
+from gpt_researcher.skills.researcher import ResearchConductor
+from gpt_researcher.utils.budget import RunController
+from gpt_researcher.utils.cascade import CascadeStats
+from gpt_researcher.utils.checkpoint import CheckpointStore, RunCheckpoint, digest
+
+
+def make_researcher(**overrides):
+    """Build a minimal researcher stand-in for the conductor."""
+    cfg = SimpleNamespace(
+        prefetch_planning_sources=True, curate_sources=False, llm_cascade=False, research_pipeline=False,
+        saturation_stopping=False,
+    )
+    researcher = SimpleNamespace(
+        query="what is quantum computing",
+        query_domains=[],
+        parent_query="",
+        report_type="research_report",
+        report_source="web",
+        source_urls=None,
+        complement_source_urls=False,
+        agent=None,
+        role=None,
+        cfg=cfg,
+        headers={},
+        kwargs={},
+        verbose=False,
+        websocket=None,
+        prompt_family=Mock(),
+        retrievers=[type("TavilySearch", (), {})],
+        visited_urls=set(),
+        scraper_manager=Mock(),
+        add_costs=Mock(),
+        stage_cost_callback=Mock(return_value=Mock()),
+        get_costs=Mock(return_value=0.0),
+        research_costs=0.0,
+        checkpoint=RunCheckpoint(),
+        search_cache=None,
+        cascade_stats=CascadeStats(),
+        _log_event=AsyncMock(),
+    )
+    researcher.run_controller = RunController(researcher)
+    for key, value in overrides.items():
+        setattr(researcher, key, value)
+    return researcher
+
+
+class TestResearchStartup:
+    """Test suite for the research start-up dependency graph."""
+
+    @pytest.mark.asyncio
+    async def test_agent_selection_overlaps_initial_search(self):
+        """The initial search should be in flight while the agent is chosen."""
+        researcher = make_researcher()
+        conductor = ResearchConductor(researcher)
+        events = []
+
+        async def fake_search(*args, **kwargs):
+            events.append("search_start")
+            await asyncio.sleep(0.05)
+            events.append("search_end")
+            return [{"href": "https://example.com/a", "body": "a"}]
+
+        async def fake_choose_agent(**kwargs):
+            events.append("agent_start")
+            await asyncio.sleep(0.05)
+            events.append("agent_end")
+            return "Agent", "role"
+
+        with patch("gpt_researcher.skills.researcher.get_search_results", side_effect=fake_search), \
+                patch("gpt_researcher.skills.researcher.choose_agent", side_effect=fake_choose_agent), \
+                patch("gpt_researcher.skills.researcher.plan_research_outline", AsyncMock(return_value=["q1"])), \
+                patch.object(ResearchConductor, "_process_sub_query", AsyncMock(return_value="ctx")):
+            await conductor.conduct_research()
+
+        assert events.index("search_start") < events.index("agent_end")
+        researcher.scraper_manager.prefetch_urls.assert_called_once_with(["https://example.com/a"])
+        researcher.scraper_manager.cancel_pending.assert_called_once_with()
+        # Research is logged with the agent chosen while the search ran
+        researcher._log_event.assert_any_await("research", step="conducting_research", details={
+            "agent": "Agent", "role": "role"
+        })
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("report_source,prefetched", [
+        ("web", True), ("hybrid", True), ("local", False), ("langchain_documents", False),
+        ("langchain_vectorstore", False), ("azure", False),
+    ])
+    async def test_planning_sources_are_prefetched_only_for_web_research(self, report_source, prefetched):
+        """Research that never scrapes web results does not prefetch the planning sources."""
+        researcher = make_researcher(report_source=report_source)
+        conductor = ResearchConductor(researcher)
+
+        with patch("gpt_researcher.skills.researcher.get_search_results",
+                   AsyncMock(return_value=[{"href": "https://example.com/a"}])):
+            await conductor._run_planning_search(researcher.query)
+
+        assert researcher.scraper_manager.prefetch_urls.called is prefetched
+
+    @pytest.mark.asyncio
+    async def test_planning_search_is_shared(self):
+        """Repeated planning for the same query reuses a single search."""
+        researcher = make_researcher(agent="Agent", role="role")
+        conductor = ResearchConductor(researcher)
+        search = AsyncMock(return_value=[])
+
+        with patch("gpt_researcher.skills.researcher.get_search_results", search), \
+                patch("gpt_researcher.skills.researcher.plan_research_outline", AsyncMock(return_value=["q1"])):
+            await conductor.plan_research(researcher.query)
+            await conductor.plan_research(researcher.query)
+
+        assert search.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_planning_results_seed_original_query(self):
+        """The original query is not searched again with the primary retriever."""
+        primary = Mock(__name__="TavilySearch")
+        secondary = Mock(__name__="SerperSearch")
+        secondary.return_value.search.return_value = [{"href": "https://example.com/b"}]
+        researcher = make_researcher(retrievers=[primary, secondary], cfg=SimpleNamespace(
+            prefetch_planning_sources=False, max_search_results_per_query=5,
+            retriever_timeout=10.0, retriever_timeouts={}, scrape_budget=10, max_urls_per_domain=2, snippet_first=False))
+        conductor = ResearchConductor(researcher)
+
+        urls = await conductor._search_relevant_source_urls(
+            researcher.query, [], seed_results=[{"href": "https://example.com/a"}]
+        )
+
+        primary.assert_not_called()
+        assert sorted(urls) == ["https://example.com/a", "https://example.com/b"]
+
+
+    @pytest.mark.asyncio
+    async def test_retrievers_fan_out_under_deadlines(self, caplog):
+        """Retrievers run concurrently and a late one is dropped without holding back the rest."""
+        def make_retriever(name, delay, href):
+            def search(max_results):
+                time.sleep(delay)
+                return [{"href": href}]
+            return type(name, (), {"__init__": lambda self, *args, **kwargs: None, "search": staticmethod(search)})
+
+        retrievers = [
+            make_retriever("TavilySearch", 0.2, "https://example.com/a"),
+            make_retriever("BingSearch", 0.2, "https://example.com/b"),
+            make_retriever("ArxivSearch", 1.0, "https://example.com/c"),
+        ]
+        researcher = make_researcher(retrievers=retrievers, cfg=SimpleNamespace(
+            max_search_results_per_query=5, retriever_timeout=0.5, retriever_timeouts={"arxiv": 0.3},
+            scrape_budget=10, max_urls_per_domain=2, snippet_first=False))
+        conductor = ResearchConductor(researcher)
+
+        started = time.perf_counter()
+        with caplog.at_level(logging.WARNING, logger="research"):
+            urls = await conductor._search_relevant_source_urls(researcher.query, [])
+
+        assert time.perf_counter() - started < 0.45
+        assert sorted(urls) == ["https://example.com/a", "https://example.com/b"]
+        stats = conductor.retriever_stats.summary()
+        assert stats["ArxivSearch"]["outcomes"] == {"timeout": 1}
+        assert stats["BingSearch"]["outcomes"] == {"ok": 1}
+        assert "Dropped ArxivSearch results" in caplog.text
+
+    @pytest.mark.asyncio
+    async def test_sub_queries_share_one_batch_search(self):
+        """Retrievers that accept several queries per request get all sub-queries at once."""
+        class BatchSearch:
+            native_search_many = True
+            search_many = AsyncMock(side_effect=lambda queries, *args, **kwargs: [
+                [{"href": f"https://example.com/{query}"}] for query in queries
+            ])
+
+            def __init__(self, *args, **kwargs):
+                raise AssertionError("sub-queries should not be searched one by one")
+
+        researcher = make_researcher(retrievers=[BatchSearch], cfg=SimpleNamespace(
+            max_search_results_per_query=5, retriever_timeout=1.0, retriever_timeouts={},
+            scrape_budget=10, max_urls_per_domain=2, snippet_first=False))
+        conductor = ResearchConductor(researcher)
+
+        conductor._start_batch_searches(["solar", "wind"], [])
+        urls = await asyncio.gather(*[conductor._search_relevant_source_urls(query, []) for query in ("solar", "wind")])
+
+        assert urls == [["https://example.com/solar"], ["https://example.com/wind"]]
+        BatchSearch.search_many.assert_awaited_once()
+        assert conductor.retriever_stats.summary()["BatchSearch"]["outcomes"] == {"ok": 2}
+
+
+class FakeEmbeddings:
+    """Embeds texts mentioning 'quantum' on one axis and everything else on another."""
+
+    @staticmethod
+    def _embed(text):
+        return [1.0, 0.0] if "quantum" in text.lower() else [0.0, 1.0]
+
+    async def aembed_documents(self, texts):
+        return [self._embed(text) for text in texts]
+
+    async def aembed_query(self, text):
+        return self._embed(text)
+
+
+class TestResearchPipeline:
+    """Test suite for pipelined web research."""
+
+    @pytest.mark.asyncio
+    async def test_pipeline_ranks_pages_per_sub_query(self):
+        pages = {
+            "https://example.com/qc": {"url": "https://example.com/qc", "title": "QC", "raw_content": "Quantum bits explained."},
+            "https://example.com/cake": {"url": "https://example.com/cake", "title": "Cake", "raw_content": "How to bake a cake."},
+        }
+
+        async def scrape_url(url):
+            return [pages[url]], []
+
+        cfg = SimpleNamespace(
+            max_scraper_workers=2, pipeline_search_workers=2, pipeline_embed_workers=2, pipeline_queue_size=1,
+        )
+        researcher = make_researcher(
+            cfg=cfg,
+            memory=Mock(get_embeddings=Mock(return_value=FakeEmbeddings())),
+            prompt_family=PromptFamily,
+            vector_store=None,
+            add_research_sources=Mock(),
+            add_research_images=Mock(),
+            scraper_manager=Mock(scrape_url=scrape_url, select_top_images=Mock(return_value=[])),
+        )
+        conductor = ResearchConductor(researcher)
+
+        async def search(sub_query, query_domains=None, seed_results=None):
+            if sub_query == "quantum computing":
+                return [{"href": url} for url in pages]
+            # Claimed by the other sub-query, so waited for rather than left out
+            return [{"href": "https://example.com/qc", "claimed": True}]
+
+        conductor._search_relevant_sources = search
+
+        context = await conductor._get_context_by_pipeline(
+            researcher.query, ["quantum computing", "quantum bits"], query_domains=[]
+        )
+
+        assert "Quantum bits explained." in context[0] and "Quantum bits explained." in context[1]
+        assert "cake" not in context[0]
+        # The claimed page is recorded as a source and embedded once
+        assert researcher.add_research_sources.call_count == 2
+        assert len(conductor.pipeline_stats) == 5 and conductor.pipeline_stats["fetch"]["processed"] == 3
+        assert conductor.pipeline_stats["rank"]["processed"] == 3
+
+    @pytest.mark.asyncio
+    async def test_pipeline_skips_sub_queries_once_the_budget_is_used_up(self):
+        cfg = SimpleNamespace(
+            max_scraper_workers=2, pipeline_search_workers=2, pipeline_embed_workers=2, pipeline_queue_size=1,
+        )
+        researcher = make_researcher(
+            cfg=cfg,
+            memory=Mock(get_embeddings=Mock(return_value=FakeEmbeddings())),
+            prompt_family=PromptFamily,
+            run_controller=Mock(exhaustion_reason=Mock(return_value="time")),
+            add_research_images=Mock(),
+        )
+        conductor = ResearchConductor(researcher)
+        conductor._search_relevant_sources = AsyncMock()
+
+        context = await conductor._get_context_by_pipeline(researcher.query, ["quantum computing"], query_domains=[])
+
+        assert context == [""]
+        conductor._search_relevant_sources.assert_not_awaited()
+        researcher.run_controller.record_drop.assert_called_once_with("sub_queries")
+
+
+class TestSnippetFirst:
+    """Test suite for snippet-first research."""
+
+    @pytest.mark.asyncio
+    async def test_only_relevant_truncated_snippets_are_scraped(self):
+        search_results = [
+            {"href": "https://example.com/full", "title": "Full", "body": "Quantum computers use qubits for computation."},
+            {"href": "https://example.com/cut", "title": "Cut", "body": "Quantum error correction is..."},
+            {"href": "https://example.com/raw", "title": "Raw", "body": "Quantum...",
+             "raw_content": "Quantum annealing, explained in full."},
+            {"href": "https://example.com/cake", "title": "Cake", "body": "How to bake a..."},
+        ]
+        scraped_page = {"url": "https://example.com/cut", "title": "Cut", "raw_content": "Quantum error correction in depth."}
+        cfg = SimpleNamespace(
+            snippet_first=True, snippet_scrape_limit=3, snippet_min_chars=20, shared_page_pool=False,
+        )
+        researcher = make_researcher(
+            cfg=cfg,
+            memory=Mock(get_embeddings=Mock(return_value=FakeEmbeddings())),
+            vector_store=None,
+            add_research_sources=Mock(),
+            scraper_manager=Mock(browse_urls=AsyncMock(return_value=[scraped_page])),
+        )
+        conductor = ResearchConductor(researcher)
+        conductor._search_relevant_sources = AsyncMock(return_value=search_results)
+
+        pages = await conductor._scrape_data_by_urls("quantum computing")
+
+        researcher.scraper_manager.browse_urls.assert_awaited_once_with(["https://example.com/cut"])
+        assert [page["raw_content"] for page in pages] == [
+            "Quantum error correction in depth.",
+            "Quantum computers use qubits for computation.",
+            "Quantum annealing, explained in full.",
+        ]
+
+
+class TestResume:
+    """Test suite for resuming checkpointed research."""
+
+    @pytest.mark.asyncio
+    async def test_resume_researches_only_unfinished_sub_queries(self, tmp_path):
+        """Sub-queries checkpointed before an interruption keep their context on resume."""
+        checkpoint = RunCheckpoint(CheckpointStore(str(tmp_path / "checkpoints.db")), "run-1")
+        query = "what is quantum computing"
+        checkpoint.put(f"sub_queries:web:{digest(query)}", ["qubits", "error correction"])
+        checkpoint.put(f"context:web:{digest('qubits')}", {
+            "context": "qubit context", "visited_urls": ["https://example.com/qubits"],
+        })
+        researcher = make_researcher(checkpoint=checkpoint)
+        conductor = ResearchConductor(researcher)
+        conductor.plan_research = AsyncMock()
+        conductor._process_sub_query = AsyncMock(side_effect=lambda sub_query, *args, **kwargs: f"{sub_query} context")
+
+        context = await conductor._get_context_by_web_search(query)
+
+        conductor.plan_research.assert_not_awaited()
+        assert [call.args[0] for call in conductor._process_sub_query.await_args_list] == ["error correction", query]
+        assert context == f"qubit context error correction context {query} context"
+        assert "https://example.com/qubits" in researcher.visited_urls
+        assert checkpoint.get(f"context:web:{digest(query)}")["context"] == f"{query} context"
@@ -0,0 +1,128 @@
+"""
+Unit tests for stopping research once new context stops adding information.
+"""
+import re
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from gpt_researcher.prompts import PromptFamily
+from gpt_researcher.skills.browser import BrowserManager
+from gpt_researcher.skills.context_manager import ContextManager
+from gpt_researcher.skills.researcher import ResearchConductor
+from gpt_researcher.skills.saturation import SaturationMonitor
+from gpt_researcher.utils.budget import RunController
+from gpt_researcher.utils.checkpoint import RunCheckpoint
+
+
+class FakeEmbeddings:
+    """Embeds every distinct text on an axis of its own, so only repeated texts are similar."""
+
+    def __init__(self):
+        self.axes = {}
+
+    async def aembed_documents(self, texts):
+        return [[1.0 if i == self.axes.setdefault(text, len(self.axes)) else 0.0 for i in range(16)] for text in texts]
+
+
+def make_monitor(planned):
+    researcher = SimpleNamespace(
+        memory=Mock(get_embeddings=Mock(return_value=FakeEmbeddings())),
+        stage_cost_callback=Mock(return_value=Mock()),
+        scraper_manager=Mock(cancel_pending=Mock(return_value=3)),
+    )
+    return SaturationMonitor(researcher, planned=planned, threshold=0.2, min_fraction=0.5)
+
+
+class TestSaturationMonitor:
+    """Test suite for novelty tracking and the stop decision."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_context_saturates_the_run(self):
+        monitor = make_monitor(planned=6)
+
+        assert await monitor.observe("solar", "Solar panels convert light.") == 1.0
+        assert await monitor.observe("panels", "Solar panels convert light.") == 0.0
+        # Two sub-queries observed, but three must be before research may stop
+        assert not monitor.saturated and not monitor.skip("wind", "sub_queries")
+
+        await monitor.observe("photovoltaics", "Solar panels convert light.")
+
+        assert monitor.saturated
+        assert monitor.skip("wind", "scrapes")
+        monitor.researcher.scraper_manager.cancel_pending.assert_called_once()
+        summary = monitor.summary()
+        assert summary["observed"] == 3 and summary["scrapes_cancelled"] == 3
+        assert summary["skipped"] == {"scrapes": 1}
+        assert "below 0.2 after 3 of 6 planned" in summary["stop_reason"]
+
+    @pytest.mark.asyncio
+    async def test_novel_context_keeps_research_going(self):
+        monitor = make_monitor(planned=4)
+
+        for sub_query in ("solar", "wind", "tidal", "geothermal"):
+            await monitor.observe(sub_query, f"All about {sub_query} power.")
+
+        assert not monitor.saturated
+        assert monitor.summary()["stop_reason"] is None
+
+
+class PageEmbeddings:
+    """Embeds every page on an axis of its own, by the page markers a text mentions, all equally relevant."""
+
+    def __init__(self):
+        self.axes = {}
+
+    def _embed(self, text):
+        axis = self.axes.setdefault(tuple(re.findall(r"page-\d+", text)), len(self.axes))
+        return [1.0] + [0.5 if i == axis else 0.0 for i in range(16)]
+
+    async def aembed_documents(self, texts):
+        return [self._embed(text) for text in texts]
+
+    async def aembed_query(self, text):
+        return [1.0] + [0.0] * 16
+
+
+class TestSaturationWithPagePool:
+    """Test suite for novelty measured on sub-queries ranking against the shared page pool."""
+
+    @pytest.mark.asyncio
+    async def test_pooled_context_of_earlier_sub_queries_is_not_counted_as_stale(self):
+        # Each sub-query finds one new page; its pooled context also holds every earlier page
+        pages = {f"https://example.com/{n}": f"page-{n} " + "solar " * 100 for n in range(4)}
+        researcher = SimpleNamespace(
+            cfg=SimpleNamespace(max_scraper_workers=2, shared_page_pool=True, snippet_first=False, mcp_strategy="fast"),
+            verbose=False,
+            websocket=None,
+            retrievers=[],
+            vector_store=None,
+            prompt_family=PromptFamily,
+            memory=Mock(get_embeddings=Mock(return_value=PageEmbeddings())),
+            stage_cost_callback=Mock(return_value=Mock()),
+            add_research_sources=Mock(),
+            add_research_images=Mock(),
+            get_research_images=Mock(return_value=[]),
+            checkpoint=RunCheckpoint(),
+            research_costs=0.0,
+        )
+        researcher.run_controller = RunController(researcher)
+        researcher.scraper_manager = BrowserManager(researcher)
+        researcher.context_manager = ContextManager(researcher)
+        conductor = ResearchConductor(researcher)
+        conductor.saturation = SaturationMonitor(researcher, planned=4, threshold=0.5, min_fraction=0.5)
+
+        async def search(sub_query, query_domains=None, seed_results=None):
+            return [{"href": f"https://example.com/{sub_query}"}]
+
+        async def scrape_urls(urls, cfg, worker_pool):
+            return [{"url": url, "raw_content": pages[url], "title": "", "image_urls": []} for url in urls], []
+
+        with patch.object(conductor, "_search_relevant_sources", side_effect=search), \
+                patch("gpt_researcher.skills.browser.scrape_urls", side_effect=scrape_urls):
+            contexts = [await conductor._process_sub_query(str(n)) for n in range(4)]
+
+        assert "page-0" in contexts[3] and "page-3" in contexts[3]
+        assert conductor.saturation.novelty == {str(n): 1.0 for n in range(4)}
+        assert not conductor.saturation.saturated
@@ -0,0 +1,165 @@
+"""
+Unit tests for writing long reports section by section.
+"""
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+from gpt_researcher.skills.writer import ReportGenerator
+from gpt_researcher.utils.enum import Tone
+
+TITLES = ["Costs", "Adoption", "Outlook"]
+
+
+class FakeEmbeddings:
+    """Embeds texts by which section title they mention."""
+
+    def _embed(self, text):
+        return [1.0 if title.lower() in text.lower() else 0.0 for title in TITLES] + [0.1]
+
+    async def aembed_documents(self, texts):
+        return [self._embed(text) for text in texts]
+
+
+class FakeWebsocket:
+    def __init__(self):
+        self.sent = []
+
+    async def send_json(self, data):
+        self.sent.append(data)
+
+
+def make_generator(total_words=3000, concurrency=2):
+    researcher = SimpleNamespace(
+        query="solar power",
+        role="researcher",
+        verbose=False,
+        report_type="research_report",
+        report_source="web",
+        tone=Tone.Objective,
+        websocket=FakeWebsocket(),
+        headers={},
+        kwargs={},
+        context="\n\n".join(
+            f"Source: https://{topic.lower()}{i}.example\nContent: {topic} data {i}."
+            for topic in TITLES for i in range(3)
+        ),
+        cfg=SimpleNamespace(
+            agent_role=None, total_words=total_words, sectioned_reports=True,
+            sectioned_report_min_words=2000, section_concurrency=concurrency,
+        ),
+        prompt_family=None,
+        memory=Mock(get_embeddings=Mock(return_value=FakeEmbeddings())),
+        stage_cost_callback=Mock(return_value=Mock()),
+        get_research_images=Mock(return_value=[]),
+    )
+    return ReportGenerator(researcher)
+
+
+class TestSectionedReport:
+    """Test suite for concurrent section writing with in-order streaming."""
+
+    @pytest.mark.asyncio
+    async def test_sections_are_written_concurrently_and_streamed_in_order(self):
+        generator = make_generator()
+        running, max_running, contexts, parts = [0], [0], {}, {}
+
+        async def write_section(section_title, context, **kwargs):
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+            # Earlier sections take longer, so later ones finish first
+            await asyncio.sleep(0.03 * (len(TITLES) - TITLES.index(section_title)))
+            running[0] -= 1
+            contexts[section_title] = context
+            url = f"https://{section_title.lower()}0.example"
+            assert url in context
+            return f"## {section_title}\n\nAbout {section_title.lower()} ([source]({url}))."
+
+        async def write_introduction(context, **kwargs):
+            parts["introduction"] = context
+            return "# Introduction"
+
+        async def write_conclusion(context, **kwargs):
+            parts["conclusion"] = context
+            return "## Conclusion"
+
+        with patch("gpt_researcher.skills.writer.generate_draft_section_titles",
+                   return_value=[f"### {title}" for title in TITLES]), \
+                patch("gpt_researcher.skills.writer.write_report_section", side_effect=write_section), \
+                patch("gpt_researcher.skills.writer.write_report_introduction", side_effect=write_introduction), \
+                patch("gpt_researcher.skills.writer.write_conclusion", side_effect=write_conclusion), \
+                patch("gpt_researcher.skills.writer.generate_report") as generate_report:
+            report = await generator.write_report()
+
+        generate_report.assert_not_called()
+        assert max_running[0] == 2
+        streamed = [message["output"] for message in generator.researcher.websocket.sent]
+        # The stream follows the order of the report, introduction first
+        assert [chunk.split("\n")[0] for chunk in streamed] == [
+            "# Introduction", "## Costs", "## Adoption", "## Outlook", "## Conclusion",
+        ]
+        assert "".join(streamed).strip() == report.split("\n\n## References")[0].strip()
+        # Each section is written from the sources about it
+        assert "https://costs0.example" in contexts["Costs"] and "https://outlook0.example" not in contexts["Costs"]
+        # The introduction and conclusion are written from the section summaries
+        assert parts["introduction"].startswith("## Costs\nAbout costs")
+        assert parts["conclusion"] == parts["introduction"]
+        assert report.index("# Introduction") < report.index("## Costs") < report.index("## Conclusion")
+        assert report.endswith("- [https://outlook0.example](https://outlook0.example)\n")
+
+    @pytest.mark.asyncio
+    async def test_oversized_context_is_reduced_once_for_all_sections(self):
+        generator = make_generator()
+        original = generator.researcher.context
+        contexts = []
+
+        async def write_section(section_title, context, **kwargs):
+            contexts.append(context)
+            return f"## {section_title}\n\nAbout {section_title.lower()}."
+
+        async def reduce_context(query, context, cfg, **kwargs):
+            return context.replace("data", "notes")
+
+        with patch("gpt_researcher.skills.writer.generate_draft_section_titles",
+                   return_value=[f"### {title}" for title in TITLES]), \
+                patch("gpt_researcher.skills.writer.needs_reduction", side_effect=lambda context, cfg: context is original), \
+                patch("gpt_researcher.skills.writer.reduce_context", side_effect=reduce_context) as reduce, \
+                patch("gpt_researcher.skills.writer.write_report_section", side_effect=write_section), \
+                patch("gpt_researcher.skills.writer.write_report_introduction", return_value="# Introduction"), \
+                patch("gpt_researcher.skills.writer.write_conclusion", return_value="## Conclusion"):
+            await generator.write_report()
+
+        reduce.assert_called_once()
+        assert len(contexts) == 3 and all("notes" in context and "data" not in context for context in contexts)
+
+    @pytest.mark.asyncio
+    async def test_nothing_is_streamed_when_no_section_is_written(self):
+        generator = make_generator()
+
+        async def write_section(section_title, context, **kwargs):
+            return ""
+
+        with patch("gpt_researcher.skills.writer.generate_draft_section_titles",
+                   return_value=[f"### {title}" for title in TITLES]), \
+                patch("gpt_researcher.skills.writer.write_report_section", side_effect=write_section), \
+                patch("gpt_researcher.skills.writer.write_report_introduction") as write_introduction, \
+                patch("gpt_researcher.skills.writer.generate_report", return_value="# Report") as generate_report:
+            assert await generator.write_report() == "# Report"
+
+        # The one-call report is the only one the client receives
+        write_introduction.assert_not_called()
+        generate_report.assert_called_once()
+        assert generator.researcher.websocket.sent == []
+
+    @pytest.mark.asyncio
+    async def test_short_reports_are_written_in_one_call(self):
+        generator = make_generator(total_words=1200)
+
+        with patch("gpt_researcher.skills.writer.generate_report", return_value="# Report") as generate_report, \
+                patch("gpt_researcher.skills.writer.generate_draft_section_titles") as outline:
+            assert await generator.write_report() == "# Report"
+
+        generate_report.assert_called_once()
+        outline.assert_not_called()
@@ -0,0 +1,66 @@
+"""
+Unit tests for the research session shared by many researchers.
+"""
+from unittest.mock import Mock, patch
+
+import pytest
+
+from gpt_researcher import GPTResearcher, ResearchSession
+from gpt_researcher.session import current_session
+from gpt_researcher.utils.http import close_http_client, get_http_client
+from gpt_researcher.utils.llm import get_llm
+
+
+@pytest.fixture(autouse=True)
+def api_key(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+
+
+class TestResearchSession:
+    """Test suite for borrowing pooled resources and the session lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_researchers_borrow_the_session_resources(self):
+        async with ResearchSession() as session:
+            first = GPTResearcher(query="solar power")
+            second = GPTResearcher(query="wind power", verbose=False)
+
+            assert first.session is second.session is session
+            assert first.scraper_manager.worker_pool is second.scraper_manager.worker_pool is session.worker_pool
+            assert first.memory is second.memory
+            # Each researcher gets its own copy of the configuration snapshot
+            assert first.cfg is not second.cfg
+            assert first.cfg.llm_kwargs["verbose"] is True and second.cfg.llm_kwargs["verbose"] is False
+
+        other = GPTResearcher(query="tidal power")
+        assert other.session is None
+        assert other.scraper_manager.worker_pool is not session.worker_pool
+
+    @pytest.mark.asyncio
+    async def test_llm_calls_share_one_chat_model(self):
+        chat_model = Mock()
+        created = Mock(llm=chat_model)
+        async with ResearchSession():
+            with patch("gpt_researcher.llm_provider.GenericLLMProvider.from_provider", return_value=created) as from_provider:
+                first = get_llm("openai", model="gpt-4o", temperature=0.4)
+                second = get_llm("openai", model="gpt-4o", temperature=0.4)
+                get_llm("openai", model="gpt-4o", temperature=0.0)
+
+        assert from_provider.call_count == 2
+        assert first is created and second is not created
+        assert second.llm is chat_model
+
+    @pytest.mark.asyncio
+    async def test_closing_the_session_releases_its_resources(self):
+        async with ResearchSession() as session:
+            client = get_http_client()
+            assert get_http_client() is client
+            assert current_session() is session
+
+        assert current_session() is None
+        assert session.closed and client.is_closed
+        assert session.worker_pool.executor._shutdown
+        assert get_http_client() is not client
+        await close_http_client()
+        with pytest.raises(RuntimeError):
+            session.config()
@@ -0,0 +1,101 @@
+"""
+Unit tests for run time and cost budgets.
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from gpt_researcher import GPTResearcher
+from gpt_researcher.utils.budget import RunController, bounded_timeout, time_left
+from gpt_researcher.utils.llm import create_chat_completion
+
+
+def make_controller(**budgets):
+    researcher = SimpleNamespace(research_costs=0.0)
+    return RunController(researcher, **budgets)
+
+
+class TestRunController:
+    """Test suite for budget admission and deadline propagation."""
+
+    def test_unlimited_budget_admits_everything(self):
+        controller = make_controller()
+        assert controller.admit(["a", "b", "c"], "sub_queries") == ["a", "b", "c"]
+        with controller.research_phase():
+            assert time_left() is None
+            assert bounded_timeout(10) == 10
+
+    def test_admission_drops_the_tail_as_cost_runs_low(self):
+        controller = make_controller(cost_budget_usd=1.0, writing_reserve=0.2)
+        controller.researcher.research_costs = 0.4  # half of the research share left
+
+        assert controller.admit(["a", "b", "c", "d", "e", "f", "g", "h"], "urls") == ["a", "b", "c", "d"]
+
+        controller.researcher.research_costs = 0.8
+        assert controller.exhaustion_reason() == "cost"
+        assert controller.admit(["a", "b"], "urls") == []
+        assert controller.summary()["dropped"] == {"urls": 6}
+
+    def test_phase_deadlines_bound_timeouts(self):
+        controller = make_controller(time_budget_s=100, writing_reserve=0.25)
+        controller.start()
+
+        with controller.research_phase():
+            assert 70 < bounded_timeout(300) <= 75
+            assert bounded_timeout(5) == 5
+        with controller.writing_phase():
+            assert 95 < time_left() <= 100
+        assert time_left() is None
+
+    def test_nested_runs_keep_the_parent_deadline(self):
+        parent = make_controller(time_budget_s=10)
+        child = make_controller(time_budget_s=1000)
+        parent.start()
+
+        with parent.research_phase(), child.research_phase():
+            assert time_left() <= 7.5
+
+    @pytest.mark.asyncio
+    async def test_llm_calls_end_at_the_research_deadline(self):
+        async def slow_response(*args, **kwargs):
+            await asyncio.sleep(5)
+            return "late"
+
+        provider = Mock(get_chat_response=slow_response)
+        controller = make_controller(time_budget_s=0.2, writing_reserve=0.5)
+        controller.start()
+
+        started = time.monotonic()
+        with patch("gpt_researcher.utils.llm.get_llm", return_value=provider), controller.research_phase():
+            with pytest.raises(asyncio.TimeoutError):
+                await create_chat_completion(messages=[], model="gpt-4o", llm_provider="openai")
+
+        assert time.monotonic() - started < 1
+
+    @pytest.mark.asyncio
+    async def test_run_out_of_time_returns_what_it_gathered(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("CURATE_SOURCES", "false")
+        monkeypatch.setenv("PREFETCH_PLANNING_SOURCES", "false")
+
+        async def slow_response(*args, **kwargs):
+            await asyncio.sleep(5)
+            return "late"
+
+        search = AsyncMock(return_value=[
+            {"href": "https://example.com/solar", "title": "Solar", "body": "Solar capacity doubled in 2024."},
+        ])
+        researcher = GPTResearcher(query="How fast is solar power growing?", report_source="web", time_budget_s=1)
+
+        started = time.monotonic()
+        with patch("gpt_researcher.utils.llm.get_llm", return_value=Mock(get_chat_response=slow_response)), \
+                patch("gpt_researcher.skills.researcher.get_search_results", search):
+            context = await researcher.conduct_research()
+
+        assert time.monotonic() - started < 2
+        assert "Solar capacity doubled in 2024." in context
+        assert researcher.agent == "Default Agent"
+        assert researcher.run_controller.summary()["exhausted"] == "time"
@@ -0,0 +1,71 @@
+"""
+Unit tests for the fast/strategic model cascade.
+"""
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from gpt_researcher.utils.cascade import (
+    CascadeStats,
+    cascade_chat_completion,
+    score_json_list,
+    score_json_object,
+    score_sub_queries,
+)
+
+
+@pytest.fixture
+def cfg():
+    return SimpleNamespace(
+        fast_llm_model="gpt-5-mini",
+        fast_llm_provider="openai",
+        llm_kwargs={},
+        llm_cascade_threshold=0.7,
+        llm_cascade_samples=1,
+    )
+
+
+class TestCascade:
+    """Test suite for cascade scoring and escalation."""
+
+    def test_sub_query_score_rewards_query_coverage(self):
+        score = score_sub_queries("solar panel efficiency trends")
+        assert score('["solar panel efficiency 2024", "panel efficiency trends"]') == 1.0
+        assert score('["cooking recipes"]') == 0.5
+        assert score("not a list") == 0.0
+
+    def test_json_object_score_requires_keys(self):
+        score = score_json_object("server", "agent_role_prompt")
+        assert score('{"server": "Agent", "agent_role_prompt": "role"}') == 1.0
+        assert score('{"server": "Agent"}') == 0.0
+        assert score('```json\n{"server": "Agent", "agent_role_prompt": "role"}\n```') == 1.0
+        assert score("not an object") == 0.0
+
+    def test_json_list_score_accepts_fenced_lists(self):
+        assert score_json_list('```json\n[{"id": 0, "score": 7}]\n```') == 1.0
+        assert score_json_list("[]") == 0.0
+        assert score_json_list("no list here") == 0.0
+
+    @pytest.mark.asyncio
+    async def test_confident_fast_answer_is_used(self, cfg):
+        stats = CascadeStats()
+        with patch("gpt_researcher.utils.cascade.create_chat_completion",
+                   AsyncMock(return_value='{"server": "A", "agent_role_prompt": "r"}')):
+            response = await cascade_chat_completion(
+                [], cfg, "choose_agent", score_json_object("server", "agent_role_prompt"), stats
+            )
+        assert response is not None
+        assert stats.summary()["choose_agent"]["escalation_rate"] == 0.0
+
+    @pytest.mark.asyncio
+    async def test_disagreeing_samples_escalate(self, cfg):
+        stats = CascadeStats()
+        with patch("gpt_researcher.utils.cascade.create_chat_completion",
+                   AsyncMock(side_effect=["None", "Please add sources"])):
+            response = await cascade_chat_completion(
+                [], cfg, "review_draft", lambda r: 1.0, stats, samples=2,
+                agreement=lambda a, b: float(("None" in a) == ("None" in b)),
+            )
+        assert response is None
+        assert stats.summary()["review_draft"]["escalations"] == 1
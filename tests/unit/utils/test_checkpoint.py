@@ -0,0 +1,39 @@
+"""
+Unit tests for the checkpoint store of resumable research runs.
+"""
+import pytest
+
+from gpt_researcher.utils.checkpoint import CheckpointStore, RunCheckpoint
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = CheckpointStore(str(tmp_path / "checkpoints.db"))
+    yield store
+    store.close()
+
+
+class TestCheckpoint:
+    """Test suite for the checkpoint store and resuming completed stages."""
+
+    def test_stages_and_pages_round_trip(self, store):
+        checkpoint = RunCheckpoint(store, "run-1")
+        checkpoint.register("gpt_researcher", {"query": "q"})
+        checkpoint.register("gpt_researcher", {"query": "other"})
+        checkpoint.put("agent", ["Agent", "role"])
+        checkpoint.put_pages("https://example.com/a", [{"url": "https://example.com/a", "raw_content": "A"}])
+
+        resumed = RunCheckpoint(store, "run-1")
+        assert store.get_run("run-1") == {"kind": "gpt_researcher", "params": {"query": "q"}}
+        assert resumed.get("agent") == ["Agent", "role"]
+        assert resumed.get_pages("https://example.com/a")[0]["raw_content"] == "A"
+        # Pages are only restored for the runs that scraped them
+        assert RunCheckpoint(store, "run-2").get_pages("https://example.com/a") is None
+        assert resumed.child("subtopic-1") == "run-1/subtopic-1"
+
+    def test_disabled_checkpoint_is_a_no_op(self):
+        checkpoint = RunCheckpoint()
+        checkpoint.put("agent", ["Agent", "role"])
+        assert not checkpoint.enabled
+        assert checkpoint.get("agent", "missing") == "missing"
+        assert checkpoint.child("subtopic-1") is None
@@ -0,0 +1,83 @@
+"""
+Unit tests for token and cost accounting.
+"""
+from functools import partial
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from gpt_researcher.agent import GPTResearcher
+from gpt_researcher.utils.costs import (
+    MAX_EXACT_TOKENIZE_CHARS,
+    UsageTracker,
+    count_tokens,
+    get_model_prices,
+    llm_usage_cost,
+)
+from gpt_researcher.utils.llm import create_chat_completion
+
+
+def make_researcher():
+    return SimpleNamespace(research_costs=0.0, usage_tracker=UsageTracker(), log_handler=None)
+
+
+def make_provider(response="done", last_usage=None):
+    provider = Mock()
+    provider.get_chat_response = AsyncMock(return_value=response)
+    provider.last_usage = last_usage
+    return provider
+
+
+class TestCosts:
+    """Test suite for price lookup and usage-based costs."""
+
+    def test_price_lookup_prefers_longest_model_prefix(self):
+        assert get_model_prices("gpt-4o-mini-2024-07-18") == pytest.approx((0.15e-6, 0.6e-6, 0.075e-6))
+        assert get_model_prices("openai/gpt-4o") == pytest.approx((2.5e-6, 10e-6, 1.25e-6))
+
+    def test_cached_tokens_are_billed_at_cached_price(self):
+        full = llm_usage_cost(input_tokens=1000, output_tokens=0, model="gpt-4o")
+        cached = llm_usage_cost(input_tokens=1000, output_tokens=0, model="gpt-4o", cached_tokens=1000)
+        assert cached == pytest.approx(full / 2)
+
+    def test_long_texts_are_not_tokenized(self):
+        text = "word " * MAX_EXACT_TOKENIZE_CHARS
+        with patch("gpt_researcher.utils.costs.get_encoding") as get_encoding:
+            assert count_tokens(text) == len(text) // 4
+        get_encoding.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_provider_usage_is_recorded_per_stage(self):
+        researcher = make_researcher()
+        usage = {"input_tokens": 1000, "output_tokens": 100, "input_token_details": {"cache_read": 400}}
+        with patch("gpt_researcher.utils.llm.get_llm", return_value=make_provider(last_usage=usage)), \
+                patch("gpt_researcher.utils.costs.get_encoding") as get_encoding:
+            await create_chat_completion(
+                messages=[{"role": "user", "content": "hi"}],
+                model="gpt-4o",
+                llm_provider="openai",
+                cost_callback=partial(GPTResearcher.add_costs, researcher, stage="writing"),
+            )
+        get_encoding.assert_not_called()
+
+        summary = researcher.usage_tracker.summary()
+        assert summary["writing"]["input_tokens"] == 1000
+        assert summary["writing"]["cached_tokens"] == 400
+        expected = llm_usage_cost(input_tokens=1000, output_tokens=100, model="gpt-4o", cached_tokens=400)
+        assert researcher.research_costs == pytest.approx(expected)
+
+    @pytest.mark.asyncio
+    async def test_plain_cost_callbacks_still_receive_a_float(self):
+        callback = Mock()
+        encoding = Mock(encode=Mock(side_effect=lambda text, **kwargs: text.split()))
+        with patch("gpt_researcher.utils.llm.get_llm", return_value=make_provider()), \
+                patch("gpt_researcher.utils.costs.get_encoding", return_value=encoding):
+            await create_chat_completion(
+                messages=[{"role": "user", "content": "hi"}],
+                model="gpt-4o",
+                llm_provider="openai",
+                cost_callback=callback,
+            )
+        (cost,), kwargs = callback.call_args
+        assert cost > 0 and kwargs == {}
@@ -0,0 +1,65 @@
+"""
+Unit tests for the staged pipeline engine.
+"""
+import asyncio
+
+import pytest
+
+from gpt_researcher.utils.pipeline import Pipeline, PipelineStage
+
+
+class TestPipeline:
+    """Test suite for bounded, staged processing."""
+
+    @pytest.mark.asyncio
+    async def test_items_do_not_wait_for_stragglers(self):
+        async def fetch(delay):
+            await asyncio.sleep(delay)
+            yield delay
+
+        async def parse(delay):
+            yield f"parsed {delay}"
+
+        pipeline = Pipeline([PipelineStage("fetch", fetch, workers=2), PipelineStage("parse", parse)])
+        results = await pipeline.run([0.2, 0.0])
+
+        assert results == ["parsed 0.0", "parsed 0.2"]
+
+    @pytest.mark.asyncio
+    async def test_full_queues_hold_back_upstream_stages(self):
+        in_flight, peak = 0, 0
+
+        async def produce(n):
+            nonlocal in_flight, peak
+            for i in range(n):
+                in_flight += 1
+                peak = max(peak, in_flight)
+                yield i
+
+        async def consume(item):
+            nonlocal in_flight
+            await asyncio.sleep(0.001)
+            in_flight -= 1
+            yield item
+
+        pipeline = Pipeline([PipelineStage("produce", produce), PipelineStage("consume", consume)], queue_size=2)
+        results = await pipeline.run([50])
+
+        assert len(results) == 50
+        # At most one queue's worth plus the items held by each stage
+        assert peak <= 4
+
+    @pytest.mark.asyncio
+    async def test_errors_are_counted_and_utilization_reported(self):
+        async def check(item):
+            if item == "bad":
+                raise ValueError("bad item")
+            yield item
+
+        pipeline = Pipeline([PipelineStage("check", check, workers=2)])
+        results = await pipeline.run(["good", "bad", "fine"])
+        stats = pipeline.utilization()["check"]
+
+        assert sorted(results) == ["fine", "good"]
+        assert stats["processed"] == 2 and stats["errors"] == 1 and stats["workers"] == 2
+        assert 0.0 <= stats["utilization"] <= 1.0
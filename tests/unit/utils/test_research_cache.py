@@ -0,0 +1,102 @@
+"""
+Unit tests for the research cache serving repeated and paraphrased queries.
+"""
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from gpt_researcher import GPTResearcher
+from gpt_researcher.utils.research_cache import ResearchCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = ResearchCache(str(tmp_path / "research.db"), ttl=60, max_entries=2)
+    yield cache
+    cache.close()
+
+
+class TestResearchCache:
+    """Test suite for looking up research by query similarity and serving it to researchers."""
+
+    def test_lookup_by_similarity_fingerprint_and_age(self, cache):
+        cache.store("fp", "solar power", [1.0, 0.0], {"context": "solar"})
+        cache.store("fp", "wind power", [0.0, 1.0], {"context": "wind"})
+
+        hit = cache.lookup("fp", [0.99, 0.05], threshold=0.95)
+        assert hit["query"] == "solar power" and hit["research"] == {"context": "solar"}
+        assert hit["similarity"] > 0.95
+        # Too dissimilar, or researched with other parameters
+        assert cache.lookup("fp", [0.7, 0.7], threshold=0.95) is None
+        assert cache.lookup("other", [1.0, 0.0], threshold=0.95) is None
+
+        # The least recently used entry is evicted
+        cache.store("fp", "tidal power", [0.6, 0.8], {"context": "tidal"})
+        assert len(cache) == 2
+        assert cache.lookup("fp", [0.0, 1.0], threshold=0.95) is None
+
+        cache.ttl = 0
+        assert cache.lookup("fp", [1.0, 0.0], threshold=0.95) is None
+        assert len(cache) == 0
+        assert cache.stats.summary()["research"]["hit"] == 1
+
+    @pytest.mark.asyncio
+    async def test_researcher_serves_cached_research(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("RESEARCH_CACHE", "true")
+        embeddings = Mock(aembed_query=AsyncMock(return_value=[1.0, 0.0, 0.0]))
+
+        async def research(self, on_progress=None):
+            self.context = ["Solar capacity doubled. Source: https://example.com/solar"]
+            self.visited_urls = {"https://example.com/solar"}
+            self.agent, self.role = self.agent or "Energy Agent", self.role or "chosen role"
+            return self.context
+
+        with patch.object(GPTResearcher, "_conduct_research", autospec=True, side_effect=research) as conduct:
+            first = GPTResearcher(query="How fast is solar power growing?", report_source="web")
+            first.memory = Mock(get_embeddings=Mock(return_value=embeddings))
+            await first.conduct_research()
+
+            second = GPTResearcher(query="How quickly is solar power growing?", report_source="web")
+            second.memory = first.memory
+            context = await second.conduct_research()
+
+            third = GPTResearcher(query="How quickly is solar power growing?", report_source="web")
+            third.memory = first.memory
+            await third.conduct_research(bypass_cache=True)
+
+        assert conduct.call_count == 2
+        assert context == first.context
+        assert second.get_source_urls() == ["https://example.com/solar"]
+        assert second.get_research_cache_stats()["research"]["hit"] >= 1
+
+    @pytest.mark.asyncio
+    async def test_incomplete_research_is_not_cached(self, monkeypatch):
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("RESEARCH_CACHE", "true")
+        memory = Mock(get_embeddings=Mock(return_value=Mock(aembed_query=AsyncMock(return_value=[0.0, 1.0]))))
+
+        async def research(self, on_progress=None):
+            self.context = ["Wind capacity grew. Source: https://example.com/wind"]
+            self.agent, self.role = self.agent or "Energy Agent", self.role or "chosen role"
+            return self.context
+
+        with patch.object(GPTResearcher, "_conduct_research", autospec=True, side_effect=research) as conduct:
+            # Research the budget cut short is not served to later runs
+            cut_short = GPTResearcher(query="Wind power growth", report_source="web")
+            cut_short.memory = memory
+            cut_short.run_controller.record_drop("sub-queries", 2)
+            await cut_short.conduct_research()
+            assert len(cut_short.research_cache) == 0
+
+            complete = GPTResearcher(query="Wind power growth", report_source="web")
+            complete.memory = memory
+            await complete.conduct_research()
+
+            # A caller-given role is part of the fingerprint, so it gets its own research
+            given_role = GPTResearcher(query="Wind power growth", report_source="web", agent="Critic", role="sceptic")
+            given_role.memory = memory
+            await given_role.conduct_research()
+
+        assert conduct.call_count == 3
+        assert (given_role.agent, given_role.role) == ("Critic", "sceptic")